@@ -0,0 +1,120 @@
+"""
+Benchmark for PDF rendering with TemplateManager.
+
+Compares rendering every record with freshly built WeasyPrint objects (the CSS
+parsed and the fonts resolved once per record) against TemplateManager.to_pdf,
+which compiles the stylesheet of each template once and shares a single
+FontConfiguration across the whole batch.
+
+Usage:
+    python benchmarks/bench_pdf_rendering.py --records 200
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from weasyprint import CSS, HTML
+
+from quipus import Template, TemplateManager
+
+HTML_TEMPLATE = """
+<html>
+  <body>
+    <div class="certificate">
+      <h1>Certificate of completion</h1>
+      <p class="name">{name}</p>
+      <p>has completed the course <strong>{course}</strong> on {date}.</p>
+    </div>
+  </body>
+</html>
+"""
+
+CSS_TEMPLATE = """
+@page { size: A4 landscape; margin: 2cm; }
+body { font-family: serif; }
+.certificate { border: 4px double #333; padding: 2cm; text-align: center; }
+.name { font-size: 32pt; font-weight: bold; }
+"""
+CSS_TEMPLATE += "\n".join(f".rule-{i} {{ margin: {i}px; }}" for i in range(500))
+
+
+def build_template(directory: Path) -> Template:
+    """
+    Write the benchmark template to 'directory' and return it.
+    """
+    html_path = directory / "template.html"
+    css_path = directory / "template.css"
+    html_path.write_text(HTML_TEMPLATE)
+    css_path.write_text(CSS_TEMPLATE)
+    return Template(html_path=str(html_path), css_path=str(css_path))
+
+
+def build_records(count: int) -> list[dict[str, str]]:
+    """
+    Build 'count' fake records.
+    """
+    return [
+        {"name": f"Person {i}", "course": "Python 101", "date": "2024-10-01"}
+        for i in range(count)
+    ]
+
+
+def render_uncached(template: Template, records: list[dict], output: Path) -> None:
+    """
+    Render every record building its WeasyPrint objects from scratch.
+    """
+    for item in records:
+        HTML(
+            string=template.render_html_with_values(item),
+            base_url=template.html_path,
+        ).write_pdf(
+            target=output / f"{item['name']}.pdf",
+            stylesheets=[CSS(filename=template.css_path)],
+        )
+
+
+def render_cached(template: Template, records: list[dict], output: Path) -> None:
+    """
+    Render every record with TemplateManager.to_pdf.
+    """
+    manager = (
+        TemplateManager()
+        .with_template(template)
+        .decide_filename_with(lambda item: item["name"])
+    )
+    manager.data = records
+    manager.to_pdf(str(output))
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the timings.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100)
+    args = parser.parse_args()
+
+    records = build_records(args.records)
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        template = build_template(root)
+        timings = {}
+
+        for name, func in [("uncached", render_uncached), ("cached", render_cached)]:
+            output = root / name
+            output.mkdir()
+            start = time.perf_counter()
+            func(template, records, output)
+            timings[name] = time.perf_counter() - start
+
+    for name, elapsed in timings.items():
+        rate = args.records / elapsed
+        print(f"{name:>10}: {elapsed:8.3f}s ({rate:8.1f} records/s)")
+    print(f"{'speedup':>10}: {timings['uncached'] / timings['cached']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Benchmark for SFTP transfer throughput with SFTPDelivery.
+
+Starts a local SSH server with an SFTP subsystem (built on paramiko) behind a
+proxy that delays every chunk of traffic by half the round trip time in each
+direction, and uploads and downloads a file with several SFTPTransferConfig
+settings:
+
+- serial: every write waits for the server to acknowledge the previous one and
+  reads are not prefetched, so each 32 KB costs a full round trip.
+- default: pipelined writes and prefetched reads with paramiko's window size.
+- tuned: pipelined writes, prefetched reads, larger chunks and a 64 MB window.
+
+Usage:
+    python benchmarks/bench_sftp_throughput.py --size-mb 8 --latency-ms 50
+"""
+
+import argparse
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import paramiko
+from paramiko import SFTPAttributes, SFTPHandle, SFTPServer, SFTPServerInterface
+
+from quipus import SFTPDelivery, SFTPTransferConfig
+
+USERNAME = "bench"
+PASSWORD = "bench"
+
+CONFIGS = {
+    "serial": SFTPTransferConfig(pipelined=False, prefetch=False),
+    "default": SFTPTransferConfig(),
+    "tuned": SFTPTransferConfig(
+        chunk_size=1024 * 1024, window_size=64 * 1024 * 1024, max_packet_size=2**15
+    ),
+}
+
+
+class StandInServer(paramiko.ServerInterface):
+    """
+    SSH server that accepts the benchmark credentials and SFTP sessions.
+    """
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_auth_password(self, username: str, password: str) -> int:
+        if (username, password) == (USERNAME, PASSWORD):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class LocalHandle(SFTPHandle):
+    """
+    Handle of a file of the stand-in SFTP server.
+    """
+
+    def __init__(self, file_obj, flags: int = 0):
+        super().__init__(flags)
+        self.readfile = self.writefile = file_obj
+
+    def stat(self) -> SFTPAttributes:
+        return SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+
+
+class LocalSFTPServer(SFTPServerInterface):
+    """
+    SFTP server that serves a local directory.
+    """
+
+    root = ""
+
+    def _local_path(self, path: str) -> str:
+        return os.path.join(self.root, self.canonicalize(path).lstrip("/"))
+
+    def open(self, path: str, flags: int, attr: SFTPAttributes):
+        try:
+            fd = os.open(self._local_path(path), flags, 0o644)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+
+        return LocalHandle(os.fdopen(fd, mode), flags)
+
+    def stat(self, path: str):
+        try:
+            return SFTPAttributes.from_stat(os.stat(self._local_path(path)))
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+    def chattr(self, path: str, attr: SFTPAttributes) -> int:
+        try:
+            SFTPServer.set_file_attr(self._local_path(path), attr)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+
+def listen() -> socket.socket:
+    """
+    Open a listening socket on a free local port.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    return sock
+
+
+def serve_sftp(sock: socket.socket, host_key: paramiko.PKey) -> None:
+    """
+    Accept SSH connections on 'sock' and serve SFTP over them.
+    """
+    while True:
+        conn, _ = sock.accept()
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(host_key)
+        transport.set_subsystem_handler("sftp", SFTPServer, LocalSFTPServer)
+        transport.start_server(server=StandInServer())
+
+
+def pump(source: socket.socket, target: socket.socket, delay: float) -> None:
+    """
+    Forward the traffic of 'source' to 'target', delivering every chunk 'delay'
+    seconds after it was received. Chunks are delayed, not serialized, so the
+    bandwidth of the link is not limited.
+    """
+    chunks: queue.Queue = queue.Queue()
+
+    def deliver() -> None:
+        while (entry := chunks.get()) is not None:
+            due, data = entry
+            time.sleep(max(0.0, due - time.monotonic()))
+            try:
+                target.sendall(data)
+            except OSError:
+                return
+        try:
+            target.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+    threading.Thread(target=deliver, daemon=True).start()
+    try:
+        while data := source.recv(65536):
+            chunks.put((time.monotonic() + delay, data))
+    except OSError:
+        pass
+    chunks.put(None)
+
+
+def serve_proxy(sock: socket.socket, server_port: int, latency: float) -> None:
+    """
+    Accept connections on 'sock' and forward them to the SFTP server with
+    'latency' seconds of round trip time.
+    """
+    while True:
+        client, _ = sock.accept()
+        server = socket.create_connection(("127.0.0.1", server_port))
+        for source, target in [(client, server), (server, client)]:
+            threading.Thread(
+                target=pump, args=(source, target, latency / 2), daemon=True
+            ).start()
+
+
+def start_stand_in(root: Path, latency: float) -> int:
+    """
+    Start the SFTP server serving 'root' and the proxy in front of it, and return
+    the port of the proxy.
+    """
+    LocalSFTPServer.root = str(root)
+    server_sock = listen()
+    proxy_sock = listen()
+    host_key = paramiko.RSAKey.generate(2048)
+
+    threading.Thread(
+        target=serve_sftp, args=(server_sock, host_key), daemon=True
+    ).start()
+    threading.Thread(
+        target=serve_proxy,
+        args=(proxy_sock, server_sock.getsockname()[1], latency),
+        daemon=True,
+    ).start()
+    return proxy_sock.getsockname()[1]
+
+
+def measure(port: int, config: SFTPTransferConfig, local: Path, output: Path):
+    """
+    Upload and download 'local' with 'config' and return the elapsed seconds of
+    each transfer.
+    """
+    with SFTPDelivery(
+        host="127.0.0.1",
+        port=port,
+        username=USERNAME,
+        password=PASSWORD,
+        transfer_config=config,
+    ) as sftp:
+        start = time.perf_counter()
+        sftp.upload_file(str(local), "/upload.bin")
+        upload = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sftp.download_file("/upload.bin", str(output))
+        download = time.perf_counter() - start
+
+    if output.read_bytes() != local.read_bytes():
+        raise RuntimeError("The downloaded file differs from the uploaded one.")
+
+    return upload, download
+
+
+def main() -> None:
+    """
+    Run the benchmark and print the throughput of every configuration.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--configs", nargs="+", choices=CONFIGS, default=list(CONFIGS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        remote = root / "remote"
+        remote.mkdir()
+        local = root / "local.bin"
+        local.write_bytes(os.urandom(args.size_mb * 1024 * 1024))
+
+        port = start_stand_in(remote, args.latency_ms / 1000)
+        print(f"{args.size_mb} MB file, {args.latency_ms:g} ms round trip time")
+
+        for name in args.configs:
+            upload, download = measure(port, CONFIGS[name], local, root / name)
+            print(
+                f"{name:>10}: upload {args.size_mb / upload:8.2f} MB/s, "
+                f"download {args.size_mb / download:8.2f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,19 +8,29 @@ Classes:
     CSVDataSource: Loads data from CSV files.
     DataFrameDataSource: Loads data from pandas DataFrames.
     PostgreSQLDataSource: Loads data from PostgreSQL databases.
+    AsyncPostgreSQLDataSource: Loads data from PostgreSQL databases with asyncio.
     XLSXDataSource: Loads data from XLSX files.
     Certificate: Represents a certificate entity.
     CertificateFactory: Provides methods for creating certificates.
     Template: Manages HTML templates with associated CSS and assets.
     EmailMessageBuilder: Helps in constructing email messages.
+    LazyFileAttachment: Email attachment read from disk only when it is sent.
     EmailSender: Sends emails via an SMTP server.
+    AsyncEmailSender: Sends emails via an SMTP server without blocking the event loop.
     S3Delivery: Uploads files to Amazon S3.
+    UploadResult: Outcome of uploading a single file in a batch.
     SFTPDelivery: Transfers files via SFTP.
+    SFTPTransferConfig: Configures the buffer sizes and pipelining of SFTP transfers.
+    SFTPUploadResult: Outcome of uploading a single file over SFTP in a batch.
     SMTPConfig: Configures the SMTP server for sending emails.
     TemplateManager: Manages document templates and integrates them with data sources.
+    MailMerge: Renders records to PDF in memory and emails them in a single pass.
+    RenderResult: Outcome of rendering a single record to PDF.
+    SendResult: Outcome of sending a single email message in a batch.
 """
 
 from .data_sources import (
+    AsyncPostgreSQLDataSource,
     CSVDataSource,
     DataFrameDataSource,
     PostgreSQLDataSource,
@@ -29,27 +39,44 @@ from .data_sources import (
 from .models import Certificate, CertificateFactory, Template
 from .services import (
     EmailMessageBuilder,
+    LazyFileAttachment,
     EmailSender,
+    AsyncEmailSender,
     AWSConfig,
     S3Delivery,
+    UploadResult,
     SFTPDelivery,
+    SFTPTransferConfig,
+    SFTPUploadResult,
     SMTPConfig,
     TemplateManager,
+    MailMerge,
+    RenderResult,
+    SendResult,
 )
 
 __all__ = [
     "CSVDataSource",
     "DataFrameDataSource",
     "PostgreSQLDataSource",
+    "AsyncPostgreSQLDataSource",
     "XLSXDataSource",
     "Certificate",
     "CertificateFactory",
     "Template",
     "EmailMessageBuilder",
+    "LazyFileAttachment",
     "EmailSender",
+    "AsyncEmailSender",
     "AWSConfig",
     "S3Delivery",
+    "UploadResult",
     "SFTPDelivery",
+    "SFTPTransferConfig",
+    "SFTPUploadResult",
     "SMTPConfig",
     "TemplateManager",
+    "MailMerge",
+    "RenderResult",
+    "SendResult",
 ]
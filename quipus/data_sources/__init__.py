@@ -7,9 +7,12 @@ Classes:
     CSVDataSource: Class for loading data from CSV files.
     DataFrameDataSource: Class for loading data from pandas DataFrames.
     PostgreSQLDataSource: Class for loading data from PostgreSQL databases.
+    AsyncPostgreSQLDataSource: Class for loading data from PostgreSQL databases
+        with asyncio.
     XLSXDataSource: Class for loading data from XLSX files.
 """
 
+from .async_postgresql_data_source import AsyncPostgreSQLDataSource
 from .csv_data_source import CSVDataSource
 from .dataframe_data_source import DataFrameDataSource
 from .postgresql_data_source import PostgreSQLDataSource
@@ -20,5 +23,6 @@ __all__ = [
     "CSVDataSource",
     "DataFrameDataSource",
     "PostgreSQLDataSource",
+    "AsyncPostgreSQLDataSource",
     "XLSXDataSource",
 ]
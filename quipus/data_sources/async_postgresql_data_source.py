@@ -0,0 +1,201 @@
+from typing import Any, AsyncIterator, List, Optional, Self
+from uuid import uuid4
+
+from psycopg_pool import AsyncConnectionPool
+
+from .postgresql_connection_settings import PostgreSQLConnectionSettings
+
+
+class AsyncPostgreSQLDataSource(PostgreSQLConnectionSettings):
+    """
+    Asynchronous PostgreSQL DataSource class to manage data retrieval from a
+    PostgreSQL database without blocking the event loop.
+
+    Many concurrent queries can share the same event loop and connection pool. The
+    pool must be opened before running queries, either with 'open' or by using the
+    instance as an async context manager.
+
+    Attributes:
+        host (str): PostgreSQL server host.
+        database (str): Name of the database to connect to.
+        user (str): Username for authentication.
+        password (str): Password for authentication.
+        port (int): PostgreSQL server port.
+        timeout (int): Seconds to wait for a connection from the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        database: str,
+        user: str,
+        password: str,
+        port: int = 5432,
+        pool_size: int = 5,
+        timeout: int = 15,
+    ):
+        super().__init__(host, database, user, password, port, timeout)
+        self.__connection_pool = self.__initialize_pool(pool_size)
+
+    def __initialize_pool(self, pool_size: int) -> AsyncConnectionPool:
+        """
+        Initialize the asynchronous PostgreSQL connection pool, without opening it.
+
+        Args:
+            pool_size (int): Number of connections to keep in the pool.
+
+        Returns:
+            AsyncConnectionPool: Initialized connection pool.
+        """
+        return AsyncConnectionPool(
+            self._get_connection_string(),
+            min_size=1,
+            max_size=pool_size,
+            timeout=self.timeout,
+            open=False,
+        )
+
+    async def open(self) -> None:
+        """
+        Open the connection pool. Must be awaited from the event loop that will
+        run the queries.
+        """
+        await self.__connection_pool.open()
+
+    async def close_pool(self) -> None:
+        """
+        Close the connection pool and release all connections.
+        """
+        if self.__connection_pool:
+            await self.__connection_pool.close()
+
+    async def __aenter__(self) -> Self:
+        """
+        Open the connection pool when entering an async context.
+
+        Returns:
+            Self: AsyncPostgreSQLDataSource instance.
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """
+        Close the connection pool when leaving an async context.
+        """
+        await self.close_pool()
+
+    async def fetch_data(self, query: str) -> tuple[List[Any], List[str]]:
+        """
+        Fetch data from the PostgreSQL database based on the provided query.
+
+        Args:
+            query (str): SQL query to execute.
+
+        Returns:
+            tuple[List[Any], List[str]]: A tuple containing:
+                - List of data rows retrieved from the database.
+                - List of column names corresponding to the data.
+
+        Raises:
+            ValueError: If no query is provided.
+        """
+        if not query:
+            raise ValueError("Query must be provided to fetch data.")
+
+        async with self.__connection_pool.connection() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query)
+                data = await cursor.fetchall()
+                columns = [desc.name for desc in cursor.description]
+                return data, columns
+
+    async def execute_query(self, query: str) -> Optional[tuple[List[Any], List[str]]]:
+        """
+        Execute a custom SQL query.
+
+        Args:
+            query (str): SQL query to execute.
+
+        Returns:
+            Optional[Tuple[List[Any], List[str]]]: A tuple containing:
+                - List of data rows retrieved from the database.
+                - List of column names corresponding to the data.
+                Returns None if no data is returned (e.g., for INSERT, UPDATE, DELETE).
+        """
+        async with self.__connection_pool.connection() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query)
+
+                # Only if the query returns results (e.g., SELECT)
+                if cursor.description:
+                    data = await cursor.fetchall()
+                    columns = [desc.name for desc in cursor.description]
+                    return data, columns
+
+                # For queries like INSERT, UPDATE, DELETE
+                await conn.commit()
+                return None
+
+    async def iter_rows(
+        self, query: str, batch_size: int = 1000
+    ) -> AsyncIterator[tuple[List[Any], List[str]]]:
+        """
+        Stream the result of a query in batches using a server-side cursor.
+
+        Args:
+            query (str): SQL query to execute.
+            batch_size (int): Number of rows fetched from the server at once.
+
+        Yields:
+            tuple[List[Any], List[str]]: A tuple containing:
+                - List of at most 'batch_size' data rows.
+                - List of column names corresponding to the data.
+
+        Raises:
+            ValueError: If no query is provided or 'batch_size' is not positive.
+        """
+        if not query:
+            raise ValueError("Query must be provided to fetch data.")
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("'batch_size' must be a positive integer.")
+
+        async with self.__connection_pool.connection() as conn:
+            async with conn.cursor(name=f"quipus_{uuid4().hex}") as cursor:
+                cursor.itersize = batch_size
+                await cursor.execute(query)
+                columns = [desc.name for desc in cursor.description]
+
+                while rows := await cursor.fetchmany(batch_size):
+                    yield rows, columns
+
+    async def iter_records(
+        self, query: str, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the result of a query as dictionaries keyed by column name.
+
+        Args:
+            query (str): SQL query to execute.
+            batch_size (int): Number of rows fetched from the server at once.
+
+        Yields:
+            dict[str, Any]: A row of the result keyed by column name.
+        """
+        async for rows, columns in self.iter_rows(query, batch_size):
+            for row in rows:
+                yield dict(zip(columns, row))
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the AsyncPostgreSQLDataSource object.
+
+        Returns:
+            str: String representation of the AsyncPostgreSQLDataSource object.
+        """
+        return (
+            f"AsyncPostgreSQLDataSource(host={self.host}, port={self.port}, "
+            f"database={self.database}, user={self.user})"
+        )
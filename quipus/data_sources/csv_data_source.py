@@ -1,33 +1,102 @@
-from typing import Optional, List
+import importlib.util
+import warnings
+from typing import Any, Iterator, Literal, Optional, List
 
 import pandas as pd
 
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 
 class CSVDataSource:
     """
     CSV DataSource class to manage data retrieval from CSV files.
 
+    By default the whole file is loaded when the object is created. In lazy mode
+    nothing is read until the data is requested, and the file can be consumed in
+    chunks through 'iter_chunks' and 'iter_records' without loading it at once.
+
+    With the "pyarrow" engine the file is parsed by pyarrow using multiple threads
+    and the columns are stored with pyarrow-backed dtypes, which use less memory
+    than the default object dtypes. If pyarrow is not installed the default C
+    engine is used instead.
+
     Attributes:
         file_path (str): Path to the CSV file.
         delimiter (str): Delimiter used in the CSV file.
         encoding (str): Encoding of the CSV file.
+        lazy (bool): Defer reading the file until the data is requested.
+        usecols (Optional[List[str]]): Columns to read. All columns if None.
+        dtype (Optional[Any]): Data type for the data or for specific columns.
+        engine (Literal["c", "pyarrow"]): Parser engine used to read the file.
         dataframe (Optional[pd.DataFrame]): Loaded data as a pandas DataFrame.
     """
 
-    def __init__(self, file_path: str, delimiter: str = ",", encoding: str = "utf-8"):
+    def __init__(
+        self,
+        file_path: str,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        lazy: bool = False,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Any] = None,
+        engine: Literal["c", "pyarrow"] = "c",
+    ):
         self.file_path = file_path
         self.delimiter = delimiter
         self.encoding = encoding
+        self.lazy = lazy
+        self.usecols = usecols
+        self.dtype = dtype
+        self.engine = engine
         self.dataframe: Optional[pd.DataFrame] = None
-        self.__load_data()
+        if not self.lazy:
+            self.__load_data()
+
+    def __read_options(self, incremental: bool = False) -> dict[str, Any]:
+        """
+        Get the options passed to pandas when reading the CSV file.
+
+        The pyarrow engine cannot read a file incrementally, so chunked and
+        partial reads use the C engine while keeping the pyarrow-backed dtypes.
+
+        Args:
+            incremental (bool): Whether the options are for a chunked or partial
+                read.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for 'pd.read_csv'.
+        """
+        options = {
+            "delimiter": self.delimiter,
+            "encoding": self.encoding,
+            "usecols": self.usecols,
+            "dtype": self.dtype,
+        }
+
+        if self.engine == "pyarrow":
+            options["dtype_backend"] = "pyarrow"
+            if not incremental:
+                options["engine"] = "pyarrow"
+
+        return options
 
     def __load_data(self) -> None:
         """
         Load data from the CSV file into a pandas DataFrame.
         """
-        self.dataframe = pd.read_csv(
-            self.file_path, delimiter=self.delimiter, encoding=self.encoding
-        )
+        self.dataframe = pd.read_csv(self.file_path, **self.__read_options())
+
+    def __ensure_loaded(self) -> None:
+        """
+        Load the data on first access when in lazy mode.
+
+        Raises:
+            RuntimeError: If no data is loaded and the data source is not lazy.
+        """
+        if self.dataframe is None:
+            if not self.lazy:
+                raise RuntimeError("No data loaded from the CSV file.")
+            self.__load_data()
 
     @property
     def file_path(self) -> str:
@@ -98,6 +167,130 @@ class CSVDataSource:
             raise TypeError("'encoding' must be a string.")
         self.__encoding = encoding
 
+    @property
+    def lazy(self) -> bool:
+        """
+        Get whether reading the file is deferred until the data is requested.
+
+        Returns:
+            bool: True if the data source is lazy.
+        """
+        return self.__lazy
+
+    @lazy.setter
+    def lazy(self, lazy: bool) -> None:
+        """
+        Set whether reading the file is deferred until the data is requested.
+
+        Args:
+            lazy (bool): Defer reading the file.
+
+        Raises:
+            TypeError: If 'lazy' is not a boolean.
+        """
+        if not isinstance(lazy, bool):
+            raise TypeError("'lazy' must be a boolean.")
+        self.__lazy = lazy
+
+    @property
+    def usecols(self) -> Optional[List[str]]:
+        """
+        Get the columns to read from the CSV file.
+
+        Returns:
+            Optional[List[str]]: Columns to read, or None to read all of them.
+        """
+        return self.__usecols
+
+    @usecols.setter
+    def usecols(self, usecols: Optional[List[str]]) -> None:
+        """
+        Set the columns to read from the CSV file.
+
+        Args:
+            usecols (Optional[List[str]]): Columns to read, or None to read all.
+
+        Raises:
+            TypeError: If 'usecols' is not a list of strings or None.
+            ValueError: If 'usecols' is an empty list.
+        """
+        if usecols is not None:
+            if not isinstance(usecols, list) or not all(
+                isinstance(column, str) for column in usecols
+            ):
+                raise TypeError("'usecols' must be a list of strings or None.")
+            if not usecols:
+                raise ValueError("'usecols' cannot be an empty list.")
+        self.__usecols = usecols
+
+    @property
+    def dtype(self) -> Optional[Any]:
+        """
+        Get the data type for the data or for specific columns.
+
+        Returns:
+            Optional[Any]: Data type passed to pandas.
+        """
+        return self.__dtype
+
+    @dtype.setter
+    def dtype(self, dtype: Optional[Any]) -> None:
+        """
+        Set the data type for the data or for specific columns.
+
+        Args:
+            dtype (Optional[Any]): A single data type, a dictionary mapping column
+                names to data types, or None to let pandas infer them.
+
+        Raises:
+            TypeError: If 'dtype' is a dictionary with non-string keys.
+        """
+        if isinstance(dtype, dict) and not all(
+            isinstance(column, str) for column in dtype
+        ):
+            raise TypeError("All keys in 'dtype' must be strings.")
+        self.__dtype = dtype
+
+    @property
+    def engine(self) -> Literal["c", "pyarrow"]:
+        """
+        Get the parser engine used to read the CSV file.
+
+        Returns:
+            Literal["c", "pyarrow"]: Parser engine.
+        """
+        return self.__engine
+
+    @engine.setter
+    def engine(self, engine: Literal["c", "pyarrow"]) -> None:
+        """
+        Set the parser engine used to read the CSV file.
+
+        Falls back to the "c" engine with a warning if "pyarrow" is requested but
+        pyarrow is not installed.
+
+        Args:
+            engine (Literal["c", "pyarrow"]): Parser engine.
+
+        Raises:
+            TypeError: If 'engine' is not a string.
+            ValueError: If 'engine' is not 'c' or 'pyarrow'.
+        """
+        if not isinstance(engine, str):
+            raise TypeError("'engine' must be a string.")
+        if engine not in ("c", "pyarrow"):
+            raise ValueError("'engine' must be either 'c' or 'pyarrow'.")
+
+        if engine == "pyarrow" and not _PYARROW_AVAILABLE:
+            warnings.warn(
+                "pyarrow is not installed, falling back to the 'c' engine.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            engine = "c"
+
+        self.__engine = engine
+
     def fetch_data(self) -> pd.DataFrame:
         """
         Fetch all data from the CSV file as a pandas DataFrame.
@@ -105,19 +298,25 @@ class CSVDataSource:
         Returns:
             pd.DataFrame: Data loaded from the CSV file.
         """
-        if self.dataframe is None:
-            raise RuntimeError("No data loaded from the CSV file.")
+        self.__ensure_loaded()
         return self.dataframe
 
     def get_columns(self) -> List[str]:
         """
         Get the list of column names from the CSV data.
 
+        In lazy mode only the header of the file is read.
+
         Returns:
             List[str]: Column names.
         """
-        if self.dataframe is None:
-            raise RuntimeError("No data loaded from the CSV file.")
+        if self.dataframe is None and self.lazy:
+            header = pd.read_csv(
+                self.file_path, nrows=0, **self.__read_options(incremental=True)
+            )
+            return list(header.columns)
+
+        self.__ensure_loaded()
         return list(self.dataframe.columns)
 
     def filter_data(self, query: str) -> pd.DataFrame:
@@ -134,14 +333,58 @@ class CSVDataSource:
             RuntimeError: If no data is loaded.
             ValueError: If the query is invalid.
         """
-        if self.dataframe is None:
-            raise RuntimeError("No data loaded from the CSV file.")
+        self.__ensure_loaded()
 
         try:
             return self.dataframe.query(query)
         except Exception as e:
             raise ValueError(f"Invalid query: {query}") from e
 
+    def iter_chunks(self, chunksize: int = 10_000) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the CSV data in DataFrames of at most 'chunksize' rows.
+
+        If the data is already loaded the chunks are slices of it. Otherwise the
+        file is read incrementally, so only one chunk is kept in memory at a time
+        and the iteration can be stopped early to read just the first rows.
+
+        Args:
+            chunksize (int): Maximum number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: Chunk of the CSV data.
+
+        Raises:
+            ValueError: If 'chunksize' is not a positive integer.
+        """
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError("'chunksize' must be a positive integer.")
+
+        if self.dataframe is not None:
+            for start in range(0, len(self.dataframe), chunksize):
+                yield self.dataframe.iloc[start : start + chunksize]
+            return
+
+        with pd.read_csv(
+            self.file_path,
+            chunksize=chunksize,
+            **self.__read_options(incremental=True),
+        ) as reader:
+            yield from reader
+
+    def iter_records(self, chunksize: int = 10_000) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the rows of the CSV data as dictionaries.
+
+        Args:
+            chunksize (int): Number of rows read from the file at once.
+
+        Yields:
+            dict[str, Any]: A row of the CSV data keyed by column name.
+        """
+        for chunk in self.iter_chunks(chunksize):
+            yield from chunk.to_dict(orient="records")
+
     def __str__(self) -> str:
         """
         Get a string representation of the CSVDataSource object.
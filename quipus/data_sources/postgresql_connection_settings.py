@@ -0,0 +1,210 @@
+class PostgreSQLConnectionSettings:
+    """
+    Connection settings shared by the PostgreSQL data sources, validated when set.
+
+    Attributes:
+        host (str): PostgreSQL server host.
+        database (str): Name of the database to connect to.
+        user (str): Username for authentication.
+        password (str): Password for authentication.
+        port (int): PostgreSQL server port.
+        timeout (int): Timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        database: str,
+        user: str,
+        password: str,
+        port: int = 5432,
+        timeout: int = 15,
+    ):
+        self.host = host
+        self.database = database
+        self.user = user
+        self.password = password
+        self.port = port
+        self.timeout = timeout
+
+    @property
+    def host(self) -> str:
+        """
+        Get the PostgreSQL server host.
+
+        Returns:
+            str: PostgreSQL server host.
+        """
+        return self.__host
+
+    @host.setter
+    def host(self, host: str) -> None:
+        """
+        Set the PostgreSQL server host.
+
+        Args:
+            host (str): PostgreSQL server host.
+
+        Raises:
+            TypeError: If host is not a string.
+            ValueError: If host is an empty string.
+        """
+        if not isinstance(host, str):
+            raise TypeError("'host' must be a string.")
+        if not host.strip():
+            raise ValueError("'host' cannot be an empty string.")
+        self.__host = host
+
+    @property
+    def port(self) -> int:
+        """
+        Get the PostgreSQL server port.
+
+        Returns:
+            int: PostgreSQL server port.
+        """
+        return self.__port
+
+    @port.setter
+    def port(self, port: int) -> None:
+        """
+        Set the PostgreSQL server port.
+
+        Args:
+            port (int): PostgreSQL server port.
+
+        Raises:
+            TypeError: If port is not an integer.
+            ValueError: If port is not between 1 and 65535.
+        """
+        if not isinstance(port, int):
+            raise TypeError("'port' must be an integer.")
+        if port not in range(1, 65536):
+            raise ValueError("'port' must be between 1 and 65535.")
+        self.__port = port
+
+    @property
+    def user(self) -> str:
+        """
+        Get the username for authentication.
+
+        Returns:
+            str: Username for authentication.
+        """
+        return self.__user
+
+    @user.setter
+    def user(self, user: str) -> None:
+        """
+        Set the username for authentication.
+
+        Args:
+            user (str): Username for authentication.
+
+        Raises:
+            TypeError: If user is not a string.
+            ValueError: If user is an empty string.
+        """
+        if not isinstance(user, str):
+            raise TypeError("'user' must be a string.")
+        if not user.strip():
+            raise ValueError("'user' cannot be an empty string.")
+        self.__user = user
+
+    @property
+    def password(self) -> str:
+        """
+        Get the password for authentication.
+
+        Returns:
+            str: Password for authentication.
+        """
+        return self.__password
+
+    @password.setter
+    def password(self, password: str) -> None:
+        """
+        Set the password for authentication.
+
+        Args:
+            password (str): Password for authentication.
+
+        Raises:
+            TypeError: If password is not a string.
+            ValueError: If password is an empty string.
+        """
+        if not isinstance(password, str):
+            raise TypeError("'password' must be a string.")
+        if not password.strip():
+            raise ValueError("'password' cannot be an empty string.")
+        self.__password = password
+
+    @property
+    def database(self) -> str:
+        """
+        Get the name of the database to connect to.
+
+        Returns:
+            str: Name of the database to connect to.
+        """
+        return self.__database
+
+    @database.setter
+    def database(self, database: str) -> None:
+        """
+        Set the name of the database to connect to.
+
+        Args:
+            database (str): Name of the database to connect to.
+
+        Raises:
+            TypeError: If database is not a string.
+            ValueError: If database is an empty string.
+        """
+        if not isinstance(database, str):
+            raise TypeError("'database' must be a string.")
+        if not database.strip():
+            raise ValueError("'database' cannot be an empty string.")
+        self.__database = database
+
+    @property
+    def timeout(self) -> int:
+        """
+        Get the timeout in seconds.
+
+        Returns:
+            int: Timeout in seconds.
+        """
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, timeout: int) -> None:
+        """
+        Set the timeout in seconds.
+
+        Args:
+            timeout (int): Timeout in seconds.
+
+        Raises:
+            TypeError: If timeout is not an integer.
+            ValueError: If timeout is not between 0 and 3600 seconds.
+        """
+        if not isinstance(timeout, int):
+            raise TypeError("'timeout' must be an integer.")
+
+        if timeout < 0 or timeout > 3600:
+            raise ValueError("'timeout' must be between 0 and 3600 seconds.")
+
+        self.__timeout = timeout
+
+    def _get_connection_string(self) -> str:
+        """
+        Get the libpq connection string of the settings.
+
+        Returns:
+            str: Connection string.
+        """
+        return (
+            f"dbname={self.database} user={self.user} password={self.password} "
+            f"host={self.host} port={self.port}"
+        )
@@ -1,9 +1,15 @@
-from typing import Optional, List, Any
+from io import BytesIO
+from typing import Iterator, Literal, Optional, List, Any
+from uuid import uuid4
 
+import pandas as pd
+from psycopg import sql
 from psycopg_pool import ConnectionPool
 
+from .postgresql_connection_settings import PostgreSQLConnectionSettings
 
-class PostgreSQLDataSource:
+
+class PostgreSQLDataSource(PostgreSQLConnectionSettings):
     """
     PostgreSQL DataSource class to manage data retrieval from a PostgreSQL database.
 
@@ -28,12 +34,7 @@ class PostgreSQLDataSource:
         pool_size: int = 5,
         timeout: int = 15,
     ):
-        self.__host = host
-        self.__database = database
-        self.__user = user
-        self.__password = password
-        self.__port = port
-        self.__timeout = timeout
+        super().__init__(host, database, user, password, port, timeout)
         self.__connection_pool = self.__initialize_pool(pool_size)
 
     def __initialize_pool(self, pool_size: int) -> ConnectionPool:
@@ -46,217 +47,213 @@ class PostgreSQLDataSource:
         Returns:
             ConnectionPool: Initialized connection pool.
         """
-        connection_string = (
-            f"dbname={self.database} user={self.user} password={self.password} "
-            f"host={self.host} port={self.port}"
-        )
         return ConnectionPool(
-            connection_string,
+            self._get_connection_string(),
             min_size=1,
             max_size=pool_size,
         )
 
-    @property
-    def host(self) -> str:
+    def close_pool(self) -> None:
         """
-        Get the PostgreSQL server host.
-
-        Returns:
-            str: PostgreSQL server host.
+        Close the connection pool and release all connections.
         """
-        return self.__host
+        if self.__connection_pool:
+            self.__connection_pool.close()
 
-    @host.setter
-    def host(self, host: str) -> None:
+    def fetch_data(self, query: str) -> tuple[List[Any], List[str]]:
         """
-        Set the PostgreSQL server host.
+        Fetch data from the PostgreSQL database based on the provided query.
 
         Args:
-            host (str): PostgreSQL server host.
+            query (str): SQL query to execute.
+
+        Returns:
+            tuple[List[Any], List[str]]: A tuple containing:
+                - List of data rows retrieved from the database.
+                - List of column names corresponding to the data.
 
         Raises:
-            TypeError: If host is not a string.
-            ValueError: If host is an empty string.
-        """
-        if not isinstance(host, str):
-            raise TypeError("'host' must be a string.")
-        if not host.strip():
-            raise ValueError("'host' cannot be an empty string.")
-        self.__host = host
-
-    @property
-    def port(self) -> int:
+            ValueError: If no query is provided.
+            RuntimeError: If an error occurs during query execution.
         """
-        Get the PostgreSQL server port.
+        if not query:
+            raise ValueError("Query must be provided to fetch data.")
 
-        Returns:
-            int: PostgreSQL server port.
-        """
-        return self.__port
+        with self.__connection_pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                data = cursor.fetchall()
+                columns = [desc.name for desc in cursor.description]
+                return data, columns
 
-    @port.setter
-    def port(self, port: int) -> None:
+    def iter_rows(
+        self, query: str, batch_size: int = 1000
+    ) -> Iterator[tuple[List[Any], List[str]]]:
         """
-        Set the PostgreSQL server port.
+        Stream the result of a query in batches using a server-side cursor.
+
+        The rows are kept on the server and transferred 'batch_size' at a time, so
+        the memory used by the client is bounded by the batch size regardless of
+        the size of the result set. The connection stays checked out of the pool
+        until the iteration finishes or the generator is closed.
 
         Args:
-            port (int): PostgreSQL server port.
+            query (str): SQL query to execute.
+            batch_size (int): Number of rows fetched from the server at once.
+
+        Yields:
+            tuple[List[Any], List[str]]: A tuple containing:
+                - List of at most 'batch_size' data rows.
+                - List of column names corresponding to the data.
 
         Raises:
-            TypeError: If port is not an integer.
-            ValueError: If port is not between 1 and 65535.
+            ValueError: If no query is provided or 'batch_size' is not positive.
         """
-        if not isinstance(port, int):
-            raise TypeError("'port' must be an integer.")
-        if port not in range(1, 65536):
-            raise ValueError("'port' must be between 1 and 65535.")
-        self.__port = port
-
-    @property
-    def user(self) -> str:
-        """
-        Get the username for authentication.
+        if not query:
+            raise ValueError("Query must be provided to fetch data.")
 
-        Returns:
-            str: Username for authentication.
-        """
-        return self.__user
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("'batch_size' must be a positive integer.")
+
+        with self.__connection_pool.connection() as conn:
+            with conn.cursor(name=f"quipus_{uuid4().hex}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query)
+                columns = [desc.name for desc in cursor.description]
 
-    @user.setter
-    def user(self, user: str) -> None:
+                while rows := cursor.fetchmany(batch_size):
+                    yield rows, columns
+
+    def iter_records(
+        self, query: str, batch_size: int = 1000
+    ) -> Iterator[dict[str, Any]]:
         """
-        Set the username for authentication.
+        Stream the result of a query as dictionaries keyed by column name, ready
+        to be fed to 'TemplateManager.data'.
 
         Args:
-            user (str): Username for authentication.
+            query (str): SQL query to execute.
+            batch_size (int): Number of rows fetched from the server at once.
 
-        Raises:
-            TypeError: If user is not a string.
-            ValueError: If user is an empty string.
+        Yields:
+            dict[str, Any]: A row of the result keyed by column name.
         """
-        if not isinstance(user, str):
-            raise TypeError("'user' must be a string.")
-        if not user.strip():
-            raise ValueError("'user' cannot be an empty string.")
-        self.__user = user
-
-    @property
-    def password(self) -> str:
-        """
-        Get the password for authentication.
+        for rows, columns in self.iter_rows(query, batch_size):
+            for row in rows:
+                yield dict(zip(columns, row))
 
-        Returns:
-            str: Password for authentication.
+    def copy_to_dataframe(
+        self, query: str, copy_format: Literal["csv", "binary"] = "csv"
+    ) -> pd.DataFrame:
         """
-        return self.__password
+        Fetch the result of a query into a DataFrame using the COPY protocol.
 
-    @password.setter
-    def password(self, password: str) -> None:
-        """
-        Set the password for authentication.
+        COPY streams the whole result set in a single operation, which is much
+        faster than fetching rows through a regular cursor for bulk reads. With
+        the "csv" format the data is parsed by pandas and the column types are
+        inferred from the text. With the "binary" format the values are decoded
+        by psycopg using the column types reported by the server. The result can
+        be wrapped in a 'DataFrameDataSource'.
 
         Args:
-            password (str): Password for authentication.
-
-        Raises:
-            TypeError: If password is not a string.
-            ValueError: If password is an empty string.
-        """
-        if not isinstance(password, str):
-            raise TypeError("'password' must be a string.")
-        if not password.strip():
-            raise ValueError("'password' cannot be an empty string.")
-        self.__password = password
-
-    @property
-    def database(self) -> str:
-        """
-        Get the name of the database to connect to.
+            query (str): SQL query whose result is exported.
+            copy_format (Literal["csv", "binary"]): Format used by COPY.
 
         Returns:
-            str: Name of the database to connect to.
-        """
-        return self.__database
+            pd.DataFrame: Result of the query.
 
-    @database.setter
-    def database(self, database: str) -> None:
+        Raises:
+            ValueError: If no query is provided or the format is not supported.
         """
-        Set the name of the database to connect to.
+        if copy_format not in ("csv", "binary"):
+            raise ValueError("'copy_format' must be either 'csv' or 'binary'.")
 
-        Args:
-            database (str): Name of the database to connect to.
+        if copy_format == "binary":
+            chunks = list(self.copy_iter(query, batch_size=None))
+            return chunks[0] if len(chunks) == 1 else pd.concat(chunks)
 
-        Raises:
-            TypeError: If database is not a string.
-            ValueError: If database is an empty string.
-        """
-        if not isinstance(database, str):
-            raise TypeError("'database' must be a string.")
-        if not database.strip():
-            raise ValueError("'database' cannot be an empty string.")
-        self.__database = database
-
-    @property
-    def timeout(self) -> int:
-        """
-        Get the query execution timeout in seconds.
+        statement = self.__copy_statement(query, "(FORMAT CSV, HEADER)")
+        buffer = BytesIO()
 
-        Returns:
-            int: Query execution timeout in seconds."""
-        return self.__timeout
+        with self.__connection_pool.connection() as conn:
+            with conn.cursor() as cursor:
+                with cursor.copy(statement) as copy:
+                    for block in copy:
+                        buffer.write(block)
+
+        buffer.seek(0)
+        return pd.read_csv(buffer)
 
-    @timeout.setter
-    def timeout(self, timeout: int) -> None:
+    def copy_iter(
+        self, query: str, batch_size: Optional[int] = 10_000
+    ) -> Iterator[pd.DataFrame]:
         """
-        Set the query execution timeout in seconds.
+        Stream the result of a query in DataFrames using the binary COPY protocol.
+
+        The column types are resolved with an empty execution of the query so that
+        psycopg can decode the binary rows directly into Python values.
 
         Args:
-            timeout (int): Query execution timeout in seconds.
+            query (str): SQL query whose result is exported.
+            batch_size (Optional[int]): Maximum number of rows per DataFrame. All
+                the rows are returned in a single DataFrame if None.
+
+        Yields:
+            pd.DataFrame: Batch of the query result.
 
         Raises:
-            TypeError: If timeout is not an integer.
-            ValueError: If timeout is not between 0 and 3600 seconds.
+            ValueError: If no query is provided or 'batch_size' is not positive.
         """
-        if not isinstance(timeout, int):
-            raise TypeError("'timeout' must be an integer.")
-
-        if timeout < 0 or timeout > 3600:
-            raise ValueError("'timeout' must be between 0 and 3600 seconds.")
+        if batch_size is not None and (
+            not isinstance(batch_size, int) or batch_size < 1
+        ):
+            raise ValueError("'batch_size' must be a positive integer or None.")
 
-        self.__timeout = timeout
+        statement = self.__copy_statement(query, "(FORMAT BINARY)")
 
-    def close_pool(self) -> None:
-        """
-        Close the connection pool and release all connections.
-        """
-        if self.__connection_pool:
-            self.__connection_pool.close()
+        with self.__connection_pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("SELECT * FROM ({}) AS copy_source LIMIT 0").format(
+                        sql.SQL(self.__strip_query(query))
+                    )
+                )
+                columns = [desc.name for desc in cursor.description]
+                types = [desc.type_code for desc in cursor.description]
 
-    def fetch_data(self, query: str) -> tuple[List[Any], List[str]]:
-        """
-        Fetch data from the PostgreSQL database based on the provided query.
+                with cursor.copy(statement) as copy:
+                    copy.set_types(types)
+                    rows = []
+                    for row in copy.rows():
+                        rows.append(row)
+                        if len(rows) == batch_size:
+                            yield pd.DataFrame(rows, columns=columns)
+                            rows = []
 
-        Args:
-            query (str): SQL query to execute.
+                    if rows or batch_size is None:
+                        yield pd.DataFrame(rows, columns=columns)
 
-        Returns:
-            tuple[List[Any], List[str]]: A tuple containing:
-                - List of data rows retrieved from the database.
-                - List of column names corresponding to the data.
+    @staticmethod
+    def __strip_query(query: str) -> str:
+        """
+        Remove the surrounding whitespace and trailing semicolons of a query so it
+        can be embedded in another statement.
 
         Raises:
             ValueError: If no query is provided.
-            RuntimeError: If an error occurs during query execution.
         """
-        if not query:
+        if not query or not query.strip().rstrip(";"):
             raise ValueError("Query must be provided to fetch data.")
 
-        with self.__connection_pool.connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query)
-                data = cursor.fetchall()
-                columns = [desc.name for desc in cursor.description]
-                return data, columns
+        return query.strip().rstrip(";")
+
+    def __copy_statement(self, query: str, options: str) -> sql.Composed:
+        """
+        Build a COPY ... TO STDOUT statement for a query.
+        """
+        return sql.SQL("COPY ({}) TO STDOUT {}").format(
+            sql.SQL(self.__strip_query(query)), sql.SQL(options)
+        )
 
     def execute_query(self, query: str) -> Optional[tuple[List[Any], List[str]]]:
         """
@@ -1,15 +1,29 @@
+import mimetypes
 import os
+from string import Formatter
 from typing import Any, Optional, Self
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from weasyprint import default_url_fetcher
+
+from ..utils import FileCache
 
 
 class Template:
     """
     Class that represents an HTML template with its associated paths for CSS and assets.
 
+    The HTML content is loaded once and kept in memory. It is only read again from
+    disk when the modification time or the size of the file change. Files under
+    'assets_path' are served to WeasyPrint from an in-memory cache through
+    'url_fetcher'.
+
     Attributes:
         html_path (str): Path to the HTML file.
         css_path (str): Path to the CSS file.
         assets_path (str): Path to the assets folder.
+        assets_cache (FileCache): Cache of the files read from the assets folder.
     """
 
     def __init__(
@@ -17,6 +31,7 @@ class Template:
         html_path: str,
         css_path: Optional[str] = None,
         assets_path: Optional[str] = None,
+        assets_cache_size: int = 32 * 1024 * 1024,
     ):
         """
         Initializes an instance of the Template class.
@@ -25,10 +40,13 @@ class Template:
             html_path (str): Path to the HTML file.
             css_path (Optional[str]): Path to the CSS file.
             assets_path (Optional[str]): Path to the assets folder.
+            assets_cache_size (int): Maximum size, in bytes, of the assets kept in
+                memory.
         """
         self.html_path = html_path
         self.css_path = css_path
         self.assets_path = assets_path
+        self.__assets_cache = FileCache(max_size=assets_cache_size)
 
     @classmethod
     def from_template_path(cls, template_path: str) -> Self:
@@ -100,6 +118,7 @@ class Template:
             raise FileNotFoundError(f"'{value}' file does not exist.")
 
         self.__html_path = value
+        self.__html_cache = None
 
     @property
     def css_path(self) -> Optional[str]:
@@ -183,6 +202,98 @@ class Template:
 
         self.__assets_path = value
 
+    @property
+    def placeholders(self) -> list[str]:
+        """
+        Get the names of the placeholders used in the HTML template.
+
+        Returns:
+            list[str]: Placeholder names, in order of first appearance.
+        """
+        _, placeholders = self.__load_html()
+        return list(placeholders)
+
+    def __load_html(self) -> tuple[str, list[str]]:
+        """
+        Load the HTML file and extract its placeholders, unless the cached content
+        is still up to date with the file on disk.
+
+        Returns:
+            tuple[str, list[str]]: The content of the HTML file and the names of
+                its placeholders.
+        """
+        stat = os.stat(self.html_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        if self.__html_cache is None or self.__html_cache[0] != signature:
+            with open(self.html_path) as html:
+                content = html.read()
+
+            placeholders = []
+            for _, field_name, _, _ in Formatter().parse(content):
+                if field_name:
+                    name = field_name.split(".")[0].split("[")[0]
+                    if name not in placeholders:
+                        placeholders.append(name)
+
+            self.__html_cache = (signature, content, placeholders)
+
+        return self.__html_cache[1], self.__html_cache[2]
+
+    @property
+    def assets_cache(self) -> FileCache:
+        """
+        Get the cache of the files read from the assets folder.
+
+        Returns:
+            FileCache: Cache of the assets.
+        """
+        return self.__assets_cache
+
+    def url_fetcher(self, url: str, timeout: int = 10, ssl_context: Any = None) -> dict:
+        """
+        Fetch a resource for WeasyPrint, serving the files under 'assets_path' from
+        memory. Any other URL is delegated to WeasyPrint's default fetcher.
+
+        Args:
+            url (str): URL of the resource.
+            timeout (int): Timeout, in seconds, for remote resources.
+            ssl_context (Any): SSL context used for remote resources.
+
+        Returns:
+            dict: Resource in the format expected by WeasyPrint.
+        """
+        if self.assets_path is not None and url.startswith("file:"):
+            path = os.path.realpath(url2pathname(urlparse(url).path))
+            assets_path = os.path.realpath(self.assets_path)
+
+            if path.startswith(assets_path + os.sep) and os.path.isfile(path):
+                content, mime_type = self.assets_cache.get(path, self.__read_asset)
+                return {
+                    "string": content,
+                    "mime_type": mime_type,
+                    "redirected_url": url,
+                }
+
+        return default_url_fetcher(url, timeout=timeout, ssl_context=ssl_context)
+
+    @staticmethod
+    def __read_asset(path: str) -> tuple[tuple[bytes, Optional[str]], int]:
+        """
+        Read an asset from disk along with its MIME type.
+
+        Args:
+            path (str): Path to the asset.
+
+        Returns:
+            tuple[tuple[bytes, Optional[str]], int]: The content and MIME type of
+                the asset, and the size of the content in bytes.
+        """
+        with open(path, "rb") as asset:
+            content = asset.read()
+
+        return (content, mimetypes.guess_type(path)[0]), len(content)
+
     def render_html(self) -> str:
         """
         Renders the template by reading the content of the HTML file.
@@ -190,8 +301,8 @@ class Template:
         Returns:
             str: The content of the HTML file.
         """
-        with open(self.html_path) as html:
-            return html.read()
+        content, _ = self.__load_html()
+        return content
 
     def render_html_with_values(self, values: dict[str, Any]):
         """
@@ -222,7 +333,8 @@ class Template:
         if not all(isinstance(k, str) for k in values.keys()):
             raise TypeError("All keys in the dictionary must be a string.")
 
-        return self.render_html().format(**values)
+        content, _ = self.__load_html()
+        return content.format(**values)
 
     def render_css(self) -> str:
         """
@@ -6,25 +6,50 @@ based on different data sources.
 
 Classes:
     EmailMessageBuilder: Helps in constructing email messages.
+    LazyFileAttachment: Email attachment read from disk only when it is sent.
     EmailSender: Sends emails via an SMTP server.
+    AsyncEmailSender: Sends emails via an SMTP server without blocking the event loop.
     AWSConfig: Configures the AWS credentials and region.
     S3Delivery: Uploads files to Amazon S3.
+    UploadResult: Outcome of uploading a single file in a batch.
     SFTPDelivery: Transfers files via SFTP.
+    SFTPTransferConfig: Configures the buffer sizes and pipelining of SFTP transfers.
+    SFTPUploadResult: Outcome of uploading a single file over SFTP in a batch.
     SMTPConfig: Configures the SMTP server for sending emails.
     TemplateManager: Manages document templates and integrates them with data sources.
+    MailMerge: Renders records to PDF in memory and emails them in a single pass.
+    RenderResult: Outcome of rendering a single record to PDF.
+    SendResult: Outcome of sending a single email message in a batch.
 """
 
-from .s3_delivery import AWSConfig, S3Delivery
-from .sftp_delivery import SFTPDelivery
-from .smtp_delivery import SMTPConfig, EmailMessageBuilder, EmailSender
-from .template_manager import TemplateManager
+from .async_smtp_delivery import AsyncEmailSender
+from .mail_merge import MailMerge
+from .s3_delivery import AWSConfig, S3Delivery, UploadResult
+from .sftp_delivery import SFTPDelivery, SFTPUploadResult
+from .sftp_transfer import SFTPTransferConfig
+from .smtp_delivery import (
+    SMTPConfig,
+    EmailMessageBuilder,
+    EmailSender,
+    LazyFileAttachment,
+    SendResult,
+)
+from .template_manager import RenderResult, TemplateManager
 
 __all__ = [
     "EmailMessageBuilder",
+    "LazyFileAttachment",
     "EmailSender",
+    "AsyncEmailSender",
     "AWSConfig",
     "S3Delivery",
+    "UploadResult",
     "SFTPDelivery",
+    "SFTPTransferConfig",
+    "SFTPUploadResult",
     "SMTPConfig",
     "TemplateManager",
+    "MailMerge",
+    "RenderResult",
+    "SendResult",
 ]
@@ -0,0 +1,509 @@
+import asyncio
+import base64
+import smtplib
+import ssl
+from email.mime.multipart import MIMEMultipart
+from typing import Iterable, Optional, Self
+
+from .smtp_delivery import (
+    SMTPConfig,
+    SendResult,
+    _get_recipients,
+    _iter_message_data,
+)
+
+
+class _AsyncSMTPConnection:
+    """
+    Minimal SMTP client over asyncio streams, supporting STARTTLS, implicit SSL and
+    AUTH PLAIN/LOGIN. Errors are reported with the exceptions of 'smtplib' so that
+    callers can handle both senders the same way.
+    """
+
+    def __init__(self, smtp_config: SMTPConfig, ssl_context: ssl.SSLContext):
+        self.__smtp_config = smtp_config
+        self.__ssl_context = ssl_context
+        self.__reader: Optional[asyncio.StreamReader] = None
+        self.__writer: Optional[asyncio.StreamWriter] = None
+        self.__extensions: set[str] = set()
+
+    async def connect(self) -> None:
+        """
+        Open the connection, upgrade it to TLS if configured and authenticate.
+
+        Raises:
+            smtplib.SMTPNotSupportedError: If TLS is required and the server does
+                not support STARTTLS.
+            smtplib.SMTPException: If the server rejects any step of the handshake.
+        """
+        async with asyncio.timeout(self.__smtp_config.timeout):
+            self.__reader, self.__writer = await asyncio.open_connection(
+                self.__smtp_config.server,
+                self.__smtp_config.port,
+                ssl=self.__ssl_context if self.__smtp_config.use_ssl else None,
+            )
+
+        await self.__expect(220)
+        await self.__ehlo()
+
+        if self.__smtp_config.use_tls and not self.__smtp_config.use_ssl:
+            if "starttls" not in self.__extensions:
+                raise smtplib.SMTPNotSupportedError(
+                    "STARTTLS extension not supported by server."
+                )
+
+            await self.__command("STARTTLS", 220)
+            async with asyncio.timeout(self.__smtp_config.timeout):
+                await self.__writer.start_tls(
+                    self.__ssl_context, server_hostname=self.__smtp_config.server
+                )
+            await self.__ehlo()
+
+        await self.__login()
+
+    async def sendmail(
+        self, from_addr: str, to_addrs: list[str], email_message: MIMEMultipart
+    ) -> dict[str, tuple[int, bytes]]:
+        """
+        Send a message to the given recipients. Lazy attachments are streamed to
+        the server chunk by chunk.
+
+        Args:
+            from_addr (str): Envelope sender, with or without a display name.
+            to_addrs (list[str]): Envelope recipients, with or without a display
+                name.
+            email_message (MIMEMultipart): Email message.
+
+        Returns:
+            dict[str, tuple[int, bytes]]: Recipients refused by the server.
+
+        Raises:
+            smtplib.SMTPSenderRefused: If the server refuses the sender.
+            smtplib.SMTPRecipientsRefused: If the server refuses every recipient.
+            smtplib.SMTPDataError: If the server refuses the message.
+        """
+        code, reply = await self.__command(f"MAIL FROM:{smtplib.quoteaddr(from_addr)}")
+        if code != 250:
+            await self.__command("RSET")
+            raise smtplib.SMTPSenderRefused(code, reply, from_addr)
+
+        refused = {}
+        for to_addr in to_addrs:
+            code, reply = await self.__command(f"RCPT TO:{smtplib.quoteaddr(to_addr)}")
+            if code not in (250, 251):
+                refused[to_addr] = (code, reply)
+
+        if len(refused) == len(to_addrs):
+            await self.__command("RSET")
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, reply = await self.__command("DATA")
+        if code != 354:
+            await self.__command("RSET")
+            raise smtplib.SMTPDataError(code, reply)
+
+        for chunk in _iter_message_data(email_message):
+            self.__writer.write(chunk)
+            await self.__writer.drain()
+
+        self.__writer.write(b".\r\n")
+        code, reply = await self.__read_reply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, reply)
+
+        return refused
+
+    async def quit(self) -> None:
+        """
+        Say goodbye to the server and close the connection, ignoring errors from
+        a connection that is already broken.
+        """
+        if self.__writer is None:
+            return
+
+        writer, self.__writer = self.__writer, None
+        try:
+            writer.write(b"QUIT\r\n")
+            async with asyncio.timeout(self.__smtp_config.timeout):
+                await writer.drain()
+                await self.__reader.readline()
+        except (OSError, TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    async def __ehlo(self) -> None:
+        """
+        Greet the server and record the extensions it supports.
+        """
+        address = self.__writer.get_extra_info("sockname")[0]
+        code, reply = await self.__command(f"EHLO [{address}]")
+        if code != 250:
+            raise smtplib.SMTPHeloError(code, reply)
+
+        self.__extensions = set()
+        for line in reply.decode("ascii", "replace").lower().splitlines()[1:]:
+            words = line.split()
+            if words:
+                self.__extensions.add(words[0])
+                if words[0] == "auth":
+                    self.__extensions.update(f"auth={word}" for word in words[1:])
+
+    async def __login(self) -> None:
+        """
+        Authenticate with AUTH PLAIN, or AUTH LOGIN if PLAIN is not offered.
+
+        Raises:
+            smtplib.SMTPNotSupportedError: If the server does not support AUTH.
+            smtplib.SMTPAuthenticationError: If the credentials are rejected.
+        """
+        if "auth" not in self.__extensions:
+            raise smtplib.SMTPNotSupportedError(
+                "SMTP AUTH extension not supported by server."
+            )
+
+        username = self.__smtp_config.username
+        password = self.__smtp_config.password
+
+        if "auth=plain" in self.__extensions or "auth=login" not in self.__extensions:
+            token = self.__encode(f"\0{username}\0{password}")
+            code, reply = await self.__command(f"AUTH PLAIN {token}")
+        else:
+            code, reply = await self.__command("AUTH LOGIN")
+            if code == 334:
+                code, reply = await self.__command(self.__encode(username))
+            if code == 334:
+                code, reply = await self.__command(self.__encode(password))
+
+        if code not in (235, 503):
+            raise smtplib.SMTPAuthenticationError(code, reply)
+
+    @staticmethod
+    def __encode(value: str) -> str:
+        """
+        Encode a credential in base64, as expected by AUTH.
+        """
+        return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+    async def __command(
+        self, command: str, expected: Optional[int] = None
+    ) -> tuple[int, bytes]:
+        """
+        Send a command and read its reply.
+
+        Args:
+            command (str): SMTP command, without the line terminator.
+            expected (Optional[int]): Reply code that must be received, if any.
+
+        Returns:
+            tuple[int, bytes]: Reply code and message.
+
+        Raises:
+            smtplib.SMTPResponseException: If 'expected' is set and not received.
+        """
+        self.__writer.write(command.encode("utf-8") + b"\r\n")
+        if expected is None:
+            return await self.__read_reply()
+
+        return await self.__expect(expected)
+
+    async def __expect(self, expected: int) -> tuple[int, bytes]:
+        """
+        Read a reply and check its code.
+        """
+        code, reply = await self.__read_reply()
+        if code != expected:
+            raise smtplib.SMTPResponseException(code, reply)
+
+        return code, reply
+
+    async def __read_reply(self) -> tuple[int, bytes]:
+        """
+        Read a possibly multiline reply from the server.
+
+        Returns:
+            tuple[int, bytes]: Reply code and message, with one line per reply line.
+
+        Raises:
+            smtplib.SMTPServerDisconnected: If the server closed the connection.
+        """
+        lines = []
+        async with asyncio.timeout(self.__smtp_config.timeout):
+            await self.__writer.drain()
+            while True:
+                line = await self.__reader.readline()
+                if not line:
+                    raise smtplib.SMTPServerDisconnected(
+                        "Connection unexpectedly closed."
+                    )
+
+                lines.append(line[4:].strip())
+                if line[3:4] != b"-":
+                    break
+
+        try:
+            code = int(line[:3])
+        except ValueError as error:
+            raise smtplib.SMTPResponseException(-1, line) from error
+
+        return code, b"\n".join(lines)
+
+
+class AsyncEmailSender:
+    """
+    Asynchronous email sender that delivers messages over non-blocking sockets.
+
+    At most 'max_concurrency' messages are in flight at any time. Used as an async
+    context manager, connections are kept open after each message and reused by
+    the following ones. Outside of a context, every call to 'send' opens and
+    closes its own connection.
+
+    Attributes:
+        smtp_config (SMTPConfig): SMTP configuration.
+        max_concurrency (int): Maximum number of messages sent at the same time.
+        ssl_context (ssl.SSLContext): SSL context used for STARTTLS and implicit SSL.
+    """
+
+    def __init__(
+        self,
+        smtp_config: SMTPConfig,
+        max_concurrency: int = 100,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        """
+        Initializes an instance of the AsyncEmailSender class.
+
+        Args:
+            smtp_config (SMTPConfig): SMTP configuration.
+            max_concurrency (int): Maximum number of messages sent at the same time.
+            ssl_context (Optional[ssl.SSLContext]): SSL context used for STARTTLS
+                and implicit SSL. Defaults to the system's trusted certificates.
+        """
+        self.smtp_config = smtp_config
+        self.max_concurrency = max_concurrency
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.__idle: Optional[list[_AsyncSMTPConnection]] = None
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Get the maximum number of messages sent at the same time.
+
+        Returns:
+            int: Maximum number of messages in flight.
+        """
+        return self.__max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value: int) -> None:
+        """
+        Set the maximum number of messages sent at the same time.
+
+        Args:
+            value (int): Maximum number of messages in flight.
+
+        Raises:
+            TypeError: If 'value' is not an integer.
+            ValueError: If 'value' is less than 1.
+        """
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(
+                "'max_concurrency' must be an integer.",
+                f"Current type: {type(value)}.",
+            )
+
+        if value < 1:
+            raise ValueError(
+                "'max_concurrency' must be greater than 0.",
+                f"Current value: {value}.",
+            )
+
+        self.__max_concurrency = value
+        self.__semaphore = asyncio.Semaphore(value)
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """
+        Get the SSL context used for STARTTLS and implicit SSL.
+
+        Returns:
+            ssl.SSLContext: SSL context.
+        """
+        return self.__ssl_context
+
+    @ssl_context.setter
+    def ssl_context(self, value: ssl.SSLContext) -> None:
+        """
+        Set the SSL context used for STARTTLS and implicit SSL.
+
+        Args:
+            value (ssl.SSLContext): SSL context.
+
+        Raises:
+            TypeError: If 'value' is not an SSL context.
+        """
+        if not isinstance(value, ssl.SSLContext):
+            raise TypeError(
+                "'ssl_context' must be an instance of ssl.SSLContext.",
+                f"Current type: {type(value)}.",
+            )
+
+        self.__ssl_context = value
+
+    async def __aenter__(self) -> Self:
+        """
+        Start keeping connections open between messages.
+
+        Returns:
+            Self: AsyncEmailSender instance.
+        """
+        if self.__idle is None:
+            self.__idle = []
+
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """
+        Close every open connection.
+        """
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close every open connection and stop reusing connections.
+        """
+        idle, self.__idle = self.__idle or [], None
+        await asyncio.gather(*(connection.quit() for connection in idle))
+
+    async def send(self, email_message: MIMEMultipart) -> dict[str, tuple[int, bytes]]:
+        """
+        Send an email message.
+
+        Args:
+            email_message (MIMEMultipart): Email message.
+
+        Returns:
+            dict[str, tuple[int, bytes]]: Recipients refused by the server.
+
+        Raises:
+            smtplib.SMTPException: If an error occurs while sending the email.
+
+        ## Usage:
+
+        ```python
+        async with AsyncEmailSender(smtp_config, max_concurrency=200) as sender:
+            await asyncio.gather(*(sender.send(message) for message in messages))
+        ```
+        """
+        async with self.__semaphore:
+            reused = bool(self.__idle)
+            connection = await self.__checkout()
+
+            try:
+                refused = await self.__sendmail(connection, email_message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                await connection.quit()
+                if not reused:
+                    raise
+
+                # The server dropped an idle connection, retry once on a new one
+                connection = await self.__checkout(reuse=False)
+                try:
+                    refused = await self.__sendmail(connection, email_message)
+                except BaseException:
+                    await connection.quit()
+                    raise
+            except (
+                smtplib.SMTPSenderRefused,
+                smtplib.SMTPRecipientsRefused,
+                smtplib.SMTPDataError,
+            ):
+                # The server answered, so the connection is still usable
+                await self.__release(connection)
+                raise
+            except BaseException:
+                await connection.quit()
+                raise
+
+            await self.__release(connection)
+            return refused
+
+    async def send_many(self, messages: Iterable[MIMEMultipart]) -> list[SendResult]:
+        """
+        Send a batch of email messages concurrently. A message that fails is
+        reported in its result and does not stop the rest of the batch.
+
+        Args:
+            messages (Iterable[MIMEMultipart]): Email messages.
+
+        Returns:
+            list[SendResult]: Result of every message, in the order of 'messages'.
+        """
+
+        async def send_one(index: int, message: MIMEMultipart) -> SendResult:
+            try:
+                return SendResult(index=index, refused=await self.send(message))
+            except smtplib.SMTPRecipientsRefused as error:
+                return SendResult(
+                    index=index, refused=error.recipients, error=repr(error)
+                )
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                return SendResult(index=index, error=repr(error))
+
+        return list(
+            await asyncio.gather(
+                *(send_one(index, message) for index, message in enumerate(messages))
+            )
+        )
+
+    async def __checkout(self, reuse: bool = True) -> _AsyncSMTPConnection:
+        """
+        Take an idle connection, or open a new one.
+        """
+        if reuse and self.__idle:
+            return self.__idle.pop()
+
+        connection = _AsyncSMTPConnection(self.smtp_config, self.ssl_context)
+        try:
+            await connection.connect()
+        except BaseException:
+            await connection.quit()
+            raise
+
+        return connection
+
+    async def __release(self, connection: _AsyncSMTPConnection) -> None:
+        """
+        Keep a connection for the next message, or close it outside of a context.
+        """
+        if self.__idle is None:
+            await connection.quit()
+        else:
+            self.__idle.append(connection)
+
+    @staticmethod
+    async def __sendmail(
+        connection: _AsyncSMTPConnection, email_message: MIMEMultipart
+    ) -> dict[str, tuple[int, bytes]]:
+        """
+        Send a message over a connection.
+        """
+        return await connection.sendmail(
+            email_message["From"],
+            _get_recipients(email_message),
+            email_message,
+        )
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the AsyncEmailSender instance.
+
+        Returns:
+            str: String representation of the AsyncEmailSender instance.
+        """
+        return str(
+            {
+                "smtp_config": str(self.smtp_config),
+                "max_concurrency": self.max_concurrency,
+            }
+        )
@@ -0,0 +1,292 @@
+import dataclasses
+import queue
+import threading
+from email.mime.application import MIMEApplication
+from typing import Any, Callable, Iterator, Optional, Self
+
+from .smtp_delivery import EmailMessageBuilder, EmailSender, SendResult
+from .template_manager import RenderResult, TemplateManager
+
+_END_OF_RECORDS = object()
+
+
+class MailMerge:
+    """
+    Streaming mail merge that renders every record of a TemplateManager to a PDF in
+    memory, attaches it to a personalized email and sends it, without writing any
+    file to disk.
+
+    Records are rendered in a background thread that feeds a bounded queue, while
+    the sending threads consume it over pooled SMTP connections. Both stages run at
+    the same time, so the throughput is limited by the slower one, and at most
+    'queue_size' rendered messages are held in memory.
+
+    Attributes:
+        template_manager (TemplateManager): Source of the records and templates.
+        email_sender (EmailSender): Sender used to deliver the messages.
+        build_message_func (Optional[Callable[[dict[str, Any]], EmailMessageBuilder]]):
+            Function that returns the message builder of a record.
+    """
+
+    def __init__(self, template_manager: TemplateManager, email_sender: EmailSender):
+        """
+        Initializes an instance of the MailMerge class.
+
+        Args:
+            template_manager (TemplateManager): Source of the records and templates.
+            email_sender (EmailSender): Sender used to deliver the messages.
+        """
+        self.template_manager = template_manager
+        self.email_sender = email_sender
+        self.build_message_func = None
+
+    @property
+    def template_manager(self) -> TemplateManager:
+        """
+        Get the template manager that provides the records and templates.
+
+        Returns:
+            TemplateManager: Template manager.
+        """
+        return self.__template_manager
+
+    @template_manager.setter
+    def template_manager(self, template_manager: TemplateManager) -> None:
+        """
+        Set the template manager that provides the records and templates.
+
+        Args:
+            template_manager (TemplateManager): Template manager.
+
+        Raises:
+            TypeError: If 'template_manager' is not a TemplateManager.
+        """
+        if not isinstance(template_manager, TemplateManager):
+            raise TypeError(
+                "'template_manager' must be an instance of TemplateManager.",
+                f"Current type: {type(template_manager)}.",
+            )
+
+        self.__template_manager = template_manager
+
+    @property
+    def email_sender(self) -> EmailSender:
+        """
+        Get the sender used to deliver the messages.
+
+        Returns:
+            EmailSender: Email sender.
+        """
+        return self.__email_sender
+
+    @email_sender.setter
+    def email_sender(self, email_sender: EmailSender) -> None:
+        """
+        Set the sender used to deliver the messages.
+
+        Args:
+            email_sender (EmailSender): Email sender.
+
+        Raises:
+            TypeError: If 'email_sender' is not an EmailSender.
+        """
+        if not isinstance(email_sender, EmailSender):
+            raise TypeError(
+                "'email_sender' must be an instance of EmailSender.",
+                f"Current type: {type(email_sender)}.",
+            )
+
+        self.__email_sender = email_sender
+
+    def build_message_with(
+        self, func: Callable[[dict[str, Any]], EmailMessageBuilder]
+    ) -> Self:
+        """
+        Set the function that returns the message builder of a record. The
+        rendered PDF is attached to the builder before the message is built.
+
+        Args:
+            func (Callable[[dict[str, Any]], EmailMessageBuilder]): Function that
+                receives a record and returns its message builder.
+
+        Returns:
+            Self: MailMerge instance.
+
+        Raises:
+            TypeError: If 'func' is not callable.
+        """
+        if not callable(func):
+            raise TypeError(
+                "'func' must be callable.",
+                f"Current type: {type(func)}.",
+            )
+
+        self.build_message_func = func
+        return self
+
+    def run(
+        self,
+        concurrency: int = 1,
+        queue_size: int = 100,
+        rate_per_connection: Optional[float] = None,
+        rate_limit: Optional[float] = None,
+    ) -> list[SendResult]:
+        """
+        Render, attach and send the PDF of every record.
+
+        A record that fails to render or to be sent, or whose template or filename
+        cannot be resolved, is reported in its result and does not stop the rest
+        of the records.
+
+        Args:
+            concurrency (int): Number of SMTP connections, and sending threads.
+            queue_size (int): Maximum number of rendered messages waiting to be
+                sent.
+            rate_per_connection (Optional[float]): Maximum messages per second sent
+                over each connection. Unlimited if None.
+            rate_limit (Optional[float]): Maximum messages per second sent across
+                all connections. Unlimited if None.
+
+        Returns:
+            list[SendResult]: Result of every record, in the order of the data.
+
+        Raises:
+            ValueError: If no message function is set or 'queue_size' is not a
+                positive integer.
+            RuntimeError: If the records cannot be read to the end, such as a
+                streamed record with keys that are not strings. The results of
+                the records processed until then are its second argument and the
+                original error its cause.
+
+        ## Usage:
+
+        ```python
+        results = (
+            MailMerge(template_manager, EmailSender(smtp_config))
+            .build_message_with(
+                lambda item: EmailMessageBuilder(
+                    from_address="sender@example.com", to_addresses=[item["email"]]
+                ).with_subject("Your certificate")
+            )
+            .run(concurrency=4, rate_limit=20)
+        )
+        failed = [result for result in results if not result.accepted]
+        ```
+        """
+        if self.build_message_func is None:
+            raise ValueError(
+                "A method must be implemented to build the message of every record.",
+                "Use the build_message_with method to do so.",
+            )
+
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError(
+                "'queue_size' must be a positive integer.",
+                f"Current value: {queue_size}.",
+            )
+
+        records = self.template_manager.iter_render_results()
+        rendered = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        failures: list[SendResult] = []
+        errors: list[BaseException] = []
+
+        renderer = threading.Thread(
+            target=self.__render,
+            args=(records, rendered, stop, failures, errors),
+            daemon=True,
+        )
+        renderer.start()
+
+        indexes: list[int] = []
+        try:
+            results = self.email_sender.send_many(
+                self.__iter_rendered(rendered, indexes),
+                concurrency=concurrency,
+                rate_per_connection=rate_per_connection,
+                rate_limit=rate_limit,
+            )
+        finally:
+            stop.set()
+            renderer.join()
+
+        results = sorted(
+            [
+                dataclasses.replace(result, index=indexes[result.index])
+                for result in results
+            ]
+            + failures,
+            key=lambda result: result.index,
+        )
+
+        if errors:
+            raise RuntimeError(
+                f"The records stopped after {len(results)} record(s) were processed.",
+                results,
+            ) from errors[0]
+
+        return results
+
+    def __render(
+        self,
+        records: Iterator[tuple[RenderResult, dict[str, Any], Optional[bytes]]],
+        rendered: queue.Queue,
+        stop: threading.Event,
+        failures: list[SendResult],
+        errors: list[BaseException],
+    ) -> None:
+        """
+        Build the message of every rendered record and put it in the queue, until
+        the records run out or 'stop' is set.
+        """
+        try:
+            for result, item, pdf in records:
+                if result.error is not None:
+                    failures.append(SendResult(index=result.index, error=result.error))
+                    continue
+
+                try:
+                    attachment = MIMEApplication(pdf, _subtype="pdf")
+                    message = (
+                        self.build_message_func(item)
+                        .add_attachment(attachment, filename=f"{result.filename}.pdf")
+                        .build()
+                    )
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    failures.append(SendResult(index=result.index, error=repr(error)))
+                    continue
+
+                if not self.__put(rendered, (result.index, message), stop):
+                    return
+        except BaseException as error:  # pylint: disable=broad-exception-caught
+            errors.append(error)
+        finally:
+            self.__put(rendered, _END_OF_RECORDS, stop)
+
+    @staticmethod
+    def __put(rendered: queue.Queue, value: Any, stop: threading.Event) -> bool:
+        """
+        Put a value in the queue, waiting for room unless 'stop' is set.
+
+        Returns:
+            bool: True if the value was queued.
+        """
+        while not stop.is_set():
+            try:
+                rendered.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    @staticmethod
+    def __iter_rendered(rendered: queue.Queue, indexes: list[int]) -> Iterator[Any]:
+        """
+        Yield the rendered messages, recording the index of the record of each one
+        in the order they are handed to the senders.
+        """
+        while (entry := rendered.get()) is not _END_OF_RECORDS:
+            index, message = entry
+            indexes.append(index)
+            yield message
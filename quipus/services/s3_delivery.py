@@ -1,5 +1,11 @@
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, BinaryIO, Optional
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 
 
 class AWSConfig:
@@ -115,22 +121,59 @@ class AWSConfig:
         )
 
 
+@dataclass(frozen=True)
+class UploadResult:
+    """
+    Outcome of uploading a single file with 'S3Delivery.upload_many_files'.
+
+    Attributes:
+        file_path (str): Path of the local file.
+        key (str): Key of the file in the bucket.
+        error (Optional[str]): Error message if the file could not be uploaded.
+    """
+
+    file_path: str
+    key: str
+    error: Optional[str] = None
+
+
 class S3Delivery:
     """
     S3 delivery class.
 
+    The S3 client is built on first use and shared by every upload, including
+    uploads running in different threads.
+
     Attributes:
         _aws_config (AWSConfig): AWS configuration object.
+        max_pool_connections (int): Maximum number of connections kept open by
+            the client.
+        transfer_config (Optional[TransferConfig]): Multipart settings of the
+            uploads.
     """
 
-    def __init__(self, aws_config: AWSConfig) -> None:
+    def __init__(
+        self,
+        aws_config: AWSConfig,
+        max_pool_connections: int = 10,
+        transfer_config: Optional[TransferConfig] = None,
+    ) -> None:
         """
         Initialize the S3Delivery object.
 
         Args:
             aws_config (AWSConfig): AWS configuration object.
+            max_pool_connections (int): Maximum number of connections kept open by
+                the client.
+            transfer_config (Optional[TransferConfig]): Multipart settings of the
+                uploads, such as the multipart threshold, the chunk size and the
+                number of threads per file. Uses boto3's defaults if None.
         """
+        self._client = None
+        self._client_lock = threading.Lock()
         self._aws_config = aws_config
+        self.max_pool_connections = max_pool_connections
+        self.transfer_config = transfer_config
 
     @property
     def aws_config(self) -> AWSConfig:
@@ -150,7 +193,55 @@ class S3Delivery:
         if not isinstance(value, AWSConfig):
             raise TypeError("AWS configuration must be an AWSConfig object.")
 
-        self._aws_config = value
+        with self._client_lock:
+            self._aws_config = value
+            self._client = None
+
+    @property
+    def max_pool_connections(self) -> int:
+        """
+        Get the maximum number of connections kept open by the client.
+        """
+        return self._max_pool_connections
+
+    @max_pool_connections.setter
+    def max_pool_connections(self, value: int) -> None:
+        """
+        Set the maximum number of connections kept open by the client.
+
+        Args:
+            value (int): Maximum number of connections.
+        """
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError("Max pool connections must be an integer.")
+
+        if value < 1:
+            raise ValueError("Max pool connections must be greater than 0.")
+
+        with self._client_lock:
+            self._max_pool_connections = value
+            self._client = None
+
+    @property
+    def transfer_config(self) -> Optional[TransferConfig]:
+        """
+        Get the multipart settings of the uploads.
+        """
+        return self._transfer_config
+
+    @transfer_config.setter
+    def transfer_config(self, value: Optional[TransferConfig]) -> None:
+        """
+        Set the multipart settings of the uploads.
+
+        Args:
+            value (Optional[TransferConfig]): Multipart settings, or None to use
+                boto3's defaults.
+        """
+        if value is not None and not isinstance(value, TransferConfig):
+            raise TypeError("Transfer configuration must be a TransferConfig object.")
+
+        self._transfer_config = value
 
     def upload_file(self, file_path: str, bucket_name: str, key: str) -> None:
         """
@@ -176,21 +267,87 @@ class S3Delivery:
         if not key or len(key) == 0:
             raise ValueError("Key cannot be empty.")
 
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=self._aws_config.aws_access_key_id,
-            aws_secret_access_key=self._aws_config.aws_secret_access_key,
-            region_name=self._aws_config.aws_region,
+        s3 = self._get_client()
+        s3.upload_file(file_path, bucket_name, key, **self._transfer_arguments())
+
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        bucket_name: str,
+        key: str,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """
+        Upload the content of a binary file-like object to an S3 bucket, without
+        writing it to disk. Large objects are uploaded in parts.
+
+        Args:
+            fileobj (BinaryIO): File-like object opened in binary mode.
+            bucket_name (str): Name of the bucket to upload the file to.
+            key (str): Key to be used for the file in the bucket.
+            content_type (Optional[str]): MIME type stored with the object.
+        """
+        if not hasattr(fileobj, "read"):
+            raise TypeError("File object must be a readable file-like object.")
+        if not isinstance(bucket_name, str):
+            raise TypeError("Bucket name must be a string.")
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string.")
+        if content_type is not None and not isinstance(content_type, str):
+            raise TypeError("Content type must be a string.")
+
+        if not bucket_name or len(bucket_name) == 0:
+            raise ValueError("Bucket name cannot be empty.")
+        if not key or len(key) == 0:
+            raise ValueError("Key cannot be empty.")
+
+        s3 = self._get_client()
+        s3.upload_fileobj(
+            fileobj, bucket_name, key, **self._transfer_arguments(content_type)
         )
-        s3.upload_file(file_path, bucket_name, key)
 
-    def upload_many_files(self, files: list[tuple[str, str]], bucket_name: str) -> None:
+    def upload_bytes(
+        self,
+        data: bytes,
+        bucket_name: str,
+        key: str,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """
+        Upload an in-memory buffer to an S3 bucket.
+
+        Args:
+            data (bytes): Content to upload.
+            bucket_name (str): Name of the bucket to upload the file to.
+            key (str): Key to be used for the file in the bucket.
+            content_type (Optional[str]): MIME type stored with the object.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Data must be bytes.")
+
+        self.upload_fileobj(BytesIO(data), bucket_name, key, content_type)
+
+    def upload_many_files(
+        self,
+        files: list[tuple[str, str]],
+        bucket_name: str,
+        max_workers: Optional[int] = None,
+    ) -> list[UploadResult]:
         """
-        Upload multiple files to an S3 bucket.
+        Upload multiple files to an S3 bucket concurrently.
+
+        A file that fails to upload is reported in its result and does not stop
+        the rest of the files.
 
         Args:
             files (list): List of tuples containing the file path and key for each file.
             bucket_name (str): Name of the bucket to upload the files to.
+            max_workers (Optional[int]): Number of files uploaded at the same time.
+                Defaults to 'max_pool_connections', so that every worker has a
+                connection available.
+
+        Returns:
+            list[UploadResult]: Result of every file, in the order of 'files'.
         """
 
         if not isinstance(files, list):
@@ -199,11 +356,60 @@ class S3Delivery:
         if not isinstance(bucket_name, str):
             raise TypeError("Bucket name must be a string.")
 
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=self._aws_config.aws_access_key_id,
-            aws_secret_access_key=self._aws_config.aws_secret_access_key,
-            region_name=self._aws_config.aws_region,
-        )
-        for file_path, key in files:
-            s3.upload_file(file_path, bucket_name, key)
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or isinstance(max_workers, bool)
+        ):
+            raise TypeError("Max workers must be an integer.")
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("Max workers must be greater than 0.")
+
+        s3 = self._get_client()
+        transfer_arguments = self._transfer_arguments()
+
+        def upload(file: tuple[str, str]) -> UploadResult:
+            file_path, key = file
+            try:
+                s3.upload_file(file_path, bucket_name, key, **transfer_arguments)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                return UploadResult(file_path=file_path, key=key, error=repr(error))
+
+            return UploadResult(file_path=file_path, key=key)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or self.max_pool_connections
+        ) as executor:
+            return list(executor.map(upload, files))
+
+    def _transfer_arguments(self, content_type: Optional[str] = None) -> dict[str, Any]:
+        """
+        Get the optional arguments of the client's upload methods.
+        """
+        arguments: dict[str, Any] = {}
+        if content_type is not None:
+            arguments["ExtraArgs"] = {"ContentType": content_type}
+        if self._transfer_config is not None:
+            arguments["Config"] = self._transfer_config
+
+        return arguments
+
+    def _get_client(self):
+        """
+        Get the S3 client, building it with the configured credentials on first
+        use. Clients are thread-safe, so a single one is shared by every upload.
+        """
+        client = self._client
+        if client is not None:
+            return client
+
+        with self._client_lock:
+            if self._client is None:
+                self._client = boto3.client(
+                    "s3",
+                    aws_access_key_id=self._aws_config.aws_access_key_id,
+                    aws_secret_access_key=self._aws_config.aws_secret_access_key,
+                    region_name=self._aws_config.aws_region,
+                    config=Config(max_pool_connections=self._max_pool_connections),
+                )
+
+            return self._client
@@ -1,31 +1,68 @@
 import hashlib
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Self
 
 import paramiko
 from paramiko import SFTPClient
-from typing import Optional
+
+from .sftp_transfer import SFTPTransferConfig, _SFTPTransfer
+
+
+@dataclass(frozen=True)
+class SFTPUploadResult:
+    """
+    Outcome of uploading a single file with 'SFTPDelivery.upload_many'.
+
+    Attributes:
+        local_file (str): Path of the local file.
+        remote_file (str): Path of the file on the server.
+        error (Optional[str]): Error message if the file could not be uploaded.
+    """
+
+    local_file: str
+    remote_file: str
+    error: Optional[str] = None
+
+    @property
+    def uploaded(self) -> bool:
+        """
+        Get whether the file was uploaded.
+
+        Returns:
+            bool: True if the file was uploaded.
+        """
+        return self.error is None
 
 
 class SFTPDelivery:
     """
     SFTP Delivery class to manage file uploads via SFTP.
 
+    Every instance owns its own SSH connection, over which it keeps a pool of up to
+    'pool_size' SFTP channels. Channels are opened on demand, checked out by a
+    single thread at a time and returned to the pool once the transfer is done, so
+    several threads can transfer files in parallel over the same connection.
+
     Attributes:
         host (str): SFTP server host.
         username (str): Username for authentication.
         password (str): Password for authentication.
         port (int): SFTP server port.
-        private_key (Optional[str]): Path to the private key for key-based authentication.
+        private_key (Optional[str]): Path to the private key for key-based
+            authentication.
+        pool_size (int): Maximum number of SFTP channels opened over the connection.
+        transfer_config (SFTPTransferConfig): Buffer sizes and pipelining of the
+            transfers.
         connection (paramiko.SSHClient): SSH client connection object.
-        sftp_client (SFTPClient): SFTP client object.
+        sftp_client (SFTPClient): First SFTP channel opened over the connection.
     """
 
-    _instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(SFTPDelivery, cls).__new__(cls)
-        return cls._instance
-
     def __init__(
         self,
         host: str,
@@ -33,14 +70,23 @@ class SFTPDelivery:
         password: str,
         port: int = 22,
         private_key: Optional[str] = None,
+        pool_size: int = 1,
+        transfer_config: Optional[SFTPTransferConfig] = None,
     ):
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.private_key = private_key
+        self.pool_size = pool_size
+        self.transfer_config = transfer_config or SFTPTransferConfig()
         self.__connection = None
         self.__sftp_client = None
+        self.__sessions: list[SFTPClient] = []
+        self.__idle_sessions: list[SFTPClient] = []
+        self.__opening_sessions = 0
+        self.__pool_available = threading.Condition()
+        self.__is_connected = False
 
     @property
     def host(self) -> str:
@@ -182,6 +228,63 @@ class SFTPDelivery:
             raise ValueError("'private_key' cannot be an empty string.")
         self.__private_key = private_key
 
+    @property
+    def pool_size(self) -> int:
+        """
+        Get the maximum number of SFTP channels opened over the connection.
+
+        Returns:
+            int: Maximum number of SFTP channels.
+        """
+        return self.__pool_size
+
+    @pool_size.setter
+    def pool_size(self, pool_size: int) -> None:
+        """
+        Set the maximum number of SFTP channels opened over the connection.
+
+        Args:
+            pool_size (int): Maximum number of SFTP channels.
+
+        Raises:
+            TypeError: If 'pool_size' is not an integer.
+            ValueError: If 'pool_size' is lower than 1.
+        """
+        if not isinstance(pool_size, int) or isinstance(pool_size, bool):
+            raise TypeError("'pool_size' must be an integer.")
+        if pool_size < 1:
+            raise ValueError("'pool_size' must be at least 1.")
+        self.__pool_size = pool_size
+
+    @property
+    def transfer_config(self) -> SFTPTransferConfig:
+        """
+        Get the buffer sizes and pipelining of the transfers.
+
+        Returns:
+            SFTPTransferConfig: Transfer configuration.
+        """
+        return self.__transfer_config
+
+    @transfer_config.setter
+    def transfer_config(self, transfer_config: SFTPTransferConfig) -> None:
+        """
+        Set the buffer sizes and pipelining of the transfers. The window and packet
+        sizes apply to the SFTP channels opened after the next connection.
+
+        Args:
+            transfer_config (SFTPTransferConfig): Transfer configuration.
+
+        Raises:
+            TypeError: If 'transfer_config' is not an instance of
+                SFTPTransferConfig.
+        """
+        if not isinstance(transfer_config, SFTPTransferConfig):
+            raise TypeError(
+                "'transfer_config' must be an instance of SFTPTransferConfig."
+            )
+        self.__transfer_config = transfer_config
+
     @property
     def connection(self) -> paramiko.SSHClient:
         """
@@ -234,21 +337,166 @@ class SFTPDelivery:
 
     def close(self) -> None:
         """
-        Close the SFTP and SSH connections.
+        Close every SFTP channel and the SSH connection.
         """
-        if self.sftp_client:
-            self.sftp_client.close()
+        with self.__pool_available:
+            sessions = self.__sessions
+            self.__sessions = []
+            self.__idle_sessions = []
+            self.__is_connected = False
+            self.__pool_available.notify_all()
+
+        for sftp_client in sessions:
+            sftp_client.close()
 
         if self.connection:
             self.connection.close()
 
     def connect(self) -> None:
         """
-        Establish a connection to the SFTP server.
+        Establish a connection to the SFTP server and open its first SFTP channel.
+        The channels and connection of a previous call are closed first.
         """
+        self.close()
         self.__establish_ssh_connection()
         self.sftp_client = self.connection.open_sftp()
 
+        with self.__pool_available:
+            self.__sessions = [self.sftp_client]
+            self.__idle_sessions = [self.sftp_client]
+            self.__is_connected = True
+
+    def checkout(self, timeout: Optional[float] = None) -> SFTPClient:
+        """
+        Take an SFTP channel from the pool for the exclusive use of the caller.
+
+        An idle channel is reused when there is one. Otherwise a new channel is
+        opened over the connection, unless 'pool_size' channels are already open,
+        in which case the call waits until another thread returns one.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for a channel. Waits
+                forever if None.
+
+        Returns:
+            SFTPClient: SFTP channel, to be handed back with the release method.
+
+        Raises:
+            ValueError: If the SFTP connection is not established.
+            TimeoutError: If no channel is returned to the pool in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.__pool_available:
+            while True:
+                if not self.__is_connected:
+                    raise ValueError("SFTP connection not established")
+
+                if self.__idle_sessions:
+                    return self.__idle_sessions.pop()
+
+                if len(self.__sessions) + self.__opening_sessions < self.pool_size:
+                    # Reserve the slot, the channel is opened without the lock
+                    self.__opening_sessions += 1
+                    connection = self.connection
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No SFTP channel was released in time.")
+                self.__pool_available.wait(remaining)
+
+        return self.__open_session(connection)
+
+    def __open_session(self, connection: paramiko.SSHClient) -> SFTPClient:
+        """
+        Open a new SFTP channel in a slot reserved by the checkout method, and free
+        the slot if the channel cannot be opened.
+
+        Raises:
+            ValueError: If the connection was closed while the channel was opened.
+        """
+        try:
+            sftp_client = connection.open_sftp()
+        except BaseException:
+            with self.__pool_available:
+                self.__opening_sessions -= 1
+                self.__pool_available.notify()
+            raise
+
+        with self.__pool_available:
+            self.__opening_sessions -= 1
+            if self.__is_connected and connection is self.connection:
+                self.__sessions.append(sftp_client)
+                return sftp_client
+            self.__pool_available.notify()
+
+        sftp_client.close()
+        raise ValueError("SFTP connection not established")
+
+    def release(self, sftp_client: SFTPClient, discard: bool = False) -> None:
+        """
+        Return an SFTP channel taken with the checkout method to the pool.
+
+        Args:
+            sftp_client (SFTPClient): SFTP channel to return.
+            discard (bool): Close the channel instead of reusing it, so that a new
+                one is opened in its place. Meant for broken channels.
+
+        Raises:
+            ValueError: If 'sftp_client' does not belong to the pool.
+        """
+        with self.__pool_available:
+            if not self.__is_connected:
+                return
+
+            if sftp_client not in self.__sessions:
+                raise ValueError("'sftp_client' does not belong to the pool.")
+
+            if discard:
+                self.__sessions.remove(sftp_client)
+            else:
+                self.__idle_sessions.append(sftp_client)
+            self.__pool_available.notify()
+
+        if discard:
+            sftp_client.close()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[SFTPClient]:
+        """
+        Check out an SFTP channel for the duration of a 'with' block.
+
+        The channel is returned to the pool when the block ends, or discarded if the
+        block fails because the channel itself broke.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for a channel. Waits
+                forever if None.
+
+        Yields:
+            SFTPClient: SFTP channel.
+
+        ## Usage:
+
+        ```python
+        with SFTPDelivery(host, username, password, pool_size=4) as sftp:
+            with sftp.session() as channel:
+                channel.put("report.pdf", "/uploads/report.pdf")
+        ```
+        """
+        sftp_client = self.checkout(timeout)
+        try:
+            yield sftp_client
+        except (EOFError, paramiko.SSHException):
+            self.release(sftp_client, discard=True)
+            raise
+        except BaseException:
+            self.release(sftp_client)
+            raise
+
+        self.release(sftp_client)
+
     def __establish_ssh_connection(self) -> None:
         """
         Establish the SSH connection based on authentication method.
@@ -275,103 +523,289 @@ class SFTPDelivery:
                 password=self.password,
             )
 
-    def download_file(self, remote_file: str, local_file: str) -> None:
+        window_size = self.transfer_config.window_size
+        max_packet_size = self.transfer_config.max_packet_size
+        if window_size is not None or max_packet_size is not None:
+            # Channels opened from now on take these sizes from the transport
+            transport = self.connection.get_transport()
+            if window_size is not None:
+                transport.default_window_size = window_size
+            if max_packet_size is not None:
+                transport.default_max_packet_size = max_packet_size
+
+    def download_file(
+        self,
+        remote_file: str,
+        local_file: str,
+        resume: bool = False,
+        allow_download: bool = False,
+    ) -> None:
         """
         Download a file from the SFTP server.
 
         Args:
             remote_file (str): Path to the remote file on the server.
             local_file (str): Path to save the file locally.
+            resume (bool): Continue from the end of a partial local file left by
+                an interrupted download, if the server confirms with a checksum
+                that it matches the start of the remote file. Otherwise, the file
+                is downloaded from the start.
+            allow_download (bool): When resuming and the server cannot calculate
+                the checksum, read the start of the remote file back to verify
+                the partial file instead of downloading it all over again.
 
         Raises:
             ValueError: If the SFTP connection is not established.
-        """
-        if not self.sftp_client:
-            raise ValueError("SFTP connection not established")
-        self.sftp_client.get(remote_file, local_file)
-
-    def upload_file(self, local_file: str, remote_file: str) -> None:
+            IOError: If the size of the local file differs from the remote one.
+        """
+        with self.session() as sftp_client:
+            transfer = self.__transfer(sftp_client)
+            remote_size = sftp_client.stat(remote_file).st_size
+            offset = 0
+            if resume and os.path.exists(local_file):
+                offset = transfer.get_resume_offset(
+                    local_file,
+                    remote_file,
+                    os.path.getsize(local_file),
+                    remote_size,
+                    allow_download,
+                )
+
+            with sftp_client.open(remote_file, "rb") as remote_f, open(
+                local_file, "r+b" if offset else "wb"
+            ) as local_f:
+                remote_f.seek(offset)
+                local_f.seek(offset)
+                for chunk in transfer.iter_chunks(remote_f):
+                    local_f.write(chunk)
+
+        local_size = os.path.getsize(local_file)
+        if local_size != remote_size:
+            raise IOError(f"size mismatch in download! {local_size} != {remote_size}")
+
+    def upload_file(
+        self,
+        local_file: str,
+        remote_file: str,
+        resume: bool = False,
+        allow_download: bool = False,
+    ) -> None:
         """
         Upload a file to the SFTP server.
 
         Args:
             local_file (str): Path to the local file.
             remote_file (str): Path to the remote file on the server.
+            resume (bool): Continue from the end of a partial remote file left by
+                an interrupted upload, if the server confirms with a checksum that
+                it matches the start of the local file. Otherwise, the file is
+                uploaded from the start.
+            allow_download (bool): When resuming and the server cannot calculate
+                the checksum, download the partial remote file to verify it
+                instead of uploading it all over again.
 
         Raises:
             ValueError: If the SFTP connection is not established.
+            IOError: If the size of the remote file differs from the local one.
+
+        ## Usage:
+
+        ```python
+        with SFTPDelivery(host, username, password) as sftp:
+            for attempt in range(5):
+                try:
+                    sftp.upload_file("export.csv", "/exports/export.csv", resume=True)
+                    break
+                except (EOFError, OSError, paramiko.SSHException):
+                    sftp.close()
+                    sftp.connect()
+        ```
+        """
+        with self.session() as sftp_client:
+            transfer = self.__transfer(sftp_client)
+            offset = 0
+            if resume:
+                try:
+                    remote_size = sftp_client.stat(remote_file).st_size
+                except FileNotFoundError:
+                    remote_size = 0
+                offset = transfer.get_resume_offset(
+                    local_file,
+                    remote_file,
+                    remote_size,
+                    os.path.getsize(local_file),
+                    allow_download,
+                )
+
+            transfer.write_file(local_file, remote_file, offset=offset)
+
+    def upload_many(
+        self,
+        pairs: list[tuple[str, str]],
+        concurrency: Optional[int] = None,
+        create_dirs: bool = True,
+    ) -> list[SFTPUploadResult]:
         """
-        if not self.sftp_client:
-            raise ValueError("SFTP connection not established")
-        self.sftp_client.put(local_file, remote_file)
+        Upload multiple files to the SFTP server in parallel, each thread over its
+        own SFTP channel of the pool.
 
-    def upload(self, local_file: str, remote_file: str, algorithm: str = "md5") -> bool:
-        """
-        Upload a file to the SFTP server and verify the upload.
+        A file that fails to upload is reported in its result and does not stop
+        the rest of the files.
 
         Args:
-            local_file (str): Path to the local file.
-            remote_file (str): Path to the remote file on the server.
-            algorithm (str): The hash algorithm to use (default is 'md5').
+            pairs (list[tuple[str, str]]): Local path and remote path of every file.
+            concurrency (Optional[int]): Number of files uploaded at the same time.
+                Defaults to 'pool_size', so that every thread has a channel.
+            create_dirs (bool): Create the missing remote directories of every
+                file, like 'mkdir -p'.
 
         Returns:
-            bool: True if the upload is successful and verified, False otherwise.
+            list[SFTPUploadResult]: Result of every file, in the order of 'pairs'.
 
         Raises:
-            ValueError: If the SFTP connection is not established.
-        """
-        if not self.sftp_client:
-            raise ValueError("SFTP connection not established")
+            TypeError: If 'pairs' is not a list or 'concurrency' is not an integer.
+            ValueError: If 'concurrency' is lower than 1 or the SFTP connection is
+                not established.
 
-        self.upload_file(local_file, remote_file)
-        return self.__verify_upload(local_file, remote_file, algorithm)
+        ## Usage:
 
-    def __calculate_checksum(self, file_path: str, algorithm: str = "md5") -> str:
-        """
-        Calculate the checksum of a file.
+        ```python
+        with SFTPDelivery(host, username, password, pool_size=8) as sftp:
+            results = sftp.upload_many(
+                [(path, f"/certificates/{os.path.basename(path)}") for path in paths]
+            )
+        failed = [result for result in results if not result.uploaded]
+        ```
+        """
+        if not isinstance(pairs, list):
+            raise TypeError("'pairs' must be a list.")
+        if concurrency is not None and (
+            not isinstance(concurrency, int) or isinstance(concurrency, bool)
+        ):
+            raise TypeError("'concurrency' must be an integer.")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1.")
+        if not self.__is_connected:
+            raise ValueError("SFTP connection not established")
 
-        Args:
-            file_path (str): Path to the file.
-            algorithm (str): The hash algorithm to use (default is 'md5').
+        created_dirs: set[str] = set()
+
+        def upload(pair: tuple[str, str]) -> SFTPUploadResult:
+            local_file, remote_file = pair
+            try:
+                with self.session() as sftp_client:
+                    if create_dirs:
+                        self.__make_remote_dirs(
+                            sftp_client, posixpath.dirname(remote_file), created_dirs
+                        )
+                    self.__transfer(sftp_client).write_file(local_file, remote_file)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                return SFTPUploadResult(
+                    local_file=local_file, remote_file=remote_file, error=repr(error)
+                )
+
+            return SFTPUploadResult(local_file=local_file, remote_file=remote_file)
+
+        with ThreadPoolExecutor(max_workers=concurrency or self.pool_size) as executor:
+            return list(executor.map(upload, pairs))
+
+    def __make_remote_dirs(
+        self, sftp_client: SFTPClient, remote_dir: str, created_dirs: set[str]
+    ) -> None:
+        """
+        Create a remote directory and its missing parents. Directories already
+        known to exist are recorded in 'created_dirs' and skipped without a round
+        trip to the server.
+        """
+        if remote_dir in ("", "/") or remote_dir in created_dirs:
+            return
+
+        try:
+            sftp_client.stat(remote_dir)
+        except FileNotFoundError:
+            self.__make_remote_dirs(
+                sftp_client, posixpath.dirname(remote_dir), created_dirs
+            )
+            try:
+                sftp_client.mkdir(remote_dir)
+            except OSError:
+                # Another thread may have created it in the meantime
+                sftp_client.stat(remote_dir)
 
-        Returns:
-            str: The checksum of the file.
-        """
-        hash_func = hashlib.new(algorithm)
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
-        return hash_func.hexdigest()
+        created_dirs.add(remote_dir)
 
-    def __verify_upload(
-        self, local_file: str, remote_file: str, algorithm: str = "md5"
+    def upload(
+        self,
+        local_file: str,
+        remote_file: str,
+        algorithm: str = "md5",
+        allow_download: bool = False,
     ) -> bool:
         """
-        Verify that the file has been uploaded correctly by comparing checksums.
+        Upload a file to the SFTP server and verify the upload.
+
+        The local checksum is calculated while the file is uploaded, so the local
+        file is read only once. The remote file is then verified with the first
+        method the server supports:
+
+        1. A checksum calculated by the server through the 'check-file' SFTP
+           extension.
+        2. A checksum calculated by running the matching coreutils command, such
+           as 'md5sum' or 'sha256sum', over SSH.
+        3. If 'allow_download' is True, a checksum of the remote file downloaded
+           back over the SFTP channel.
+        4. Otherwise, only the size of the remote file, which catches truncated
+           uploads but not corrupted contents.
 
         Args:
             local_file (str): Path to the local file.
             remote_file (str): Path to the remote file on the server.
             algorithm (str): The hash algorithm to use (default is 'md5').
+            allow_download (bool): Download the remote file to verify it when the
+                server cannot calculate its checksum.
 
         Returns:
-            bool: True if the checksums match, False otherwise.
+            bool: True if the upload is successful and verified, False otherwise.
+                Without a checksum, True only means that the sizes match.
 
         Raises:
-            ValueError: If the SFTP connection is not established.
+            ValueError: If the SFTP connection is not established or 'algorithm'
+                is not supported.
         """
-        if not self.sftp_client:
-            raise ValueError("SFTP connection not established")
+        hash_func = hashlib.new(algorithm)
+
+        with self.session() as sftp_client:
+            transfer = self.__transfer(sftp_client)
+            transfer.write_file(local_file, remote_file, hash_func, confirm=False)
+            return transfer.verify_upload(
+                local_file,
+                remote_file,
+                hash_func.hexdigest(),
+                algorithm,
+                allow_download,
+            )
 
-        local_checksum = self.__calculate_checksum(local_file, algorithm)
+    def __transfer(self, sftp_client: SFTPClient) -> _SFTPTransfer:
+        """
+        Get the transfer helper of an SFTP channel of the pool.
+        """
+        return _SFTPTransfer(self.connection, sftp_client, self.transfer_config)
+
+    def __enter__(self) -> Self:
+        """
+        Connect to the SFTP server when entering a 'with' block.
 
-        with self.sftp_client.open(remote_file, "rb") as remote_f:
-            hash_func = hashlib.new(algorithm)
-            for chunk in iter(lambda: remote_f.read(4096), b""):
-                hash_func.update(chunk)
-            remote_checksum = hash_func.hexdigest()
+        Returns:
+            Self: SFTPDelivery instance.
+        """
+        self.connect()
+        return self
 
-        return local_checksum == remote_checksum
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close every SFTP channel and the SSH connection when leaving a 'with' block.
+        """
+        self.close()
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,553 @@
+import hashlib
+import os
+import shlex
+import string
+from typing import Any, Iterator, Optional
+
+import paramiko
+from paramiko import SFTPClient
+
+_CHECKSUM_COMMANDS = {
+    "md5": "md5sum",
+    "sha1": "sha1sum",
+    "sha224": "sha224sum",
+    "sha256": "sha256sum",
+    "sha384": "sha384sum",
+    "sha512": "sha512sum",
+}
+
+
+class SFTPTransferConfig:
+    """
+    SFTP transfer configuration class.
+
+    SFTP requests are answered one at a time unless they are pipelined, so on
+    links with high latency the throughput is bound by the round trip time rather
+    than by the bandwidth. Pipelined writes and prefetched reads keep several
+    requests in flight. The SSH window advertised by the client bounds the data
+    the server sends before waiting for an acknowledgement, so a larger window
+    speeds up downloads; uploads are bounded by the window of the server.
+
+    Attributes:
+        chunk_size (int): Bytes read from or written to a file at a time.
+        window_size (Optional[int]): SSH window size of the SFTP channels, in
+            bytes. Uses the paramiko default if None.
+        max_packet_size (Optional[int]): Maximum SSH packet size of the SFTP
+            channels, in bytes. Uses the paramiko default if None.
+        pipelined (bool): Send write requests without waiting for the server to
+            acknowledge the previous one.
+        prefetch (bool): Request the whole file in advance when reading it.
+        max_concurrent_requests (Optional[int]): Maximum read requests in flight
+            while prefetching. Unlimited if None.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 32768,
+        window_size: Optional[int] = None,
+        max_packet_size: Optional[int] = None,
+        pipelined: bool = True,
+        prefetch: bool = True,
+        max_concurrent_requests: Optional[int] = None,
+    ):
+        """
+        Initializes an instance of the SFTPTransferConfig class.
+
+        Args:
+            chunk_size (int): Bytes read from or written to a file at a time.
+            window_size (Optional[int]): SSH window size of the SFTP channels.
+            max_packet_size (Optional[int]): Maximum SSH packet size of the SFTP
+                channels.
+            pipelined (bool): Pipeline the write requests.
+            prefetch (bool): Prefetch the file when reading it.
+            max_concurrent_requests (Optional[int]): Maximum read requests in
+                flight while prefetching.
+        """
+        self.chunk_size = chunk_size
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
+        self.pipelined = pipelined
+        self.prefetch = prefetch
+        self.max_concurrent_requests = max_concurrent_requests
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Get the bytes read from or written to a file at a time.
+
+        Returns:
+            int: Chunk size in bytes.
+        """
+        return self.__chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int) -> None:
+        """
+        Set the bytes read from or written to a file at a time.
+
+        Args:
+            chunk_size (int): Chunk size in bytes.
+
+        Raises:
+            TypeError: If 'chunk_size' is not an integer.
+            ValueError: If 'chunk_size' is lower than 1.
+        """
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            raise TypeError("'chunk_size' must be an integer.")
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be at least 1.")
+        self.__chunk_size = chunk_size
+
+    @property
+    def window_size(self) -> Optional[int]:
+        """
+        Get the SSH window size of the SFTP channels.
+
+        Returns:
+            Optional[int]: Window size in bytes, or None for the paramiko default.
+        """
+        return self.__window_size
+
+    @window_size.setter
+    def window_size(self, window_size: Optional[int]) -> None:
+        """
+        Set the SSH window size of the SFTP channels.
+
+        Args:
+            window_size (Optional[int]): Window size in bytes, or None for the
+                paramiko default.
+
+        Raises:
+            TypeError: If 'window_size' is not an integer or None.
+            ValueError: If 'window_size' is not between 32768 and 2**32 - 1.
+        """
+        if window_size is not None and (
+            not isinstance(window_size, int) or isinstance(window_size, bool)
+        ):
+            raise TypeError("'window_size' must be an integer or None.")
+        if window_size is not None and not 2**15 <= window_size < 2**32:
+            raise ValueError("'window_size' must be between 32768 and 2**32 - 1.")
+        self.__window_size = window_size
+
+    @property
+    def max_packet_size(self) -> Optional[int]:
+        """
+        Get the maximum SSH packet size of the SFTP channels.
+
+        Returns:
+            Optional[int]: Maximum packet size in bytes, or None for the paramiko
+                default.
+        """
+        return self.__max_packet_size
+
+    @max_packet_size.setter
+    def max_packet_size(self, max_packet_size: Optional[int]) -> None:
+        """
+        Set the maximum SSH packet size of the SFTP channels.
+
+        Args:
+            max_packet_size (Optional[int]): Maximum packet size in bytes, or None
+                for the paramiko default.
+
+        Raises:
+            TypeError: If 'max_packet_size' is not an integer or None.
+            ValueError: If 'max_packet_size' is not between 4096 and 2**32 - 1.
+        """
+        if max_packet_size is not None and (
+            not isinstance(max_packet_size, int) or isinstance(max_packet_size, bool)
+        ):
+            raise TypeError("'max_packet_size' must be an integer or None.")
+        if max_packet_size is not None and not 2**12 <= max_packet_size < 2**32:
+            raise ValueError("'max_packet_size' must be between 4096 and 2**32 - 1.")
+        self.__max_packet_size = max_packet_size
+
+    @property
+    def pipelined(self) -> bool:
+        """
+        Get whether the write requests are pipelined.
+
+        Returns:
+            bool: True if the write requests are pipelined.
+        """
+        return self.__pipelined
+
+    @pipelined.setter
+    def pipelined(self, pipelined: bool) -> None:
+        """
+        Set whether the write requests are pipelined.
+
+        Args:
+            pipelined (bool): Pipeline the write requests.
+
+        Raises:
+            TypeError: If 'pipelined' is not a boolean.
+        """
+        if not isinstance(pipelined, bool):
+            raise TypeError("'pipelined' must be a boolean.")
+        self.__pipelined = pipelined
+
+    @property
+    def prefetch(self) -> bool:
+        """
+        Get whether files are prefetched when read.
+
+        Returns:
+            bool: True if files are prefetched.
+        """
+        return self.__prefetch
+
+    @prefetch.setter
+    def prefetch(self, prefetch: bool) -> None:
+        """
+        Set whether files are prefetched when read.
+
+        Args:
+            prefetch (bool): Prefetch the files.
+
+        Raises:
+            TypeError: If 'prefetch' is not a boolean.
+        """
+        if not isinstance(prefetch, bool):
+            raise TypeError("'prefetch' must be a boolean.")
+        self.__prefetch = prefetch
+
+    @property
+    def max_concurrent_requests(self) -> Optional[int]:
+        """
+        Get the maximum read requests in flight while prefetching.
+
+        Returns:
+            Optional[int]: Maximum read requests, or None if unlimited.
+        """
+        return self.__max_concurrent_requests
+
+    @max_concurrent_requests.setter
+    def max_concurrent_requests(self, max_concurrent_requests: Optional[int]) -> None:
+        """
+        Set the maximum read requests in flight while prefetching.
+
+        Args:
+            max_concurrent_requests (Optional[int]): Maximum read requests, or None
+                if unlimited.
+
+        Raises:
+            TypeError: If 'max_concurrent_requests' is not an integer or None.
+            ValueError: If 'max_concurrent_requests' is lower than 1.
+        """
+        if max_concurrent_requests is not None and (
+            not isinstance(max_concurrent_requests, int)
+            or isinstance(max_concurrent_requests, bool)
+        ):
+            raise TypeError("'max_concurrent_requests' must be an integer or None.")
+        if max_concurrent_requests is not None and max_concurrent_requests < 1:
+            raise ValueError("'max_concurrent_requests' must be at least 1.")
+        self.__max_concurrent_requests = max_concurrent_requests
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the SFTPTransferConfig instance.
+
+        Returns:
+            str: String representation of the SFTPTransferConfig instance.
+        """
+        return str(
+            {
+                "chunk_size": self.chunk_size,
+                "window_size": self.window_size,
+                "max_packet_size": self.max_packet_size,
+                "pipelined": self.pipelined,
+                "prefetch": self.prefetch,
+                "max_concurrent_requests": self.max_concurrent_requests,
+            }
+        )
+
+
+class _SFTPTransfer:
+    """
+    Transfers files over a single SFTP channel with the buffer sizes and pipelining
+    of an SFTPTransferConfig, and calculates the checksums used to verify and
+    resume the transfers.
+    """
+
+    def __init__(
+        self,
+        connection: paramiko.SSHClient,
+        sftp_client: SFTPClient,
+        config: SFTPTransferConfig,
+    ):
+        self.__connection = connection
+        self.__sftp_client = sftp_client
+        self.__config = config
+
+    def write_file(
+        self,
+        local_file: str,
+        remote_file: str,
+        hash_func: Optional[Any] = None,
+        confirm: bool = True,
+        offset: int = 0,
+    ) -> None:
+        """
+        Write a local file to the server in chunks of 'chunk_size', pipelining the
+        write requests if configured.
+
+        Args:
+            local_file (str): Path to the local file.
+            remote_file (str): Path to the remote file on the server.
+            hash_func (Optional[Any]): Hash object updated with every chunk.
+            confirm (bool): Check the size of the remote file once written.
+            offset (int): Position to start writing from, keeping the bytes of
+                the remote file before it. The remote file is truncated if 0.
+
+        Raises:
+            IOError: If 'confirm' is True and the size of the remote file differs
+                from the local one.
+        """
+        chunk_size = self.__config.chunk_size
+        size = offset
+
+        with open(local_file, "rb") as local_f, self.__sftp_client.open(
+            remote_file, "r+b" if offset else "wb"
+        ) as remote_f:
+            local_f.seek(offset)
+            remote_f.seek(offset)
+            remote_f.set_pipelined(self.__config.pipelined)
+            for chunk in iter(lambda: local_f.read(chunk_size), b""):
+                if hash_func is not None:
+                    hash_func.update(chunk)
+                remote_f.write(chunk)
+                size += len(chunk)
+
+        if not confirm:
+            return
+
+        remote_size = self.__sftp_client.stat(remote_file).st_size
+        if remote_size != size:
+            raise IOError(f"size mismatch in upload! {remote_size} != {size}")
+
+    def iter_chunks(self, remote_f: paramiko.SFTPFile) -> Iterator[bytes]:
+        """
+        Read an open remote file from its current position in chunks of
+        'chunk_size', prefetching the rest of the file if configured.
+
+        Args:
+            remote_f (paramiko.SFTPFile): Remote file opened for reading.
+
+        Yields:
+            bytes: Chunk of the remote file.
+        """
+        chunk_size = self.__config.chunk_size
+        if self.__config.prefetch:
+            remote_f.prefetch(
+                max_concurrent_requests=self.__config.max_concurrent_requests
+            )
+
+        yield from iter(lambda: remote_f.read(chunk_size), b"")
+
+    def get_resume_offset(
+        self,
+        local_file: str,
+        remote_file: str,
+        partial_size: int,
+        size: int,
+        allow_download: bool = False,
+    ) -> int:
+        """
+        Get the position an interrupted transfer can continue from.
+
+        The partial copy is kept only if it is not larger than the file and its
+        bytes match the start of the file, checked by comparing the checksum of
+        the prefix calculated by the server. If the server cannot calculate it, the
+        transfer starts over, unless 'allow_download' is True, in which case the
+        remote prefix is read back and compared byte by byte.
+
+        Args:
+            local_file (str): Path to the local file.
+            remote_file (str): Path to the remote file on the server.
+            partial_size (int): Size of the partial copy.
+            size (int): Size of the file being transferred.
+            allow_download (bool): Read the remote prefix back to verify it when
+                the server cannot calculate its checksum.
+
+        Returns:
+            int: Size of the partial copy if it can be kept, 0 otherwise.
+        """
+        if partial_size == 0 or partial_size > size:
+            return 0
+
+        remote_checksum = self.calculate_remote_checksum(
+            remote_file, "md5", length=partial_size
+        )
+        if remote_checksum is not None:
+            local_checksum = self.calculate_checksum(
+                local_file, "md5", length=partial_size
+            )
+            return partial_size if local_checksum == remote_checksum else 0
+
+        if allow_download and self.__matches_remote_prefix(
+            local_file, remote_file, partial_size
+        ):
+            return partial_size
+
+        return 0
+
+    def __matches_remote_prefix(
+        self, local_file: str, remote_file: str, length: int
+    ) -> bool:
+        """
+        Compare the first 'length' bytes of the local file with those of the
+        remote file, read back over the channel and prefetched if configured.
+        """
+        chunk_size = self.__config.chunk_size
+        remaining = length
+
+        with open(local_file, "rb") as local_f, self.__sftp_client.open(
+            remote_file, "rb"
+        ) as remote_f:
+            if self.__config.prefetch:
+                remote_f.prefetch(
+                    length,
+                    max_concurrent_requests=self.__config.max_concurrent_requests,
+                )
+            while remaining > 0:
+                chunk = remote_f.read(min(chunk_size, remaining))
+                if not chunk or chunk != local_f.read(len(chunk)):
+                    return False
+                remaining -= len(chunk)
+
+        return True
+
+    def calculate_checksum(
+        self, file_path: str, algorithm: str = "md5", length: Optional[int] = None
+    ) -> str:
+        """
+        Calculate the checksum of a local file.
+
+        Args:
+            file_path (str): Path to the file.
+            algorithm (str): The hash algorithm to use (default is 'md5').
+            length (Optional[int]): Number of bytes to hash from the start of the
+                file. The whole file is hashed if None.
+
+        Returns:
+            str: The checksum of the file.
+        """
+        hash_func = hashlib.new(algorithm)
+        chunk_size = self.__config.chunk_size
+        remaining = length
+
+        with open(file_path, "rb") as f:
+            while remaining is None or remaining > 0:
+                chunk = f.read(
+                    chunk_size if remaining is None else min(chunk_size, remaining)
+                )
+                if not chunk:
+                    break
+                hash_func.update(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+
+        return hash_func.hexdigest()
+
+    def verify_upload(
+        self,
+        local_file: str,
+        remote_file: str,
+        local_checksum: str,
+        algorithm: str = "md5",
+        allow_download: bool = False,
+    ) -> bool:
+        """
+        Verify that the file has been uploaded correctly by comparing its checksum
+        with the one of the remote file, or only its size if the remote checksum
+        cannot be calculated without downloading the file.
+
+        Args:
+            local_file (str): Path to the local file.
+            remote_file (str): Path to the remote file on the server.
+            local_checksum (str): Checksum of the local file.
+            algorithm (str): The hash algorithm to use (default is 'md5').
+            allow_download (bool): Download the remote file to calculate its
+                checksum when the server cannot calculate it.
+
+        Returns:
+            bool: True if the remote file matches the local one, False otherwise.
+                Without a checksum, True only means that the sizes match.
+        """
+        remote_checksum = self.calculate_remote_checksum(remote_file, algorithm)
+
+        if remote_checksum is None and allow_download:
+            with self.__sftp_client.open(remote_file, "rb") as remote_f:
+                hash_func = hashlib.new(algorithm)
+                for chunk in self.iter_chunks(remote_f):
+                    hash_func.update(chunk)
+                remote_checksum = hash_func.hexdigest()
+
+        if remote_checksum is not None:
+            return local_checksum == remote_checksum
+
+        remote_size = self.__sftp_client.stat(remote_file).st_size
+        return remote_size == os.path.getsize(local_file)
+
+    def calculate_remote_checksum(
+        self, remote_file: str, algorithm: str, length: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Ask the server for the checksum of a remote file, or of its first 'length'
+        bytes, first through the 'check-file' SFTP extension and then by running
+        the matching coreutils command over SSH.
+
+        Returns:
+            Optional[str]: Checksum of the remote file, or None if the server
+                cannot calculate it.
+        """
+        try:
+            with self.__sftp_client.open(remote_file, "rb") as remote_f:
+                return remote_f.check(algorithm, 0, length or 0).hex()
+        except (OSError, paramiko.SSHException):
+            # The 'check-file' extension is not supported by most servers
+            pass
+
+        if algorithm not in _CHECKSUM_COMMANDS:
+            return None
+
+        try:
+            output = self.__run_checksum_command(remote_file, algorithm, length)
+        except (OSError, paramiko.SSHException):
+            # The server does not allow running commands, like SFTP-only accounts
+            return None
+
+        if output is None:
+            return None
+
+        # coreutils prefixes the checksum with a backslash for escaped file names
+        checksum = output.split(" ", 1)[0].lstrip("\\").lower()
+        if len(checksum) != hashlib.new(algorithm).digest_size * 2 or any(
+            character not in string.hexdigits for character in checksum
+        ):
+            return None
+
+        return checksum
+
+    def __run_checksum_command(
+        self, remote_file: str, algorithm: str, length: Optional[int]
+    ) -> Optional[str]:
+        """
+        Run the coreutils checksum command of 'algorithm' over the remote file, or
+        over its first 'length' bytes.
+
+        Returns:
+            Optional[str]: Output of the command, or None if it failed.
+        """
+        remote_path = shlex.quote(self.__sftp_client.normalize(remote_file))
+        checksum_command = _CHECKSUM_COMMANDS[algorithm]
+        command = f"{checksum_command} -- {remote_path}"
+        if length is not None:
+            command = f"head -c {length} -- {remote_path} | {checksum_command}"
+
+        _, stdout, _ = self.__connection.exec_command(command)
+        output = stdout.read().decode(errors="replace")
+        if stdout.channel.recv_exit_status() != 0:
+            return None
+
+        return output
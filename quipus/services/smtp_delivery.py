@@ -1,10 +1,19 @@
 from email.mime.base import MIMEBase
+import base64
 import os
 import smtplib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
-from typing import Literal, Self, Optional
+from email.message import Message
+from typing import Iterable, Iterator, Literal, Self, Optional
+
+from ..utils import FileCache
 
 
 class SMTPConfig:
@@ -298,6 +307,121 @@ class SMTPConfig:
         )
 
 
+def _mark_as_base64(attachment: MIMEBase) -> None:
+    """
+    Encoder for attachments whose payload is already base64-encoded.
+
+    Args:
+        attachment (MIMEBase): Attachment.
+    """
+    attachment["Content-Transfer-Encoding"] = "base64"
+
+
+class LazyFileAttachment(MIMEApplication):
+    """
+    Attachment whose content is read from disk only when the message is sent.
+
+    When a message containing lazy attachments is sent with 'EmailSender', the
+    files are read and base64-encoded chunk by chunk straight into the SMTP
+    connection, so neither the file nor the encoded message is ever held in
+    memory as a whole. Serializing the message with 'as_string' is still
+    supported, in which case the file is read and encoded on demand.
+
+    Attributes:
+        path (str): Path to the attached file.
+    """
+
+    # Multiple of 57 bytes, so that each chunk encodes to whole 76-character lines
+    CHUNK_SIZE: int = 57 * 1024
+
+    def __init__(self, path: str, subtype: str = "octet-stream"):
+        """
+        Initializes an instance of the LazyFileAttachment class.
+
+        Args:
+            path (str): Path to the attached file.
+            subtype (str): MIME subtype of the attachment.
+
+        Raises:
+            TypeError: If 'path' is not a string.
+            ValueError: If 'path' is an empty string.
+            FileNotFoundError: If the file at 'path' does not exist.
+        """
+        if not isinstance(path, str):
+            raise TypeError(
+                "'path' must be a string.",
+                f"Current type: {type(path)}.",
+            )
+
+        if not path.strip():
+            raise ValueError("'path' cannot be an empty string.")
+
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Attachment path '{path}' does not exist.")
+
+        super().__init__(b"", _subtype=subtype)
+        self.__path = path
+
+    @property
+    def path(self) -> Optional[str]:
+        """
+        Get the path to the attached file.
+
+        Returns:
+            Optional[str]: Path to the file, or None if the payload was replaced.
+        """
+        return self.__path
+
+    @property
+    def _payload(self) -> Optional[str]:
+        """
+        Get the base64-encoded content of the file, read on demand.
+
+        Returns:
+            Optional[str]: Encoded payload.
+        """
+        if self.__path is None:
+            return self.__payload
+
+        return b"".join(self.iter_encoded()).decode("ascii")
+
+    @_payload.setter
+    def _payload(self, value: Optional[str]) -> None:
+        """
+        Replace the payload, detaching the attachment from its file.
+
+        Args:
+            value (Optional[str]): New payload.
+        """
+        self.__path = None
+        self.__payload = value
+
+    def is_multipart(self) -> bool:
+        """
+        Get whether the attachment is multipart, which it never is. Overridden so
+        that walking the message does not read the file.
+
+        Returns:
+            bool: False.
+        """
+        return False
+
+    def iter_encoded(self, linesep: bytes = b"\n") -> Iterator[bytes]:
+        """
+        Read the file in chunks and yield them base64-encoded.
+
+        Args:
+            linesep (bytes): Line separator of the encoded lines.
+
+        Yields:
+            bytes: Encoded lines of the file, each one ended by 'linesep'.
+        """
+        with open(self.__path, "rb") as attachment_file:
+            while chunk := attachment_file.read(self.CHUNK_SIZE):
+                encoded = base64.encodebytes(chunk)
+                yield encoded if linesep == b"\n" else encoded.replace(b"\n", linesep)
+
+
 class EmailMessageBuilder:
     """
     Email message builder class.
@@ -311,6 +435,8 @@ class EmailMessageBuilder:
         body_type (Literal["html", "plain"]): Email body type.
         attachments (list[tuple[MIMEBase, Optional[str]]]): Email attachments.
         custom_headers (Optional[dict[str, str]]): Email custom headers.
+        attachment_cache (Optional[FileCache]): Cache of encoded attachments,
+            usually shared by the builders of a whole mailing.
     """
 
     __SUPPORTED_BODY_TYPES: list[str] = ["plain", "html"]
@@ -331,6 +457,7 @@ class EmailMessageBuilder:
         self.body_type = "plain"
         self.attachments = []
         self.custom_headers = {}
+        self.attachment_cache = None
 
     @property
     def from_address(self) -> str:
@@ -620,6 +747,66 @@ class EmailMessageBuilder:
 
         self.__custom_headers = custom_headers
 
+    @property
+    def attachment_cache(self) -> Optional[FileCache]:
+        """
+        Get the cache of encoded attachments.
+
+        Returns:
+            Optional[FileCache]: Cache of encoded attachments, or None.
+        """
+        return self.__attachment_cache
+
+    @attachment_cache.setter
+    def attachment_cache(self, attachment_cache: Optional[FileCache]) -> None:
+        """
+        Set the cache of encoded attachments.
+
+        Args:
+            attachment_cache (Optional[FileCache]): Cache of encoded attachments,
+                or None to encode every attachment again.
+
+        Raises:
+            TypeError: If 'attachment_cache' is not a FileCache or None.
+        """
+        if attachment_cache is not None and not isinstance(attachment_cache, FileCache):
+            raise TypeError(
+                "'attachment_cache' must be an instance of FileCache or None.",
+                f"Current type: {type(attachment_cache)}.",
+            )
+
+        self.__attachment_cache = attachment_cache
+
+    def with_attachment_cache(self, attachment_cache: FileCache) -> Self:
+        """
+        Share a cache of encoded attachments with other builders, so that a file
+        attached to many messages is read and base64-encoded only once. Entries
+        are keyed by path and refreshed when the modification time or the size of
+        the file change. Lazy attachments are not cached.
+
+        Args:
+            attachment_cache (FileCache): Cache of encoded attachments.
+
+        Returns:
+            Self: EmailMessageBuilder instance.
+
+        ## Usage:
+
+        ```python
+        attachment_cache = FileCache(max_size=64 * 1024 * 1024)
+
+        for recipient in recipients:
+            email_message = (
+                EmailMessageBuilder("sender@example.com", [recipient])
+                .with_attachment_cache(attachment_cache)
+                .add_attachment_from_path("path/to/brochure.pdf")
+                .build()
+            )
+        ```
+        """
+        self.attachment_cache = attachment_cache
+        return self
+
     def add_recipient(self, to_address: str) -> Self:
         """
         Add a recipient to the email message.
@@ -765,10 +952,30 @@ class EmailMessageBuilder:
                 f"Attachment path '{attachment_path}' does not exist."
             )
 
+        if self.attachment_cache is None:
+            payload, _ = self.__encode_attachment(attachment_path)
+        else:
+            payload = self.attachment_cache.get(
+                attachment_path, self.__encode_attachment
+            )
+
+        return MIMEApplication(payload, _encoder=_mark_as_base64)
+
+    @staticmethod
+    def __encode_attachment(attachment_path: str) -> tuple[str, int]:
+        """
+        Read an attachment and encode it in base64.
+
+        Args:
+            attachment_path (str): Attachment path.
+
+        Returns:
+            tuple[str, int]: Encoded payload and its size in bytes.
+        """
         with open(attachment_path, "rb") as attachment_file:
-            attachment = MIMEApplication(attachment_file.read())
+            payload = MIMEApplication(attachment_file.read()).get_payload()
 
-        return attachment
+        return payload, len(payload)
 
     def add_attachment(
         self, attachment: MIMEBase, filename: Optional[str] = None
@@ -807,7 +1014,7 @@ class EmailMessageBuilder:
         return self
 
     def add_attachment_from_path(
-        self, attachment_path: str, filename: Optional[str] = None
+        self, attachment_path: str, filename: Optional[str] = None, lazy: bool = False
     ) -> Self:
         """
         Add an attachment to the email message from a file path.
@@ -815,6 +1022,8 @@ class EmailMessageBuilder:
         Args:
             attachment_path (str): Attachment path.
             filename (Optional[str]): Attachment filename.
+            lazy (bool): Read the file only when the message is sent, streaming
+                it to the server instead of loading it in memory.
 
         Returns:
             Self: EmailMessageBuilder instance.
@@ -822,8 +1031,20 @@ class EmailMessageBuilder:
         Raises:
             TypeError: If 'attachment_path' is not a string.
             ValueError: If 'attachment_path' is an empty string.
+            TypeError: If 'lazy' is not a boolean.
         """
-        attachment = self.__convert_attachment_path_to_mime_application(attachment_path)
+        if not isinstance(lazy, bool):
+            raise TypeError(
+                "'lazy' must be a boolean.",
+                f"Current type: {type(lazy)}.",
+            )
+
+        if lazy:
+            attachment = LazyFileAttachment(attachment_path)
+        else:
+            attachment = self.__convert_attachment_path_to_mime_application(
+                attachment_path
+            )
 
         if filename is None:
             filename = os.path.basename(attachment_path)
@@ -946,33 +1167,421 @@ class EmailMessageBuilder:
         )
 
 
+def _has_lazy_parts(email_message: Message) -> bool:
+    """
+    Check whether a message contains attachments read at send time.
+
+    Args:
+        email_message (Message): Email message.
+
+    Returns:
+        bool: True if any part is a LazyFileAttachment.
+    """
+    return any(isinstance(part, LazyFileAttachment) for part in email_message.walk())
+
+
+def _iter_message_data(email_message: Message) -> Iterator[bytes]:
+    """
+    Serialize a message as the content of an SMTP DATA command, with CRLF line
+    endings and dot-stuffing, ended by CRLF and without the final '.' line.
+
+    Lazy attachments are encoded chunk by chunk as they are yielded, while the
+    rest of the parts are serialized one at a time, so the full message is never
+    built in memory.
+
+    Args:
+        email_message (Message): Email message.
+
+    Yields:
+        bytes: Consecutive chunks of the DATA content.
+    """
+    if not _has_lazy_parts(email_message):
+        data = smtplib.quotedata(email_message.as_string()).encode("utf-8")
+        yield data if data.endswith(b"\r\n") else data + b"\r\n"
+        return
+
+    policy = email_message.policy.clone(linesep="\r\n")
+
+    def quote(text: str) -> bytes:
+        data = smtplib.quotedata(text).encode("utf-8")
+        return data if data.endswith(b"\r\n") else data + b"\r\n"
+
+    def headers(part: Message) -> bytes:
+        folded = "".join(policy.fold(name, value) for name, value in part.raw_items())
+        return quote(folded) + b"\r\n"
+
+    def serialize(part: Message) -> Iterator[bytes]:
+        if isinstance(part, LazyFileAttachment) and part.path is not None:
+            yield headers(part)
+            yield from part.iter_encoded(linesep=b"\r\n")
+        elif part.get_content_maintype() == "multipart" and part.is_multipart():
+            boundary = part.get_boundary()
+            if boundary is None:
+                boundary = f"==============={uuid.uuid4().hex}=="
+                part.set_boundary(boundary)
+
+            yield headers(part)
+            if part.preamble:
+                yield quote(part.preamble)
+
+            for subpart in part.get_payload():
+                yield f"--{boundary}\r\n".encode("ascii")
+                yield from serialize(subpart)
+
+            yield f"--{boundary}--\r\n".encode("ascii")
+            if part.epilogue:
+                yield quote(part.epilogue)
+        else:
+            yield quote(part.as_string(policy=policy))
+
+    yield from serialize(email_message)
+
+
+def _get_recipients(email_message: MIMEMultipart) -> list[str]:
+    """
+    Get the addresses a message must be delivered to, from its 'To' and 'Cc'
+    headers.
+
+    Args:
+        email_message (MIMEMultipart): Email message.
+
+    Returns:
+        list[str]: Recipient addresses.
+    """
+    to_addrs = []
+    for header in ["To", "Cc"]:
+        addresses = email_message.get_all(header, [])
+        if addresses:
+            for addr in addresses[0].split(","):
+                if addr.strip():
+                    to_addrs.append(addr.strip())
+
+    return to_addrs
+
+
+@dataclass(frozen=True)
+class SendResult:
+    """
+    Outcome of sending a single message with 'EmailSender.send_many'.
+
+    Attributes:
+        index (int): Position of the message in the batch.
+        refused (dict[str, tuple[int, bytes]]): Recipients refused by the server.
+        error (Optional[str]): Error message if the message could not be sent.
+    """
+
+    index: int
+    refused: dict[str, tuple[int, bytes]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def accepted(self) -> bool:
+        """
+        Get whether the server accepted the message for at least one recipient.
+
+        Returns:
+            bool: True if the message was sent.
+        """
+        return self.error is None
+
+
+class _RateLimiter:
+    """
+    Thread-safe limiter that spaces calls to 'acquire' so that no more than 'rate'
+    of them happen per second.
+    """
+
+    def __init__(self, rate: Optional[float]):
+        self.__interval = 1 / rate if rate else 0.0
+        self.__next_slot = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until the next slot is available.
+        """
+        if not self.__interval:
+            return
+
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(self.__next_slot, now)
+            self.__next_slot = slot + self.__interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _SMTPSession:
+    """
+    Persistent, authenticated connection to an SMTP server.
+
+    The connection is opened on the first message, reopened if the server drops
+    it, and rotated after 'max_messages' messages. A session must only be used by
+    one thread at a time.
+    """
+
+    def __init__(self, smtp_config: SMTPConfig, max_messages: Optional[int] = None):
+        self.__smtp_config = smtp_config
+        self.__max_messages = max_messages
+        self.__server: Optional[smtplib.SMTP] = None
+        self.__sent = 0
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Get whether the session currently holds a connection.
+
+        Returns:
+            bool: True if the session is connected.
+        """
+        return self.__server is not None
+
+    def open(self) -> None:
+        """
+        Connect and authenticate to the SMTP server.
+        """
+        if self.__smtp_config.use_ssl:
+            server = smtplib.SMTP_SSL(
+                self.__smtp_config.server,
+                self.__smtp_config.port,
+                timeout=self.__smtp_config.timeout,
+            )
+        else:
+            server = smtplib.SMTP(
+                self.__smtp_config.server,
+                self.__smtp_config.port,
+                timeout=self.__smtp_config.timeout,
+            )
+
+            if self.__smtp_config.use_tls:
+                server.starttls()
+
+        server.login(
+            self.__smtp_config.username,
+            self.__smtp_config.password,
+        )
+
+        self.__server = server
+        self.__sent = 0
+
+    def close(self) -> None:
+        """
+        Close the connection, if any.
+        """
+        server, self.__server = self.__server, None
+        if server is None:
+            return
+
+        try:
+            server.quit()
+        except smtplib.SMTPServerDisconnected:
+            server.close()
+
+    def send(self, email_message: MIMEMultipart) -> dict[str, tuple[int, bytes]]:
+        """
+        Send a message over the session, connecting or rotating the connection
+        first if needed. If the server dropped the connection, the session
+        reconnects and retries the message once.
+
+        Args:
+            email_message (MIMEMultipart): Email message.
+
+        Returns:
+            dict[str, tuple[int, bytes]]: Recipients refused by the server.
+        """
+        if self.__max_messages is not None and self.__sent >= self.__max_messages:
+            self.close()
+
+        if self.__server is None:
+            self.open()
+
+        try:
+            refused = self.__sendmail(email_message)
+        except smtplib.SMTPServerDisconnected:
+            self.__server = None
+            self.open()
+            refused = self.__sendmail(email_message)
+
+        self.__sent += 1
+        return refused or {}
+
+    def __sendmail(self, email_message: MIMEMultipart) -> dict[str, tuple[int, bytes]]:
+        """
+        Send a message over the current connection.
+        """
+        if _has_lazy_parts(email_message):
+            return self.__stream(email_message)
+
+        return self.__server.sendmail(
+            email_message["From"],
+            _get_recipients(email_message),
+            email_message.as_string(),
+        )
+
+    def __stream(self, email_message: MIMEMultipart) -> dict[str, tuple[int, bytes]]:
+        """
+        Send a message writing its content to the connection chunk by chunk,
+        mirroring the checks done by 'smtplib.SMTP.sendmail'.
+        """
+        server = self.__server
+        server.ehlo_or_helo_if_needed()
+
+        from_addr = email_message["From"]
+        code, reply = server.mail(from_addr)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, reply, from_addr)
+
+        to_addrs = _get_recipients(email_message)
+        refused = {}
+        for to_addr in to_addrs:
+            code, reply = server.rcpt(to_addr)
+            if code not in (250, 251):
+                refused[to_addr] = (code, reply)
+
+        if len(refused) == len(to_addrs):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        server.putcmd("data")
+        code, reply = server.getreply()
+        if code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(code, reply)
+
+        for chunk in _iter_message_data(email_message):
+            server.send(chunk)
+
+        server.send(b".\r\n")
+        code, reply = server.getreply()
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPDataError(code, reply)
+
+        return refused
+
+
 class EmailSender:
     """
     Email sender class.
 
+    Used as a context manager, the sender keeps a single authenticated connection
+    open and sends every message over it, reconnecting if the server drops the
+    connection and rotating it after 'max_messages_per_connection' messages.
+    Outside of a context, every call to 'send' opens and closes its own connection.
+
     Attributes:
         smtp_config (SMTPConfig): SMTP configuration.
+        max_messages_per_connection (Optional[int]): Messages sent over a
+            connection before it is replaced. Unlimited if None.
     """
 
     def __init__(
         self,
         smtp_config: SMTPConfig,
+        max_messages_per_connection: Optional[int] = None,
     ):
         """
         Initializes an instance of the EmailSender class.
 
         Args:
             smtp_config (SMTPConfig): SMTP configuration.
+            max_messages_per_connection (Optional[int]): Messages sent over a
+                connection before it is replaced. Unlimited if None.
         """
         self.smtp_config = smtp_config
+        self.max_messages_per_connection = max_messages_per_connection
+        self.__session: Optional[_SMTPSession] = None
+
+    @property
+    def max_messages_per_connection(self) -> Optional[int]:
+        """
+        Get the number of messages sent over a connection before it is replaced.
+
+        Returns:
+            Optional[int]: Messages per connection, or None if unlimited.
+        """
+        return self.__max_messages_per_connection
 
-    def send(self, email_message: MIMEMultipart) -> None:
+    @max_messages_per_connection.setter
+    def max_messages_per_connection(self, value: Optional[int]) -> None:
+        """
+        Set the number of messages sent over a connection before it is replaced.
+
+        Args:
+            value (Optional[int]): Messages per connection, or None if unlimited.
+
+        Raises:
+            TypeError: If 'value' is not an integer or None.
+            ValueError: If 'value' is less than 1.
+        """
+        if value is None:
+            self.__max_messages_per_connection = value
+            return
+
+        if not isinstance(value, int):
+            raise TypeError(
+                "'max_messages_per_connection' must be an integer or None.",
+                f"Current type: {type(value)}.",
+            )
+
+        if value < 1:
+            raise ValueError(
+                "'max_messages_per_connection' must be greater than 0.",
+                f"Current value: {value}.",
+            )
+
+        self.__max_messages_per_connection = value
+
+    def open(self) -> Self:
+        """
+        Open a persistent connection used by every following call to 'send'.
+
+        Returns:
+            Self: EmailSender instance.
+        """
+        if self.__session is None:
+            self.__session = _SMTPSession(
+                self.smtp_config, self.max_messages_per_connection
+            )
+            self.__session.open()
+
+        return self
+
+    def close(self) -> None:
+        """
+        Close the persistent connection, if any.
+        """
+        if self.__session is not None:
+            self.__session.close()
+            self.__session = None
+
+    def __enter__(self) -> Self:
+        """
+        Open the persistent connection when entering a context.
+
+        Returns:
+            Self: EmailSender instance.
+        """
+        return self.open()
+
+    def __exit__(self, *args) -> None:
+        """
+        Close the persistent connection when leaving a context.
+        """
+        self.close()
+
+    def send(self, email_message: MIMEMultipart) -> dict[str, tuple[int, bytes]]:
         """
         Send an email message.
 
         Args:
             email_message (MIMEMultipart): Email message.
 
+        Returns:
+            dict[str, tuple[int, bytes]]: Recipients refused by the server.
+
         Raises:
             smtplib.SMTPException: If an error occurs while sending the email.
 
@@ -999,42 +1608,159 @@ class EmailSender:
 
         email_sender = EmailSender(smtp_config)
         email_sender.send(email_message)
+
+        # Reuse a single connection for many messages
+        with EmailSender(smtp_config, max_messages_per_connection=100) as sender:
+            for email_message in email_messages:
+                sender.send(email_message)
         ```
         """
-        if self.smtp_config.use_ssl:
-            server = smtplib.SMTP_SSL(
-                self.smtp_config.server,
-                self.smtp_config.port,
-                timeout=self.smtp_config.timeout,
+        if self.__session is not None:
+            return self.__session.send(email_message)
+
+        session = _SMTPSession(self.smtp_config)
+        try:
+            return session.send(email_message)
+        finally:
+            session.close()
+
+    def send_many(
+        self,
+        messages: Iterable[MIMEMultipart],
+        concurrency: int = 1,
+        rate_per_connection: Optional[float] = None,
+        rate_limit: Optional[float] = None,
+    ) -> list[SendResult]:
+        """
+        Send a batch of email messages over 'concurrency' connections, each one
+        used by its own thread. A message that fails is reported in its result
+        and does not stop the rest of the batch.
+
+        Args:
+            messages (Iterable[MIMEMultipart]): Email messages.
+            concurrency (int): Number of connections, and threads, used.
+            rate_per_connection (Optional[float]): Maximum messages per second sent
+                over each connection. Unlimited if None.
+            rate_limit (Optional[float]): Maximum messages per second sent across
+                all connections. Unlimited if None.
+
+        Returns:
+            list[SendResult]: Result of every message, in the order of 'messages'.
+
+        Raises:
+            TypeError: If 'concurrency' is not an integer or any rate is not a
+                number or None.
+            ValueError: If 'concurrency' or any rate is not greater than 0.
+
+        ## Usage:
+
+        ```python
+        results = EmailSender(smtp_config).send_many(
+            email_messages, concurrency=4, rate_per_connection=5, rate_limit=15
+        )
+        failed = [result for result in results if not result.accepted]
+        ```
+        """
+        if not isinstance(concurrency, int) or isinstance(concurrency, bool):
+            raise TypeError(
+                "'concurrency' must be an integer.",
+                f"Current type: {type(concurrency)}.",
             )
-        else:
-            server = smtplib.SMTP(
-                self.smtp_config.server,
-                self.smtp_config.port,
-                timeout=self.smtp_config.timeout,
+
+        if concurrency < 1:
+            raise ValueError(
+                "'concurrency' must be greater than 0.",
+                f"Current value: {concurrency}.",
             )
 
-            if self.smtp_config.use_tls:
-                server.starttls()
+        for name, rate in [
+            ("rate_per_connection", rate_per_connection),
+            ("rate_limit", rate_limit),
+        ]:
+            if rate is None:
+                continue
 
-        server.login(
-            self.smtp_config.username,
-            self.smtp_config.password,
-        )
+            if not isinstance(rate, (int, float)) or isinstance(rate, bool):
+                raise TypeError(
+                    f"'{name}' must be a number or None.",
+                    f"Current type: {type(rate)}.",
+                )
 
-        to_addrs = []
-        for header in ["To", "Cc"]:
-            addresses = email_message.get_all(header, [])
-            if addresses:
-                for addr in addresses[0].split(","):
-                    to_addrs.append(addr.strip())
+            if rate <= 0:
+                raise ValueError(
+                    f"'{name}' must be greater than 0.",
+                    f"Current value: {rate}.",
+                )
 
-        server.sendmail(
-            email_message["From"],
-            to_addrs,
-            email_message.as_string(),
-        )
-        server.quit()
+        pending = enumerate(messages)
+        pending_lock = threading.Lock()
+        global_limiter = _RateLimiter(rate_limit)
+        results: list[SendResult] = []
+
+        def worker() -> None:
+            session = _SMTPSession(self.smtp_config, self.max_messages_per_connection)
+            limiter = _RateLimiter(rate_per_connection)
+
+            try:
+                while True:
+                    with pending_lock:
+                        index, message = next(pending, (None, None))
+
+                    if index is None:
+                        return
+
+                    limiter.acquire()
+                    global_limiter.acquire()
+                    results.append(self.__send_in_session(session, index, message))
+            finally:
+                self.__close_quietly(session)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(worker) for _ in range(concurrency)]
+
+        for future in futures:
+            future.result()
+
+        return sorted(results, key=lambda result: result.index)
+
+    @classmethod
+    def __send_in_session(
+        cls, session: _SMTPSession, index: int, message: MIMEMultipart
+    ) -> SendResult:
+        """
+        Send a message of a batch, turning any error into its result.
+
+        Args:
+            session (_SMTPSession): Session owned by the calling thread.
+            index (int): Position of the message in the batch.
+            message (MIMEMultipart): Email message.
+
+        Returns:
+            SendResult: Outcome of sending the message.
+        """
+        try:
+            return SendResult(index=index, refused=session.send(message))
+        except smtplib.SMTPRecipientsRefused as error:
+            return SendResult(index=index, refused=error.recipients, error=repr(error))
+        except (smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as error:
+            return SendResult(index=index, error=repr(error))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # The state of the connection is unknown, start over on the next one
+            cls.__close_quietly(session)
+            return SendResult(index=index, error=repr(error))
+
+    @staticmethod
+    def __close_quietly(session: _SMTPSession) -> None:
+        """
+        Close a session, ignoring any error raised by a broken connection.
+
+        Args:
+            session (_SMTPSession): Session to close.
+        """
+        try:
+            session.close()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
 
     def __str__(self) -> str:
         """
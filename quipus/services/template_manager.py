@@ -1,8 +1,167 @@
 import os
-from typing import Any, Callable, Literal, Self
-from weasyprint import HTML
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Self
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 from ..models import Template
 from ..data_sources import CSVDataSource
+from .s3_delivery import S3Delivery
+
+# (record index, template index, record, filename, error resolving the template or
+# filename, in which case the template index is None)
+_RenderJob = tuple[int, Optional[int], dict[str, Any], str, Optional[str]]
+
+# Limits of the images decoded by WeasyPrint that a renderer keeps between records
+_IMAGE_CACHE_MAX_ENTRIES = 256
+_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """
+    Outcome of rendering a single record to PDF.
+
+    Attributes:
+        index (int): Position of the record in the data.
+        filename (str): Name of the generated file, without the extension.
+        error (Optional[str]): Error message if the record could not be rendered.
+    """
+
+    index: int
+    filename: str
+    error: Optional[str] = None
+
+
+class _PDFRenderer:
+    """
+    Renders records with a fixed list of templates, keeping the state that can be
+    shared between records alive for the whole batch: a single FontConfiguration,
+    the compiled stylesheet of each template and the decoded images.
+
+    WeasyPrint never evicts the images it caches, so records with images of their
+    own, like photos or QR codes, would make the cache grow with every record. The
+    cache is cleared between records once it holds more than 'max_cached_images'
+    entries or 'max_cached_image_bytes' bytes of image data.
+    """
+
+    def __init__(
+        self,
+        templates: list[Template],
+        max_cached_images: int = _IMAGE_CACHE_MAX_ENTRIES,
+        max_cached_image_bytes: int = _IMAGE_CACHE_MAX_BYTES,
+    ):
+        self.__templates = templates
+        self.__font_config = FontConfiguration()
+        self.__stylesheets: dict[int, list[CSS]] = {}
+        self.__image_cache: dict[str, Any] = {}
+        self.__max_cached_images = max_cached_images
+        self.__max_cached_image_bytes = max_cached_image_bytes
+
+    def __get_stylesheets(self, template_index: int) -> list[CSS]:
+        """
+        Get the compiled stylesheets of a template, parsing its CSS file the first
+        time the template is used.
+        """
+        if template_index not in self.__stylesheets:
+            template = self.__templates[template_index]
+            self.__stylesheets[template_index] = (
+                [
+                    CSS(
+                        filename=template.css_path,
+                        font_config=self.__font_config,
+                        url_fetcher=template.url_fetcher,
+                    )
+                ]
+                if template.css_path
+                else []
+            )
+
+        return self.__stylesheets[template_index]
+
+    def render(self, template_index: int, item: dict[str, Any], target: Any) -> Any:
+        """
+        Render a record with the template at 'template_index' into 'target'.
+
+        Returns:
+            Any: The PDF bytes if 'target' is None, None otherwise.
+        """
+        template = self.__templates[template_index]
+        html = HTML(
+            string=template.render_html_with_values(values=item),
+            base_url=template.html_path,
+            url_fetcher=template.url_fetcher,
+        )
+        try:
+            return html.write_pdf(
+                target=target,
+                stylesheets=self.__get_stylesheets(template_index),
+                font_config=self.__font_config,
+                cache=self.__image_cache,
+            )
+        finally:
+            self.__trim_image_cache()
+
+    def __trim_image_cache(self) -> None:
+        """
+        Clear the image cache if it outgrew its limits. WeasyPrint stores an image
+        and its data under different keys and reads the data back while writing
+        the PDF, so entries cannot be evicted one by one and the whole cache is
+        cleared, only between records.
+        """
+        cache = self.__image_cache
+        if len(cache) > self.__max_cached_images or (
+            sum(len(value) for value in cache.values() if isinstance(value, bytes))
+            > self.__max_cached_image_bytes
+        ):
+            cache.clear()
+
+
+_WORKER_STATE: dict[str, _PDFRenderer] = {}
+
+
+def _init_render_worker(templates: list[Template]) -> None:
+    """
+    Build the renderer of a worker process once, before it receives any chunk.
+    """
+    _WORKER_STATE["renderer"] = _PDFRenderer(templates)
+
+
+def _render_jobs(
+    renderer: _PDFRenderer, output_path: str, jobs: Iterable[_RenderJob]
+) -> Iterator[RenderResult]:
+    """
+    Render records to PDF files inside 'output_path'.
+
+    Errors are captured per record so a single bad record does not stop the rest
+    of the records.
+    """
+    for index, template_index, item, filename, error in jobs:
+        if error is not None:
+            yield RenderResult(index=index, filename=filename, error=error)
+            continue
+
+        try:
+            renderer.render(
+                template_index, item, target=f"{output_path}/{filename}.pdf"
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            yield RenderResult(index=index, filename=filename, error=repr(error))
+        else:
+            yield RenderResult(index=index, filename=filename)
+
+
+def _render_chunk(output_path: str, jobs: list[_RenderJob]) -> list[RenderResult]:
+    """
+    Render a chunk of records inside a worker process.
+    """
+    return list(_render_jobs(_WORKER_STATE["renderer"], output_path, jobs))
 
 
 class TemplateManager:
@@ -12,13 +171,18 @@ class TemplateManager:
         self.templates = []
         self.decide_template_func = None
         self.decide_filename_func = None
+        self.__renderer: Optional[tuple[list[Template], _PDFRenderer]] = None
 
     @property
-    def data(self) -> list[dict[str, Any]]:
+    def data(self) -> list[dict[str, Any]] | Iterator[dict[str, Any]]:
         return self.__data
 
     @data.setter
-    def data(self, value: list[dict[str, Any]]):
+    def data(self, value: list[dict[str, Any]] | Iterator[dict[str, Any]]):
+        if isinstance(value, Iterator):
+            self.__data = self.__validate_records(value)
+            return
+
         if not isinstance(value, list):
             raise TypeError(
                 "'value' must be a list of dictionary with string keys.",
@@ -31,6 +195,19 @@ class TemplateManager:
 
         self.__data = value
 
+    @staticmethod
+    def __validate_records(
+        records: Iterator[dict[str, Any]],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Validate the keys of streamed records as they are consumed, so the stream
+        is never materialized.
+        """
+        for item in records:
+            if not all(isinstance(k, str) for k in item.keys()):
+                raise TypeError("All keys in the dictionary must be a string.")
+            yield item
+
     @property
     def templates(self) -> list[Template]:
         return self.__templates
@@ -91,8 +268,50 @@ class TemplateManager:
 
         return self
 
-    def from_csv(self, path_to_file: str) -> Self:
-        csv_data_source = CSVDataSource(file_path=path_to_file)
+    def from_csv(
+        self,
+        path_to_file: str,
+        stream: bool = False,
+        chunk_size: int = 10_000,
+        columns: Optional[list[str]] = None,
+    ) -> Self:
+        """
+        Load the records to render from a CSV file.
+
+        With 'stream' enabled the file is read in chunks of 'chunk_size' rows while
+        'to_pdf' consumes the records, so memory stays bounded by the chunk size
+        and rendering starts before the whole file has been read. The streamed
+        records can only be iterated once.
+
+        Args:
+            path_to_file (str): Path to the CSV file.
+            stream (bool): Read the file lazily instead of loading it at once.
+            chunk_size (int): Number of rows read at once when streaming.
+            columns (Optional[list[str]]): Columns to read. All columns if None.
+
+        Returns:
+            Self: TemplateManager instance.
+        """
+        if not isinstance(stream, bool):
+            raise TypeError(
+                "'stream' must be a boolean.",
+                f"Current type: {type(stream)}.",
+            )
+
+        csv_data_source = CSVDataSource(
+            file_path=path_to_file, lazy=stream, usecols=columns
+        )
+
+        if stream:
+            if not isinstance(chunk_size, int) or chunk_size < 1:
+                raise ValueError(
+                    "'chunk_size' must be a positive integer.",
+                    f"Current value: {chunk_size}.",
+                )
+
+            self.data = csv_data_source.iter_records(chunk_size)
+            return self
+
         self.data = csv_data_source.fetch_data().to_dict(orient="records")
 
         return self
@@ -125,7 +344,39 @@ class TemplateManager:
 
         return self
 
-    def to_pdf(self, output_path: str, create_dir: bool = False) -> Self:
+    def to_pdf(
+        self,
+        output_path: str,
+        create_dir: bool = False,
+        workers: int = 1,
+        chunk_size: int = 100,
+        on_progress: Optional[Callable[[RenderResult], None]] = None,
+    ) -> Self:
+        """
+        Render every record in 'data' to a PDF file inside 'output_path'.
+
+        With 'workers' greater than 1 the records are split in chunks of
+        'chunk_size' and rendered in a process pool. Each worker process builds its
+        renderer once and reuses it for every chunk it receives. Whatever the
+        number of workers, failed records, including those whose template or
+        filename cannot be resolved, do not stop the batch; they are reported
+        through 'on_progress' and a RuntimeError listing them is raised once every
+        record has been processed.
+
+        Args:
+            output_path (str): Directory where the PDF files are written.
+            create_dir (bool): Create 'output_path' if it does not exist.
+            workers (int): Number of processes used to render the records.
+            chunk_size (int): Number of records sent to a worker at once.
+            on_progress (Optional[Callable[[RenderResult], None]]): Function called
+                with the result of every rendered record.
+
+        Returns:
+            Self: TemplateManager instance.
+
+        Raises:
+            RuntimeError: If any record could not be rendered.
+        """
         if not isinstance(output_path, str):
             raise TypeError(
                 "'output_path' must be a string.",
@@ -138,47 +389,363 @@ class TemplateManager:
                 f"Current type: {type(create_dir)}.",
             )
 
-        if not self.decide_filename_func:
+        if not isinstance(workers, int) or workers < 1:
             raise ValueError(
-                "A method must be implemented to determine the names of the files to be generated. Use the decide_filename_with method to do so."
+                "'workers' must be a positive integer.",
+                f"Current value: {workers}.",
+            )
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(
+                "'chunk_size' must be a positive integer.",
+                f"Current value: {chunk_size}.",
             )
 
+        if on_progress is not None and not callable(on_progress):
+            raise TypeError(
+                "'on_progress' must be callable.",
+                f"Current type: {type(on_progress)}.",
+            )
+
+        jobs = self.__iter_render_jobs()
+
         if create_dir:
             os.makedirs(output_path, exist_ok=True)
         elif not os.path.exists(output_path):
             raise FileNotFoundError(f"'{output_path}' directory does not exist.")
 
-        if len(self.templates) == 1:
-            for item in self.data:
-                html: HTML = HTML(
-                    string=self.templates[0].render_html_with_values(values=item),
-                    base_url=self.templates[0].html_path,
-                )
-                html.write_pdf(
-                    target=f"{output_path}/{self.decide_filename_func(item)}.pdf"
-                )
-        elif len(self.templates) > 1:
-            if not self.decide_template_func:
-                raise Exception(
-                    "Multiple Templates have been established, but there is no way to determine which one to use for each element. Use the decide_template_with method to do so."
-                )
-            for item in self.data:
-                template: Template = self.__get_template_by_html_path(
-                    self.decide_template_func(item)
-                )
-                html: HTML = HTML(
-                    string=template.render_html_with_values(values=item),
-                    base_url=template.html_path,
-                )
-                html.write_pdf(
-                    target=f"{output_path}/{self.decide_filename_func(item)}.pdf"
-                )
+        if workers == 1:
+            failures = self.__to_pdf_serially(jobs, output_path, on_progress)
         else:
+            failures = self.__to_pdf_in_pool(
+                jobs, output_path, workers, chunk_size, on_progress
+            )
+
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)} record(s) could not be rendered.",
+                [f"{result.filename}: {result.error}" for result in failures],
+            )
+
+        return self
+
+    def to_s3(
+        self,
+        s3_delivery: S3Delivery,
+        bucket_name: str,
+        prefix: str = "",
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> Self:
+        """
+        Render every record in 'data' and upload each PDF straight from memory to
+        's3://{bucket_name}/{prefix}/{filename}.pdf', without temporary files.
+
+        Args:
+            s3_delivery (S3Delivery): S3 delivery used to upload the files.
+            bucket_name (str): Name of the bucket to upload the files to.
+            prefix (str): Key prefix, or folder, of the uploaded files.
+            on_progress (Optional[Callable[[str], None]]): Function called with the
+                key of every uploaded file.
+
+        Returns:
+            Self: TemplateManager instance.
+
+        ## Usage:
+
+        ```python
+        template_manager.to_s3(S3Delivery(aws_config), "my-bucket", "certificates")
+        ```
+        """
+        if not isinstance(s3_delivery, S3Delivery):
+            raise TypeError(
+                "'s3_delivery' must be an instance of S3Delivery.",
+                f"Current type: {type(s3_delivery)}.",
+            )
+
+        if not isinstance(bucket_name, str):
+            raise TypeError(
+                "'bucket_name' must be a string.",
+                f"Current type: {type(bucket_name)}.",
+            )
+
+        if not bucket_name.strip():
+            raise ValueError("'bucket_name' cannot be an empty string.")
+
+        if not isinstance(prefix, str):
+            raise TypeError(
+                "'prefix' must be a string.",
+                f"Current type: {type(prefix)}.",
+            )
+
+        if on_progress is not None and not callable(on_progress):
+            raise TypeError(
+                "'on_progress' must be callable.",
+                f"Current type: {type(on_progress)}.",
+            )
+
+        prefix = prefix.strip("/")
+        for filename, pdf in self.iter_pdfs():
+            key = f"{prefix}/{filename}.pdf" if prefix else f"{filename}.pdf"
+            s3_delivery.upload_bytes(
+                pdf, bucket_name, key, content_type="application/pdf"
+            )
+            if on_progress:
+                on_progress(key)
+
+        return self
+
+    def __to_pdf_serially(
+        self,
+        jobs: Iterator[_RenderJob],
+        output_path: str,
+        on_progress: Optional[Callable[[RenderResult], None]],
+    ) -> list[RenderResult]:
+        """
+        Render the jobs one by one in the current process.
+
+        Returns:
+            list[RenderResult]: Results of the records that failed to render.
+        """
+        failures = []
+        for result in _render_jobs(_PDFRenderer(self.templates), output_path, jobs):
+            if result.error is not None:
+                failures.append(result)
+            if on_progress:
+                on_progress(result)
+
+        return failures
+
+    def __to_pdf_in_pool(
+        self,
+        jobs: Iterator[_RenderJob],
+        output_path: str,
+        workers: int,
+        chunk_size: int,
+        on_progress: Optional[Callable[[RenderResult], None]],
+    ) -> list[RenderResult]:
+        """
+        Render the jobs in a process pool, keeping a bounded number of chunks in
+        flight so that records are only pulled from 'data' as workers free up.
+
+        Returns:
+            list[RenderResult]: Results of the records that failed to render.
+        """
+        failures = []
+
+        def collect(futures) -> None:
+            for future in futures:
+                for result in future.result():
+                    if result.error is not None:
+                        failures.append(result)
+                    if on_progress:
+                        on_progress(result)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(self.templates,),
+        ) as executor:
+            pending = set()
+            while chunk := list(islice(jobs, chunk_size)):
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(_render_chunk, output_path, chunk))
+            collect(as_completed(pending))
+
+        return failures
+
+    def __iter_render_jobs(self, capture_errors: bool = True) -> Iterator[_RenderJob]:
+        """
+        Check that the manager is ready to render and resolve the template and
+        filename of every record in 'data', lazily.
+
+        Args:
+            capture_errors (bool): Return the error of a record whose template or
+                filename cannot be resolved in its job instead of raising it.
+
+        Returns:
+            Iterator[_RenderJob]: Index, template index, values, filename and
+                resolution error of every record.
+
+        Raises:
+            ValueError: If no filename function or no template is set.
+            Exception: If several templates are set but no template function.
+        """
+        if not self.decide_filename_func:
+            raise ValueError(
+                "A method must be implemented to determine the names of the files to be generated. Use the decide_filename_with method to do so."
+            )
+
+        self.__check_templates()
+        return (
+            self.__build_job(index, item, capture_errors)
+            for index, item in enumerate(self.data)
+        )
+
+    def __check_templates(self) -> None:
+        """
+        Check that the template of every record can be resolved.
+
+        Raises:
+            ValueError: If no template is set.
+            Exception: If several templates are set but no template function.
+        """
+        if not self.templates:
             raise ValueError(
                 "When trying to convert to pdf, you must specify at least one template."
             )
 
-        return self
+        if len(self.templates) > 1 and not self.decide_template_func:
+            raise Exception(
+                "Multiple Templates have been established, but there is no way to determine which one to use for each element. Use the decide_template_with method to do so."
+            )
+
+    def __build_job(
+        self, index: int, item: dict[str, Any], capture_errors: bool = True
+    ) -> _RenderJob:
+        """
+        Resolve the template and filename of a record in the parent process, so
+        the decide functions never have to be sent to the workers. If they fail,
+        the error is kept in the job, with an empty filename if it could not be
+        resolved, and the record is reported like one that fails to render.
+        """
+        filename = ""
+        try:
+            filename = self.decide_filename_func(item)
+            template_index = self.__get_template_index(item)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if not capture_errors:
+                raise
+            return index, None, item, filename, repr(error)
+
+        return index, template_index, item, filename, None
+
+    def __get_template_index(self, item: dict[str, Any]) -> int:
+        """
+        Resolve the position in 'templates' of the template of a record.
+        """
+        if len(self.templates) == 1:
+            return 0
+
+        return self.templates.index(
+            self.__get_template_by_html_path(self.decide_template_func(item))
+        )
+
+    def __get_renderer(self) -> _PDFRenderer:
+        """
+        Get the renderer that 'render_pdf_bytes' keeps between calls, building it
+        again only when the list of templates changes. Batches build a renderer of
+        their own, so the images of a batch are released when it ends.
+        """
+        if self.__renderer is None or self.__renderer[0] != self.templates:
+            self.__renderer = (list(self.templates), _PDFRenderer(self.templates))
+
+        return self.__renderer[1]
+
+    def render_pdf_bytes(self, item: dict[str, Any]) -> bytes:
+        """
+        Render a single record to PDF in memory, without touching the filesystem.
+
+        The stylesheets, fonts and images are kept between calls, so rendering many
+        records one at a time costs the same as rendering them with 'to_pdf'. The
+        cached images are bounded, like those of any renderer.
+
+        Args:
+            item (dict[str, Any]): Values of the record.
+
+        Returns:
+            bytes: Content of the PDF.
+
+        Raises:
+            TypeError: If 'item' is not a dictionary with string keys.
+            ValueError: If no template is set.
+            Exception: If several templates are set but no template function.
+        """
+        if not isinstance(item, dict):
+            raise TypeError(
+                "'item' must be a dictionary.",
+                f"Current type: {type(item)}.",
+            )
+
+        self.__check_templates()
+        return self.__get_renderer().render(
+            self.__get_template_index(item), item, target=None
+        )
+
+    def iter_pdfs(self) -> Iterator[tuple[str, bytes]]:
+        """
+        Render every record in 'data' to PDF in memory, lazily.
+
+        Returns:
+            Iterator[tuple[str, bytes]]: Filename, without the extension, and
+                content of the PDF of every record.
+
+        Raises:
+            ValueError: If no filename function or no template is set.
+            Exception: If several templates are set but no template function.
+
+        ## Usage:
+
+        ```python
+        for filename, pdf in template_manager.iter_pdfs():
+            upload(f"{filename}.pdf", pdf)
+        ```
+        """
+        jobs = self.__iter_render_jobs(capture_errors=False)
+        renderer = _PDFRenderer(self.templates)
+
+        return (
+            (filename, renderer.render(template_index, item, target=None))
+            for _, template_index, item, filename, _ in jobs
+        )
+
+    def iter_render_results(
+        self,
+    ) -> Iterator[tuple[RenderResult, dict[str, Any], Optional[bytes]]]:
+        """
+        Render every record in 'data' to PDF in memory, lazily, without stopping at
+        the records that fail to render or whose template or filename cannot be
+        resolved.
+
+        Returns:
+            Iterator[tuple[RenderResult, dict[str, Any], Optional[bytes]]]: Result,
+                values and content of the PDF of every record. The content is None
+                if the record could not be rendered.
+
+        Raises:
+            ValueError: If no filename function or no template is set.
+            Exception: If several templates are set but no template function.
+
+        ## Usage:
+
+        ```python
+        for result, item, pdf in template_manager.iter_render_results():
+            if result.error is None:
+                send(item["email"], f"{result.filename}.pdf", pdf)
+        ```
+        """
+        jobs = self.__iter_render_jobs()
+        return self.__render_in_memory(_PDFRenderer(self.templates), jobs)
+
+    @staticmethod
+    def __render_in_memory(
+        renderer: _PDFRenderer, jobs: Iterator[_RenderJob]
+    ) -> Iterator[tuple[RenderResult, dict[str, Any], Optional[bytes]]]:
+        """
+        Render the jobs to PDF in memory, capturing the errors of every record.
+        """
+        for index, template_index, item, filename, error in jobs:
+            if error is not None:
+                yield RenderResult(index, filename, error), item, None
+                continue
+
+            try:
+                pdf = renderer.render(template_index, item, target=None)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                yield RenderResult(index, filename, repr(error)), item, None
+            else:
+                yield RenderResult(index, filename), item, pdf
 
     def __get_template_by_html_path(self, html_path: str):
         for template in self.templates:
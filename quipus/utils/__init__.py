@@ -0,0 +1,11 @@
+"""
+The `utils` module provides helpers shared by the models and services of the
+library.
+
+Classes:
+    FileCache: Size-bounded LRU cache of values derived from files on disk.
+"""
+
+from .file_cache import FileCache
+
+__all__ = ["FileCache"]
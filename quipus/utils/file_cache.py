@@ -0,0 +1,171 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class FileCache:
+    """
+    Size-bounded LRU cache of values derived from files on disk.
+
+    Entries are keyed by path and validated against the modification time and size
+    of the file, so a file that changes on disk is loaded again on its next access.
+    When the total size of the cached values exceeds 'max_size', the least recently
+    used entries are evicted.
+
+    Attributes:
+        max_size (int): Maximum total size, in bytes, of the cached values.
+        size (int): Current total size, in bytes, of the cached values.
+    """
+
+    def __init__(self, max_size: int = 32 * 1024 * 1024):
+        """
+        Initializes an instance of the FileCache class.
+
+        Args:
+            max_size (int): Maximum total size, in bytes, of the cached values.
+        """
+        self.max_size = max_size
+        self.__entries: OrderedDict[str, tuple[tuple[int, int], Any, int]] = (
+            OrderedDict()
+        )
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """
+        Get the maximum total size of the cached values.
+
+        Returns:
+            int: Maximum total size in bytes.
+        """
+        return self.__max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        """
+        Set the maximum total size of the cached values.
+
+        Args:
+            max_size (int): Maximum total size in bytes.
+
+        Raises:
+            TypeError: If 'max_size' is not an integer.
+            ValueError: If 'max_size' is negative.
+        """
+        if not isinstance(max_size, int):
+            raise TypeError(
+                "'max_size' must be an integer.",
+                f"Current type: {type(max_size)}.",
+            )
+
+        if max_size < 0:
+            raise ValueError(
+                "'max_size' must be greater than or equal to 0.",
+                f"Current value: {max_size}.",
+            )
+
+        self.__max_size = max_size
+
+    @property
+    def size(self) -> int:
+        """
+        Get the current total size of the cached values.
+
+        Returns:
+            int: Current total size in bytes.
+        """
+        return self.__size
+
+    def get(self, path: str, loader: Callable[[str], tuple[Any, int]]) -> Any:
+        """
+        Get the value cached for 'path', loading it if it is missing or stale.
+
+        Args:
+            path (str): Path to the file.
+            loader (Callable[[str], tuple[Any, int]]): Function that receives the
+                path and returns the value to cache along with its size in bytes.
+
+        Returns:
+            Any: The cached value.
+
+        Raises:
+            FileNotFoundError: If the file at 'path' does not exist.
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self.__lock:
+            entry = self.__entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.__entries.move_to_end(path)
+                return entry[1]
+
+        value, size = loader(path)
+
+        with self.__lock:
+            self.__discard(path)
+            if size <= self.max_size:
+                self.__entries[path] = (signature, value, size)
+                self.__size += size
+                while self.__size > self.max_size:
+                    self.__discard(next(iter(self.__entries)))
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __discard(self, path: str) -> None:
+        """
+        Remove the entry of 'path', if any. Must be called with the lock held.
+        """
+        entry = self.__entries.pop(path, None)
+        if entry is not None:
+            self.__size -= entry[2]
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached entries.
+
+        Returns:
+            int: Number of cached entries.
+        """
+        return len(self.__entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle only the configuration of the cache, so that copies sent to other
+        processes start empty instead of carrying the cached values.
+        """
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restore an empty cache from its pickled configuration.
+        """
+        self.max_size = state["max_size"]
+        self.__entries = OrderedDict()
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the FileCache instance.
+
+        Returns:
+            str: String representation of the FileCache instance.
+        """
+        return str(
+            {
+                "max_size": self.max_size,
+                "size": self.size,
+                "entries": len(self),
+            }
+        )
@@ -0,0 +1,226 @@
+import asyncio
+
+import pytest
+from psycopg_pool import AsyncConnectionPool
+from quipus import AsyncPostgreSQLDataSource
+
+
+@pytest.fixture
+def async_postgresql_data_source():
+    return AsyncPostgreSQLDataSource(
+        host="localhost",
+        database="test_db",
+        user="test_user",
+        password="test_password",
+        port=5432,
+        pool_size=5,
+        timeout=15,
+    )
+
+
+@pytest.fixture
+def mocked_async_connection_pool(monkeypatch, async_postgresql_data_source):
+
+    class MockAsyncCursor:
+        def __init__(self, name=None):
+            self.name = name
+            self.itersize = None
+            self.rows = [(1, "test"), (2, "data"), (3, "more")]
+            self.description = None
+
+        async def execute(self, query):
+            await asyncio.sleep(0)
+            if query.startswith("SELECT"):
+                self.description = (
+                    type("MockDescription", (), {"name": "id"}),
+                    type("MockDescription", (), {"name": "value"}),
+                )
+
+        async def fetchall(self):
+            return [(1, "test"), (2, "data")]
+
+        async def fetchmany(self, size):
+            batch, self.rows = self.rows[:size], self.rows[size:]
+            return batch
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+    class MockAsyncConnection:
+        def __init__(self, pool):
+            self.pool = pool
+
+        def cursor(self, name=None):
+            cursor = MockAsyncCursor(name)
+            self.pool.cursors.append(cursor)
+            return cursor
+
+        async def commit(self):
+            self.pool.commits += 1
+
+        async def __aenter__(self):
+            self.pool.active += 1
+            self.pool.max_active = max(self.pool.max_active, self.pool.active)
+            return self
+
+        async def __aexit__(self, *args):
+            self.pool.active -= 1
+
+    class MockAsyncConnectionPool:
+        def __init__(self):
+            self.cursors = []
+            self.commits = 0
+            self.active = 0
+            self.max_active = 0
+            self.opened = False
+            self.closed = False
+
+        def connection(self):
+            return MockAsyncConnection(self)
+
+        async def open(self):
+            self.opened = True
+
+        async def close(self):
+            self.closed = True
+
+    mock_pool = MockAsyncConnectionPool()
+    monkeypatch.setattr(
+        async_postgresql_data_source,
+        "_AsyncPostgreSQLDataSource__connection_pool",
+        mock_pool,
+    )
+    return async_postgresql_data_source, mock_pool
+
+
+def test_async_postgresql_data_source_initialization(async_postgresql_data_source):
+    assert async_postgresql_data_source.host == "localhost"
+    assert async_postgresql_data_source.database == "test_db"
+    assert async_postgresql_data_source.user == "test_user"
+    assert async_postgresql_data_source.password == "test_password"
+    assert async_postgresql_data_source.port == 5432
+    assert isinstance(
+        async_postgresql_data_source._AsyncPostgreSQLDataSource__connection_pool,
+        AsyncConnectionPool,
+    )
+
+
+@pytest.mark.parametrize(
+    "attribute, value, expected_exception",
+    [
+        ("host", 123, TypeError),
+        ("host", "", ValueError),
+        ("port", "5432", TypeError),
+        ("port", 70000, ValueError),
+        ("user", "", ValueError),
+        ("password", 123, TypeError),
+        ("database", "", ValueError),
+        ("timeout", 7200, ValueError),
+    ],
+)
+def test_async_postgresql_data_source_invalid_attributes(
+    async_postgresql_data_source, attribute, value, expected_exception
+):
+    with pytest.raises(expected_exception):
+        setattr(async_postgresql_data_source, attribute, value)
+
+
+def test_async_postgresql_data_source_fetch_data(mocked_async_connection_pool):
+    data_source, _ = mocked_async_connection_pool
+
+    data, columns = asyncio.run(data_source.fetch_data("SELECT * FROM test_table"))
+
+    assert data == [(1, "test"), (2, "data")]
+    assert columns == ["id", "value"]
+
+
+def test_async_postgresql_data_source_concurrent_queries(
+    mocked_async_connection_pool,
+):
+    data_source, mock_pool = mocked_async_connection_pool
+
+    async def run_queries():
+        return await asyncio.gather(
+            *(data_source.fetch_data("SELECT * FROM test_table") for _ in range(10))
+        )
+
+    results = asyncio.run(run_queries())
+
+    assert len(results) == 10
+    assert mock_pool.max_active > 1
+
+
+def test_async_postgresql_data_source_execute_query(mocked_async_connection_pool):
+    data_source, mock_pool = mocked_async_connection_pool
+
+    result = asyncio.run(
+        data_source.execute_query("INSERT INTO test_table (id) VALUES (1)")
+    )
+
+    assert result is None
+    assert mock_pool.commits == 1
+
+
+def test_async_postgresql_data_source_iter_rows(mocked_async_connection_pool):
+    data_source, mock_pool = mocked_async_connection_pool
+
+    async def collect():
+        return [
+            batch
+            async for batch in data_source.iter_rows(
+                "SELECT * FROM test_table", batch_size=2
+            )
+        ]
+
+    assert asyncio.run(collect()) == [
+        ([(1, "test"), (2, "data")], ["id", "value"]),
+        ([(3, "more")], ["id", "value"]),
+    ]
+    assert mock_pool.cursors[0].name is not None
+    assert mock_pool.cursors[0].itersize == 2
+
+
+def test_async_postgresql_data_source_iter_records(mocked_async_connection_pool):
+    data_source, _ = mocked_async_connection_pool
+
+    async def collect():
+        return [
+            record
+            async for record in data_source.iter_records("SELECT * FROM test_table")
+        ]
+
+    assert asyncio.run(collect()) == [
+        {"id": 1, "value": "test"},
+        {"id": 2, "value": "data"},
+        {"id": 3, "value": "more"},
+    ]
+
+
+def test_async_postgresql_data_source_context_manager(mocked_async_connection_pool):
+    data_source, mock_pool = mocked_async_connection_pool
+
+    async def use():
+        async with data_source as opened:
+            assert opened is data_source
+            assert mock_pool.opened is True
+
+    asyncio.run(use())
+    assert mock_pool.closed is True
+
+
+def test_async_postgresql_data_source_invalid_query(mocked_async_connection_pool):
+    data_source, _ = mocked_async_connection_pool
+
+    with pytest.raises(ValueError, match="Query must be provided"):
+        asyncio.run(data_source.fetch_data(""))
+
+
+def test_async_postgresql_data_source_str(async_postgresql_data_source):
+    expected_str = (
+        "AsyncPostgreSQLDataSource(host=localhost, port=5432, "
+        "database=test_db, user=test_user)"
+    )
+    assert str(async_postgresql_data_source) == expected_str
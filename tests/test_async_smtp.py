@@ -0,0 +1,343 @@
+import asyncio
+import base64
+import datetime
+import email
+import smtplib
+import ssl
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from quipus import (
+    AsyncEmailSender,
+    EmailMessageBuilder,
+    LazyFileAttachment,
+    SMTPConfig,
+)
+
+
+class StandInSMTPServer:
+    """
+    Small SMTP server that records every connection and delivered message.
+    """
+
+    def __init__(self, tls_context=None, implicit_tls=False, refuse=()):
+        self.tls_context = tls_context
+        self.implicit_tls = implicit_tls
+        self.refuse = set(refuse)
+        self.connections = 0
+        self.logins = []
+        self.messages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self.handle,
+            "127.0.0.1",
+            0,
+            ssl=self.tls_context if self.implicit_tls else None,
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        tls = self.implicit_tls
+        envelope = None
+
+        def reply(line):
+            writer.write(line.encode() + b"\r\n")
+
+        reply("220 stand-in ready")
+        try:
+            while line := await reader.readline():
+                command = line.decode().strip()
+                verb = command.split(" ")[0].upper()
+
+                if verb == "EHLO":
+                    reply("250-stand-in")
+                    if self.tls_context and not tls:
+                        reply("250-STARTTLS")
+                    reply("250 AUTH PLAIN LOGIN")
+                elif verb == "STARTTLS":
+                    reply("220 go ahead")
+                    await writer.drain()
+                    await writer.start_tls(self.tls_context)
+                    tls = True
+                elif verb == "AUTH":
+                    credentials = base64.b64decode(command.split(" ")[2])
+                    self.logins.append((tls, credentials.split(b"\0")[1:]))
+                    reply("235 authenticated")
+                elif verb == "MAIL":
+                    envelope = {"from": command[10:].strip("<>"), "to": []}
+                    reply("250 ok")
+                elif verb == "RCPT":
+                    address = command[8:].strip("<>")
+                    if address in self.refuse:
+                        reply("550 no such user")
+                    else:
+                        envelope["to"].append(address)
+                        reply("250 ok")
+                elif verb == "DATA":
+                    reply("354 end with <CRLF>.<CRLF>")
+                    await writer.drain()
+                    self.in_flight += 1
+                    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                    data = b""
+                    while (data_line := await reader.readline()) != b".\r\n":
+                        data += data_line
+                    data += data_line
+                    await asyncio.sleep(0.01)
+                    self.in_flight -= 1
+                    envelope["data"] = data
+                    self.messages.append(envelope)
+                    reply("250 queued")
+                elif verb == "RSET":
+                    envelope = None
+                    reply("250 ok")
+                elif verb == "QUIT":
+                    reply("221 bye")
+                    await writer.drain()
+                    break
+                else:
+                    reply("502 not implemented")
+
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture(scope="module")
+def tls_contexts(tmp_path_factory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+
+    directory = tmp_path_factory.mktemp("tls")
+    cert_file = directory / "cert.pem"
+    key_file = directory / "key.pem"
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert_file, key_file)
+    client_context = ssl.create_default_context(cafile=str(cert_file))
+    return server_context, client_context
+
+
+def build_config(port, **kwargs):
+    return SMTPConfig(
+        server="localhost",
+        port=port,
+        username="user",
+        password="secret",
+        timeout=5,
+        **kwargs,
+    )
+
+
+def build_message(to_address, body="Hello"):
+    message = MIMEMultipart()
+    message["From"] = "sender@example.com"
+    message["To"] = to_address
+    message["Subject"] = "Test"
+    message.attach(MIMEText(body))
+    return message
+
+
+def run_with_server(scenario, **server_kwargs):
+    async def main():
+        server = StandInSMTPServer(**server_kwargs)
+        await server.start()
+        try:
+            return await scenario(server)
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_send_plain():
+    async def scenario(server):
+        sender = AsyncEmailSender(build_config(server.port))
+        refused = await sender.send(build_message("a@example.com, b@example.com"))
+        return server, refused
+
+    server, refused = run_with_server(scenario)
+
+    assert refused == {}
+    assert server.logins == [(False, [b"user", b"secret"])]
+    assert server.messages[0]["from"] == "sender@example.com"
+    assert server.messages[0]["to"] == ["a@example.com", "b@example.com"]
+    assert b"Subject: Test" in server.messages[0]["data"]
+
+
+def test_send_uses_bare_addresses_in_envelope():
+    async def scenario(server):
+        sender = AsyncEmailSender(build_config(server.port))
+        message = (
+            EmailMessageBuilder(
+                "Jane Doe <jane@example.com>", ["Bob <bob@example.com>"]
+            )
+            .with_subject("Test")
+            .with_body("Hello")
+            .build()
+        )
+        refused = await sender.send(message)
+        return server, refused
+
+    server, refused = run_with_server(scenario)
+
+    assert refused == {}
+    assert server.messages[0]["from"] == "jane@example.com"
+    assert server.messages[0]["to"] == ["bob@example.com"]
+
+
+def test_send_dot_stuffing():
+    async def scenario(server):
+        sender = AsyncEmailSender(build_config(server.port))
+        await sender.send(build_message("a@example.com", body="line\n.\nend"))
+        return server
+
+    server = run_with_server(scenario)
+
+    assert b"\r\n..\r\n" in server.messages[0]["data"]
+
+
+def test_send_starttls(tls_contexts):
+    server_context, client_context = tls_contexts
+
+    async def scenario(server):
+        sender = AsyncEmailSender(
+            build_config(server.port, use_tls=True), ssl_context=client_context
+        )
+        await sender.send(build_message("a@example.com"))
+        return server
+
+    server = run_with_server(scenario, tls_context=server_context)
+
+    assert server.logins == [(True, [b"user", b"secret"])]
+    assert len(server.messages) == 1
+
+
+def test_send_implicit_ssl(tls_contexts):
+    server_context, client_context = tls_contexts
+
+    async def scenario(server):
+        sender = AsyncEmailSender(
+            build_config(server.port, use_ssl=True), ssl_context=client_context
+        )
+        await sender.send(build_message("a@example.com"))
+        return server
+
+    server = run_with_server(scenario, tls_context=server_context, implicit_tls=True)
+
+    assert server.logins == [(True, [b"user", b"secret"])]
+    assert len(server.messages) == 1
+
+
+def test_starttls_not_supported():
+    async def scenario(server):
+        sender = AsyncEmailSender(build_config(server.port, use_tls=True))
+        await sender.send(build_message("a@example.com"))
+
+    with pytest.raises(smtplib.SMTPNotSupportedError):
+        run_with_server(scenario)
+
+
+def test_context_reuses_connections_and_bounds_concurrency():
+    async def scenario(server):
+        async with AsyncEmailSender(
+            build_config(server.port), max_concurrency=4
+        ) as sender:
+            await asyncio.gather(
+                *(sender.send(build_message(f"r{i}@example.com")) for i in range(20))
+            )
+        return server
+
+    server = run_with_server(scenario)
+
+    assert len(server.messages) == 20
+    assert server.max_in_flight == 4
+    assert server.connections == 4
+
+
+def test_send_many_reports_refused_recipients():
+    async def scenario(server):
+        async with AsyncEmailSender(build_config(server.port)) as sender:
+            return await sender.send_many(
+                [
+                    build_message("a@example.com"),
+                    build_message("bad@example.com"),
+                    build_message("c@example.com, bad@example.com"),
+                ]
+            )
+
+    results = run_with_server(scenario, refuse=["bad@example.com"])
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.accepted for result in results] == [True, False, True]
+    assert "SMTPRecipientsRefused" in results[1].error
+    assert results[2].refused == {"bad@example.com": (550, b"no such user")}
+
+
+@pytest.mark.parametrize("value, error", [(0, ValueError), ("10", TypeError)])
+def test_invalid_max_concurrency(value, error):
+    with pytest.raises(error):
+        AsyncEmailSender(build_config(25), max_concurrency=value)
+
+
+def test_invalid_ssl_context():
+    with pytest.raises(TypeError):
+        AsyncEmailSender(build_config(25), ssl_context="insecure")
+
+
+def test_send_streams_lazy_attachment(tmp_path):
+    attachment_file = tmp_path / "report.pdf"
+    attachment_file.write_bytes(bytes(range(256)) * 1000)
+
+    async def scenario(server):
+        message = build_message("a@example.com")
+        attachment = LazyFileAttachment(str(attachment_file))
+        attachment.add_header("Content-Disposition", "attachment; filename=report.pdf")
+        message.attach(attachment)
+        await AsyncEmailSender(build_config(server.port)).send(message)
+        return server
+
+    server = run_with_server(scenario)
+
+    received = email.message_from_bytes(server.messages[0]["data"][: -len(b".\r\n")])
+    attachment = received.get_payload()[1]
+    assert attachment.get_payload(decode=True) == attachment_file.read_bytes()
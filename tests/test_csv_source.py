@@ -188,3 +188,168 @@ def test_csv_data_source_read_csv_exception(monkeypatch):
 
     with pytest.raises(pd.errors.ParserError, match="Mocked parser error"):
         CSVDataSource(file_path="any.csv")
+
+
+def test_csv_data_source_lazy_does_not_read_on_init(monkeypatch, tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4")
+    calls = []
+    original_read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs)
+        return original_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+
+    data_source = CSVDataSource(file_path=str(csv_file), lazy=True)
+
+    assert data_source.dataframe is None
+    assert calls == []
+
+    expected_df = pd.DataFrame({"col1": [1, 3], "col2": [2, 4]})
+    pd.testing.assert_frame_equal(data_source.fetch_data(), expected_df)
+    assert len(calls) == 1
+
+
+def test_csv_data_source_lazy_get_columns_reads_header_only(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4")
+
+    data_source = CSVDataSource(file_path=str(csv_file), lazy=True)
+
+    assert data_source.get_columns() == ["col1", "col2"]
+    assert data_source.dataframe is None
+
+
+def test_csv_data_source_lazy_filter_data(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4\n5,6")
+
+    data_source = CSVDataSource(file_path=str(csv_file), lazy=True)
+
+    filtered_df = data_source.filter_data("col1 > 2")
+
+    expected_df = pd.DataFrame({"col1": [3, 5], "col2": [4, 6]}, index=[1, 2])
+    pd.testing.assert_frame_equal(filtered_df, expected_df)
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_csv_data_source_iter_chunks(tmp_path, lazy):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4\n5,6")
+
+    data_source = CSVDataSource(file_path=str(csv_file), lazy=lazy)
+
+    chunks = list(data_source.iter_chunks(chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[1]["col1"]) == [5]
+
+
+def test_csv_data_source_iter_records(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4\n5,6")
+
+    data_source = CSVDataSource(file_path=str(csv_file), lazy=True)
+
+    assert list(data_source.iter_records(chunksize=2)) == [
+        {"col1": 1, "col2": 2},
+        {"col1": 3, "col2": 4},
+        {"col1": 5, "col2": 6},
+    ]
+
+
+def test_csv_data_source_iter_chunks_invalid_chunksize(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2")
+
+    data_source = CSVDataSource(file_path=str(csv_file), lazy=True)
+
+    with pytest.raises(ValueError):
+        next(data_source.iter_chunks(chunksize=0))
+
+
+def test_csv_data_source_usecols_and_dtype(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2,col3\n1,2,a\n3,4,b")
+
+    data_source = CSVDataSource(
+        file_path=str(csv_file), usecols=["col1", "col3"], dtype={"col1": str}
+    )
+
+    expected_df = pd.DataFrame({"col1": ["1", "3"], "col3": ["a", "b"]})
+    pd.testing.assert_frame_equal(data_source.fetch_data(), expected_df)
+    assert list(next(data_source.iter_records())) == ["col1", "col3"]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_exception",
+    [
+        ({"lazy": "yes"}, TypeError),
+        ({"usecols": "col1"}, TypeError),
+        ({"usecols": []}, ValueError),
+        ({"dtype": {1: str}}, TypeError),
+    ],
+)
+def test_csv_data_source_invalid_lazy_options(tmp_path, kwargs, expected_exception):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2")
+
+    with pytest.raises(expected_exception):
+        CSVDataSource(file_path=str(csv_file), **kwargs)
+
+
+def test_csv_data_source_pyarrow_engine(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,a\n3,b\n5,c")
+
+    data_source = CSVDataSource(file_path=str(csv_file), engine="pyarrow")
+
+    df = data_source.fetch_data()
+    assert data_source.engine == "pyarrow"
+    assert str(df["col1"].dtype) == "int64[pyarrow]"
+    assert data_source.get_columns() == ["col1", "col2"]
+    assert list(data_source.filter_data("col1 > 2")["col2"]) == ["b", "c"]
+
+
+def test_csv_data_source_pyarrow_engine_iter_records(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,a\n3,b\n5,c")
+
+    data_source = CSVDataSource(file_path=str(csv_file), engine="pyarrow", lazy=True)
+
+    assert data_source.get_columns() == ["col1", "col2"]
+    assert list(data_source.iter_records(chunksize=2)) == [
+        {"col1": 1, "col2": "a"},
+        {"col1": 3, "col2": "b"},
+        {"col1": 5, "col2": "c"},
+    ]
+
+
+def test_csv_data_source_pyarrow_engine_fallback(monkeypatch, tmp_path):
+    from quipus.data_sources import csv_data_source as csv_module
+
+    monkeypatch.setattr(csv_module, "_PYARROW_AVAILABLE", False)
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2\n3,4")
+
+    with pytest.warns(RuntimeWarning, match="pyarrow is not installed"):
+        data_source = CSVDataSource(file_path=str(csv_file), engine="pyarrow")
+
+    expected_df = pd.DataFrame({"col1": [1, 3], "col2": [2, 4]})
+    assert data_source.engine == "c"
+    pd.testing.assert_frame_equal(data_source.fetch_data(), expected_df)
+
+
+def test_csv_data_source_invalid_engine(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1,col2\n1,2")
+
+    with pytest.raises(TypeError):
+        CSVDataSource(file_path=str(csv_file), engine=1)
+
+    with pytest.raises(ValueError):
+        CSVDataSource(file_path=str(csv_file), engine="python")
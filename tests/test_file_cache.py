@@ -0,0 +1,116 @@
+import os
+import pickle
+
+import pytest
+
+from quipus.utils import FileCache
+
+
+def read_file(path):
+    with open(path, "rb") as f:
+        content = f.read()
+    return content, len(content)
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    paths = []
+    for name in ["a", "b", "c"]:
+        path = tmp_path / f"{name}.bin"
+        path.write_bytes(name.encode() * 10)
+        paths.append(str(path))
+    return paths
+
+
+def test_file_cache_loads_once(sample_files):
+    cache = FileCache(max_size=100)
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return read_file(path)
+
+    assert cache.get(sample_files[0], loader) == b"a" * 10
+    assert cache.get(sample_files[0], loader) == b"a" * 10
+    assert calls == [sample_files[0]]
+    assert cache.size == 10
+    assert len(cache) == 1
+
+
+def test_file_cache_reloads_changed_file(sample_files):
+    cache = FileCache(max_size=100)
+    cache.get(sample_files[0], read_file)
+
+    stat = os.stat(sample_files[0])
+    with open(sample_files[0], "wb") as f:
+        f.write(b"changed")
+    os.utime(sample_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get(sample_files[0], read_file) == b"changed"
+    assert cache.size == 7
+
+
+def test_file_cache_evicts_least_recently_used(sample_files):
+    cache = FileCache(max_size=20)
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return read_file(path)
+
+    cache.get(sample_files[0], loader)
+    cache.get(sample_files[1], loader)
+    cache.get(sample_files[0], loader)
+    cache.get(sample_files[2], loader)
+
+    assert len(cache) == 2
+    assert cache.size == 20
+
+    cache.get(sample_files[0], loader)
+    cache.get(sample_files[1], loader)
+
+    assert calls == [sample_files[0], sample_files[1], sample_files[2], sample_files[1]]
+
+
+def test_file_cache_skips_values_larger_than_limit(sample_files):
+    cache = FileCache(max_size=5)
+
+    assert cache.get(sample_files[0], read_file) == b"a" * 10
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_file_cache_missing_file(tmp_path):
+    cache = FileCache()
+
+    with pytest.raises(FileNotFoundError):
+        cache.get(str(tmp_path / "missing.bin"), read_file)
+
+
+def test_file_cache_clear(sample_files):
+    cache = FileCache(max_size=100)
+    cache.get(sample_files[0], read_file)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_file_cache_pickles_empty(sample_files):
+    cache = FileCache(max_size=100)
+    cache.get(sample_files[0], read_file)
+
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.max_size == 100
+    assert len(restored) == 0
+    assert restored.get(sample_files[1], read_file) == b"b" * 10
+
+
+@pytest.mark.parametrize(
+    "max_size, expected_exception",
+    [("100", TypeError), (-1, ValueError)],
+)
+def test_file_cache_invalid_max_size(max_size, expected_exception):
+    with pytest.raises(expected_exception):
+        FileCache(max_size=max_size)
@@ -0,0 +1,202 @@
+import email
+import smtplib
+import threading
+
+import pytest
+
+from quipus import (
+    EmailMessageBuilder,
+    EmailSender,
+    MailMerge,
+    SendResult,
+    SMTPConfig,
+    Template,
+    TemplateManager,
+)
+
+
+class MockSMTP:
+    lock = threading.Lock()
+    instances = []
+
+    def __init__(self, server, port, timeout=None):
+        self.messages = []
+        with MockSMTP.lock:
+            MockSMTP.instances.append(self)
+
+    def login(self, username, password):
+        pass
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        if "invalid" in to_addrs[0]:
+            raise smtplib.SMTPRecipientsRefused({to_addrs[0]: (550, b"No such user")})
+        self.messages.append((to_addrs, email.message_from_string(msg)))
+        return {}
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def mock_smtp(monkeypatch):
+    MockSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", MockSMTP)
+    return MockSMTP
+
+
+@pytest.fixture
+def email_sender():
+    return EmailSender(
+        SMTPConfig(
+            server="smtp.example.com",
+            port=25,
+            username="user",
+            password="secret",
+        )
+    )
+
+
+@pytest.fixture
+def template_manager(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+    manager = (
+        TemplateManager()
+        .with_template(Template(html_path=str(html_file)))
+        .decide_filename_with(lambda item: item["name"].replace(" ", "_"))
+    )
+    manager.data = [
+        {"name": f"Person {i}", "email": f"person{i}@example.com"} for i in range(10)
+    ]
+    return manager
+
+
+def build_message(item):
+    return EmailMessageBuilder(
+        from_address="sender@example.com", to_addresses=[item["email"]]
+    ).with_subject(f"Certificate for {item['name']}")
+
+
+def test_mail_merge_sends_every_record(
+    mock_smtp, email_sender, template_manager, tmp_path
+):
+    results = (
+        MailMerge(template_manager, email_sender)
+        .build_message_with(build_message)
+        .run(concurrency=3, queue_size=2)
+    )
+
+    assert [result.index for result in results] == list(range(10))
+    assert all(result.accepted for result in results)
+    assert len(mock_smtp.instances) <= 3
+
+    delivered = {
+        to_addrs[0]: message
+        for connection in mock_smtp.instances
+        for to_addrs, message in connection.messages
+    }
+    assert len(delivered) == 10
+
+    attachment = delivered["person3@example.com"].get_payload()[1]
+    assert attachment.get_content_type() == "application/pdf"
+    assert attachment.get_filename() == "Person_3.pdf"
+    assert b"Person 3" in attachment.get_payload(decode=True)
+    assert list(tmp_path.glob("*.pdf")) == []
+
+
+def test_mail_merge_reports_failed_records(mock_smtp, email_sender, tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+    manager = (
+        TemplateManager()
+        .with_template(Template(html_path=str(html_file)))
+        .decide_filename_with(lambda item: item["email"])
+    )
+    manager.data = [
+        {"name": "Ana", "email": "ana@example.com"},
+        {"email": "missing@example.com"},
+        {"name": "Luis", "email": "invalid@example.com"},
+        {"name": "Eva", "email": "eva@example.com"},
+    ]
+
+    results = (
+        MailMerge(manager, email_sender)
+        .build_message_with(build_message)
+        .run(concurrency=2)
+    )
+
+    assert [result.accepted for result in results] == [True, False, False, True]
+    assert "KeyError" in results[1].error
+    assert "SMTPRecipientsRefused" in results[2].error
+
+
+def test_mail_merge_propagates_data_errors(mock_smtp, email_sender, tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+    manager = (
+        TemplateManager()
+        .with_template(Template(html_path=str(html_file)))
+        .decide_filename_with(lambda item: item["name"])
+    )
+    manager.data = iter([{"name": "Ana", "email": "ana@example.com"}, {1: "bad"}])
+
+    with pytest.raises(RuntimeError, match="1 record\\(s\\) were processed") as error:
+        MailMerge(manager, email_sender).build_message_with(build_message).run()
+
+    assert isinstance(error.value.__cause__, TypeError)
+    assert "All keys in the dictionary must be a string." in str(error.value.__cause__)
+    assert error.value.args[1] == [SendResult(index=0)]
+    assert len(mock_smtp.instances[0].messages) == 1
+
+
+def test_mail_merge_reports_unresolved_templates(mock_smtp, email_sender, tmp_path):
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.html").write_text("<html><body>{name}</body></html>")
+    manager = (
+        TemplateManager()
+        .with_multiple_templates(
+            [Template(html_path=str(tmp_path / name)) for name in ["a.html", "b.html"]]
+        )
+        .decide_template_with(lambda item: str(tmp_path / item["template"]))
+        .decide_filename_with(lambda item: item["name"])
+    )
+    manager.data = [
+        {"name": "x", "template": "a.html", "email": "x@example.com"},
+        {"name": "y", "template": "zzz.html", "email": "y@example.com"},
+        {"name": "z", "template": "b.html", "email": "z@example.com"},
+    ]
+
+    results = MailMerge(manager, email_sender).build_message_with(build_message).run()
+
+    assert [result.accepted for result in results] == [True, False, True]
+    assert "There is no Template with the path" in results[1].error
+    delivered = sorted(
+        to_addrs[0]
+        for connection in mock_smtp.instances
+        for to_addrs, _ in connection.messages
+    )
+    assert delivered == ["x@example.com", "z@example.com"]
+
+
+def test_mail_merge_without_message_function(email_sender, template_manager):
+    with pytest.raises(ValueError, match="build_message_with"):
+        MailMerge(template_manager, email_sender).run()
+
+
+@pytest.mark.parametrize("queue_size", [0, "10"])
+def test_mail_merge_invalid_queue_size(email_sender, template_manager, queue_size):
+    merge = MailMerge(template_manager, email_sender).build_message_with(build_message)
+
+    with pytest.raises(ValueError):
+        merge.run(queue_size=queue_size)
+
+
+def test_mail_merge_invalid_arguments(email_sender, template_manager):
+    with pytest.raises(TypeError):
+        MailMerge("manager", email_sender)
+
+    with pytest.raises(TypeError):
+        MailMerge(template_manager, "sender")
+
+    with pytest.raises(TypeError):
+        MailMerge(template_manager, email_sender).build_message_with("func")
@@ -1,6 +1,7 @@
+import pandas as pd
 import pytest
 from psycopg_pool import ConnectionPool
-from quipus import PostgreSQLDataSource
+from quipus import DataFrameDataSource, PostgreSQLDataSource
 
 
 @pytest.fixture
@@ -20,12 +21,21 @@ def postgresql_data_source():
 def mocked_connection_pool(monkeypatch, postgresql_data_source):
 
     class MockCursor:
+        def __init__(self, name=None):
+            self.name = name
+            self.itersize = None
+            self.rows = [(1, "test"), (2, "data"), (3, "more")]
+
         def execute(self, query):
             pass
 
         def fetchall(self):
             return [(1, "test"), (2, "data")]
 
+        def fetchmany(self, size):
+            batch, self.rows = self.rows[:size], self.rows[size:]
+            return batch
+
         @property
         def description(self):
             MockDescription = type("MockDescription", (), {"name": "id"}), type(
@@ -40,8 +50,10 @@ def mocked_connection_pool(monkeypatch, postgresql_data_source):
             pass
 
     class MockConnection:
-        def cursor(self):
-            return MockCursor()
+        def cursor(self, name=None):
+            cursor = MockCursor(name)
+            cursors.append(cursor)
+            return cursor
 
         def commit(self):
             pass
@@ -59,7 +71,9 @@ def mocked_connection_pool(monkeypatch, postgresql_data_source):
         def close(self):
             self.closed = True
 
+    cursors = []
     mock_pool = MockConnectionPool()
+    mock_pool.cursors = cursors
     monkeypatch.setattr(
         postgresql_data_source, "_PostgreSQLDataSource__connection_pool", mock_pool
     )
@@ -137,3 +151,166 @@ def test_postgresql_data_source_close_pool(mocked_connection_pool):
 def test_postgresql_data_source_str(postgresql_data_source):
     expected_str = "PostgreSQLDataSource(host=localhost, port=5432, database=test_db, user=test_user)"
     assert str(postgresql_data_source) == expected_str
+
+
+def test_postgresql_data_source_iter_rows(mocked_connection_pool):
+    postgresql_data_source, mock_pool = mocked_connection_pool
+
+    batches = list(
+        postgresql_data_source.iter_rows("SELECT * FROM test_table", batch_size=2)
+    )
+
+    assert batches == [
+        ([(1, "test"), (2, "data")], ["id", "value"]),
+        ([(3, "more")], ["id", "value"]),
+    ]
+    cursor = mock_pool.cursors[0]
+    assert cursor.name is not None
+    assert cursor.itersize == 2
+
+
+def test_postgresql_data_source_iter_rows_invalid_parameters(mocked_connection_pool):
+    postgresql_data_source, _ = mocked_connection_pool
+
+    with pytest.raises(ValueError, match="Query must be provided"):
+        next(postgresql_data_source.iter_rows(""))
+
+    with pytest.raises(ValueError, match="'batch_size' must be a positive integer."):
+        next(postgresql_data_source.iter_rows("SELECT 1", batch_size=0))
+
+
+def test_postgresql_data_source_iter_records(mocked_connection_pool):
+    postgresql_data_source, _ = mocked_connection_pool
+
+    records = list(
+        postgresql_data_source.iter_records("SELECT * FROM test_table", batch_size=2)
+    )
+
+    assert records == [
+        {"id": 1, "value": "test"},
+        {"id": 2, "value": "data"},
+        {"id": 3, "value": "more"},
+    ]
+
+
+@pytest.fixture
+def mocked_copy_pool(monkeypatch, postgresql_data_source):
+    statements = []
+
+    class MockCopy:
+        def __init__(self, statement):
+            self.binary = "BINARY" in statement
+            self.types = None
+
+        def __iter__(self):
+            yield memoryview(b"id,value\n1,test\n")
+            yield memoryview(b"2,data\n3,more\n")
+
+        def set_types(self, types):
+            statements.append(("set_types", types))
+
+        def rows(self):
+            yield from [(1, "test"), (2, "data"), (3, "more")]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    class MockCursor:
+        description = None
+
+        def execute(self, query):
+            statements.append(("execute", query.as_string(None)))
+            self.description = [
+                type("MockDescription", (), {"name": "id", "type_code": 23}),
+                type("MockDescription", (), {"name": "value", "type_code": 25}),
+            ]
+
+        def copy(self, statement):
+            statements.append(("copy", statement.as_string(None)))
+            return MockCopy(statement.as_string(None))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    class MockConnection:
+        def cursor(self):
+            return MockCursor()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    class MockConnectionPool:
+        def connection(self):
+            return MockConnection()
+
+    monkeypatch.setattr(
+        postgresql_data_source,
+        "_PostgreSQLDataSource__connection_pool",
+        MockConnectionPool(),
+    )
+    return postgresql_data_source, statements
+
+
+def test_postgresql_data_source_copy_to_dataframe_csv(mocked_copy_pool):
+    postgresql_data_source, statements = mocked_copy_pool
+
+    df = postgresql_data_source.copy_to_dataframe("SELECT * FROM test_table;")
+
+    expected_df = pd.DataFrame({"id": [1, 2, 3], "value": ["test", "data", "more"]})
+    pd.testing.assert_frame_equal(df, expected_df)
+    assert statements == [
+        ("copy", "COPY (SELECT * FROM test_table) TO STDOUT (FORMAT CSV, HEADER)")
+    ]
+
+
+def test_postgresql_data_source_copy_to_dataframe_binary(mocked_copy_pool):
+    postgresql_data_source, statements = mocked_copy_pool
+
+    df = postgresql_data_source.copy_to_dataframe(
+        "SELECT * FROM test_table", copy_format="binary"
+    )
+
+    expected_df = pd.DataFrame({"id": [1, 2, 3], "value": ["test", "data", "more"]})
+    pd.testing.assert_frame_equal(df, expected_df)
+    assert statements == [
+        (
+            "execute",
+            "SELECT * FROM (SELECT * FROM test_table) AS copy_source LIMIT 0",
+        ),
+        ("copy", "COPY (SELECT * FROM test_table) TO STDOUT (FORMAT BINARY)"),
+        ("set_types", [23, 25]),
+    ]
+
+
+def test_postgresql_data_source_copy_iter(mocked_copy_pool):
+    postgresql_data_source, _ = mocked_copy_pool
+
+    batches = list(
+        postgresql_data_source.copy_iter("SELECT * FROM test_table", batch_size=2)
+    )
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert list(batches[1]["value"]) == ["more"]
+    assert DataFrameDataSource(batches[0]).get_columns() == ["id", "value"]
+
+
+def test_postgresql_data_source_copy_invalid_parameters(mocked_copy_pool):
+    postgresql_data_source, _ = mocked_copy_pool
+
+    with pytest.raises(ValueError, match="Query must be provided"):
+        postgresql_data_source.copy_to_dataframe(" ; ")
+
+    with pytest.raises(ValueError, match="'copy_format'"):
+        postgresql_data_source.copy_to_dataframe("SELECT 1", copy_format="text")
+
+    with pytest.raises(ValueError, match="'batch_size'"):
+        next(postgresql_data_source.copy_iter("SELECT 1", batch_size=0))
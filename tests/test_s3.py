@@ -1,8 +1,13 @@
+import io
+import threading
+import time
+
 import pytest
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import NoCredentialsError
 
-from quipus import AWSConfig, S3Delivery
+from quipus import AWSConfig, S3Delivery, UploadResult
 
 
 @pytest.fixture
@@ -26,6 +31,13 @@ class MockS3Client:
     def upload_file(self, Filename, Bucket, Key):
         self.uploaded_files[Key] = {"Bucket": Bucket, "Filename": Filename}
 
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None):
+        self.uploaded_files[Key] = {
+            "Bucket": Bucket,
+            "Body": Fileobj.read(),
+            "ExtraArgs": ExtraArgs,
+        }
+
 
 # ============== Tests for AWSConfig ==============
 
@@ -185,3 +197,177 @@ def test_s3_delivery_upload_many_files_invalid_parameters(s3_delivery):
 
     with pytest.raises(TypeError):
         s3_delivery.upload_many_files([("path", "key")], 123)
+
+
+def test_s3_delivery_upload_fileobj(monkeypatch, s3_delivery):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+
+    s3_delivery.upload_fileobj(io.BytesIO(b"content"), "my-bucket", "folder/a.txt")
+
+    assert mock_s3_client.uploaded_files["folder/a.txt"] == {
+        "Bucket": "my-bucket",
+        "Body": b"content",
+        "ExtraArgs": None,
+    }
+
+
+def test_s3_delivery_upload_bytes(monkeypatch, s3_delivery):
+    mock_s3_client = MockS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: mock_s3_client)
+
+    s3_delivery.upload_bytes(
+        b"%PDF-1.7", "my-bucket", "folder/a.pdf", content_type="application/pdf"
+    )
+
+    uploaded_file = mock_s3_client.uploaded_files["folder/a.pdf"]
+    assert uploaded_file["Body"] == b"%PDF-1.7"
+    assert uploaded_file["ExtraArgs"] == {"ContentType": "application/pdf"}
+
+
+def test_s3_delivery_upload_bytes_invalid_parameters(s3_delivery):
+    with pytest.raises(TypeError):
+        s3_delivery.upload_bytes("text", "bucket", "key")
+    with pytest.raises(TypeError):
+        s3_delivery.upload_fileobj(b"content", "bucket", "key")
+    with pytest.raises(TypeError):
+        s3_delivery.upload_bytes(b"content", "bucket", "key", content_type=1)
+    with pytest.raises(ValueError):
+        s3_delivery.upload_bytes(b"content", "", "key")
+    with pytest.raises(ValueError):
+        s3_delivery.upload_bytes(b"content", "bucket", "")
+
+
+def test_s3_delivery_reuses_client(monkeypatch, s3_delivery, tmp_path):
+    created = []
+
+    def mock_boto3_client(*args, **kwargs):
+        created.append(kwargs)
+        return MockS3Client()
+
+    monkeypatch.setattr(boto3, "client", mock_boto3_client)
+    local_file = tmp_path / "test.txt"
+    local_file.write_text("Test content.")
+
+    s3_delivery.upload_file(str(local_file), "my-bucket", "a.txt")
+    s3_delivery.upload_many_files([(str(local_file), "b.txt")], "my-bucket")
+    s3_delivery.upload_bytes(b"content", "my-bucket", "c.txt")
+
+    assert len(created) == 1
+    assert created[0]["config"].max_pool_connections == 10
+
+
+def test_s3_delivery_builds_client_once_across_threads(monkeypatch, aws_config):
+    created = []
+
+    def mock_boto3_client(*args, **kwargs):
+        created.append(kwargs)
+        time.sleep(0.01)
+        return MockS3Client()
+
+    monkeypatch.setattr(boto3, "client", mock_boto3_client)
+    s3_delivery = S3Delivery(aws_config, max_pool_connections=32)
+
+    threads = [
+        threading.Thread(
+            target=s3_delivery.upload_bytes, args=(b"data", "my-bucket", f"{i}.txt")
+        )
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert created[0]["config"].max_pool_connections == 32
+
+
+def test_s3_delivery_rebuilds_client_on_new_config(monkeypatch, s3_delivery):
+    created = []
+
+    def mock_boto3_client(*args, **kwargs):
+        created.append(kwargs)
+        return MockS3Client()
+
+    monkeypatch.setattr(boto3, "client", mock_boto3_client)
+
+    s3_delivery.upload_bytes(b"data", "my-bucket", "a.txt")
+    s3_delivery.aws_config = AWSConfig("other_key", "other_secret", "eu-west-1")
+    s3_delivery.upload_bytes(b"data", "my-bucket", "b.txt")
+
+    assert [kwargs["region_name"] for kwargs in created] == ["us-east-1", "eu-west-1"]
+
+
+def test_s3_delivery_invalid_max_pool_connections(aws_config):
+    with pytest.raises(TypeError):
+        S3Delivery(aws_config, max_pool_connections="10")
+    with pytest.raises(ValueError):
+        S3Delivery(aws_config, max_pool_connections=0)
+
+
+class ConcurrentS3Client(MockS3Client):
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.configs = []
+
+    def upload_file(self, Filename, Bucket, Key, Config=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.configs.append(Config)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        if "missing" in Filename:
+            raise FileNotFoundError(Filename)
+        super().upload_file(Filename, Bucket, Key)
+
+
+def test_s3_delivery_upload_many_files_concurrently(monkeypatch, aws_config):
+    client = ConcurrentS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: client)
+    transfer_config = TransferConfig(multipart_chunksize=16 * 1024 * 1024)
+    s3_delivery = S3Delivery(
+        aws_config, max_pool_connections=4, transfer_config=transfer_config
+    )
+    files = [(f"file_{i}.pdf", f"folder/file_{i}.pdf") for i in range(12)]
+    files[5] = ("missing.pdf", "folder/missing.pdf")
+
+    results = s3_delivery.upload_many_files(files, "my-bucket")
+
+    assert client.max_active == 4
+    assert all(config is transfer_config for config in client.configs)
+    assert [(result.file_path, result.key) for result in results] == files
+    assert [result.error is None for result in results].count(False) == 1
+    assert "FileNotFoundError" in results[5].error
+    assert len(client.uploaded_files) == 11
+
+
+def test_s3_delivery_upload_many_files_max_workers(monkeypatch, s3_delivery):
+    client = ConcurrentS3Client()
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: client)
+
+    results = s3_delivery.upload_many_files(
+        [(f"file_{i}.pdf", f"file_{i}.pdf") for i in range(6)],
+        "my-bucket",
+        max_workers=2,
+    )
+
+    assert client.max_active == 2
+    assert results[0] == UploadResult(file_path="file_0.pdf", key="file_0.pdf")
+
+
+def test_s3_delivery_upload_many_files_invalid_max_workers(s3_delivery):
+    with pytest.raises(TypeError):
+        s3_delivery.upload_many_files([], "my-bucket", max_workers="2")
+    with pytest.raises(ValueError):
+        s3_delivery.upload_many_files([], "my-bucket", max_workers=0)
+
+
+def test_s3_delivery_invalid_transfer_config(aws_config):
+    with pytest.raises(TypeError):
+        S3Delivery(aws_config, transfer_config={"multipart_chunksize": 1024})
@@ -1,9 +1,12 @@
 import hashlib
+import shlex
+import threading
+from io import BytesIO
 
 import paramiko
 import pytest
 
-from quipus import SFTPDelivery
+from quipus import SFTPDelivery, SFTPTransferConfig, SFTPUploadResult
 
 
 @pytest.fixture
@@ -17,9 +20,43 @@ def sftp_delivery():
     )
 
 
+class MockRemoteFile(BytesIO):
+    def __init__(self, client, remote_file, data=b""):
+        super().__init__(data)
+        self.client = client
+        self.remote_file = remote_file
+
+    def read(self, size=-1):
+        self.client.bytes_read += size
+        return super().read(size)
+
+    def write(self, data):
+        self.client.write_sizes.append(len(data))
+        return super().write(data)
+
+    def set_pipelined(self, pipelined=True):
+        self.client.pipelined = pipelined
+
+    def prefetch(self, file_size=None, max_concurrent_requests=None):
+        self.client.prefetches.append(max_concurrent_requests)
+
+    def check(self, hash_algorithm, offset=0, length=0, block_size=0):
+        raise IOError("Operation unsupported")
+
+    def close(self):
+        if not self.closed:
+            self.client.files[self.remote_file] = self.getvalue()
+        super().close()
+
+
 class MockSFTPClient:
     def __init__(self):
         self.files = {}
+        self.mtimes = {}
+        self.bytes_read = 0
+        self.prefetches = []
+        self.write_sizes = []
+        self.pipelined = None
         self.closed = False
 
     def get(self, remote_file, local_file):
@@ -35,16 +72,24 @@ class MockSFTPClient:
     def open(self, remote_file, mode="r"):
         if "r" in mode and remote_file not in self.files:
             raise FileNotFoundError(f"Remote file {remote_file} does not exist.")
-        from io import BytesIO
 
         if "r" in mode:
-            return BytesIO(self.files[remote_file])
-        else:
+            return MockRemoteFile(self, remote_file, self.files[remote_file])
+        return MockRemoteFile(self, remote_file)
 
-            def write(data):
-                self.files[remote_file] = data
+    def stat(self, remote_file):
+        if remote_file not in self.files:
+            raise FileNotFoundError(f"Remote file {remote_file} does not exist.")
+        attributes = paramiko.SFTPAttributes()
+        attributes.st_size = len(self.files[remote_file])
+        attributes.st_mtime = self.mtimes.get(remote_file)
+        return attributes
 
-            return type("MockFile", (), {"write": write})
+    def utime(self, remote_file, times):
+        self.mtimes[remote_file] = times[1]
+
+    def normalize(self, remote_file):
+        return remote_file
 
     def close(self):
         self.closed = True
@@ -70,10 +115,32 @@ class MockSSHClient:
     def open_sftp(self):
         return self.sftp_client
 
+    def exec_command(self, command, *args, **kwargs):
+        raise paramiko.SSHException("This service allows sftp connections only.")
+
     def close(self):
         self.closed = True
 
 
+class MultiChannelSSHClient(MockSSHClient):
+    def __init__(self):
+        super().__init__()
+        self.channels = []
+
+    def open_sftp(self):
+        channel = MockSFTPClient()
+        self.channels.append(channel)
+        return channel
+
+
+@pytest.fixture
+def multi_channel(monkeypatch):
+    from quipus.services import sftp_delivery as sftp_module
+
+    monkeypatch.setattr("paramiko.SSHClient", MultiChannelSSHClient)
+    monkeypatch.setattr(sftp_module, "SFTPClient", MockSFTPClient)
+
+
 # ============== Tests for SFTPDelivery ==============
 
 
@@ -219,8 +286,10 @@ def test_sftp_delivery_upload_with_verification_failure(
     from quipus.services import sftp_delivery as sftp_module
 
     class MockSFTPClientCorrupt(MockSFTPClient):
-        def put(self, local_file, remote_file):
-            self.files[remote_file] = b"Corrupted content."
+        def open(self, remote_file, mode="r"):
+            if "w" in mode:
+                return MockRemoteFile(self, remote_file, b"Corrupted content.")
+            return super().open(remote_file, mode)
 
     class MockSSHClientCorrupt(MockSSHClient):
         def __init__(self):
@@ -316,12 +385,13 @@ def test_sftp_delivery_upload_invalid_checksum_algorithm(
 
 
 def test_sftp_delivery_calculate_checksum(sftp_delivery, tmp_path):
+    from quipus.services.sftp_transfer import _SFTPTransfer
+
     local_file = tmp_path / "test.txt"
     local_file.write_text("Test content.")
 
-    checksum = sftp_delivery._SFTPDelivery__calculate_checksum(
-        str(local_file), algorithm="md5"
-    )
+    transfer = _SFTPTransfer(None, None, sftp_delivery.transfer_config)
+    checksum = transfer.calculate_checksum(str(local_file), algorithm="md5")
     expected_checksum = hashlib.md5(b"Test content.").hexdigest()
     assert checksum == expected_checksum
 
@@ -339,3 +409,812 @@ def test_sftp_delivery_str(sftp_delivery):
         }
     )
     assert sftp_str == expected_str
+
+
+# ============== Tests for the SFTP channel pool ==============
+
+
+def test_sftp_delivery_instances_are_independent():
+    first = SFTPDelivery(host="a.example.com", username="user", password="password")
+    second = SFTPDelivery(host="b.example.com", username="other", password="secret")
+
+    assert first is not second
+    assert first.host == "a.example.com"
+    assert second.host == "b.example.com"
+
+
+@pytest.mark.parametrize("pool_size, error", [(0, ValueError), ("2", TypeError)])
+def test_sftp_delivery_invalid_pool_size(pool_size, error):
+    with pytest.raises(error):
+        SFTPDelivery(
+            host="sftp.example.com",
+            username="user",
+            password="password",
+            pool_size=pool_size,
+        )
+
+
+def test_sftp_delivery_checkout_opens_channels_up_to_pool_size(multi_channel):
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password", pool_size=2
+    )
+    sftp_delivery.connect()
+
+    first = sftp_delivery.checkout()
+    second = sftp_delivery.checkout()
+
+    assert first is sftp_delivery.sftp_client
+    assert second is not first
+    assert len(sftp_delivery.connection.channels) == 2
+
+    with pytest.raises(TimeoutError):
+        sftp_delivery.checkout(timeout=0.05)
+
+    sftp_delivery.release(second)
+    assert sftp_delivery.checkout(timeout=0.05) is second
+
+
+def test_sftp_delivery_checkout_waits_for_release(multi_channel):
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password"
+    )
+    sftp_delivery.connect()
+    channel = sftp_delivery.checkout()
+
+    timer = threading.Timer(0.05, sftp_delivery.release, args=(channel,))
+    timer.start()
+
+    assert sftp_delivery.checkout(timeout=5) is channel
+    timer.join()
+
+
+def test_sftp_delivery_session_discards_broken_channel(multi_channel):
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password"
+    )
+    sftp_delivery.connect()
+
+    with pytest.raises(EOFError):
+        with sftp_delivery.session() as channel:
+            raise EOFError()
+
+    assert channel.closed is True
+    with sftp_delivery.session() as replacement:
+        assert replacement is not channel
+
+    with pytest.raises(FileNotFoundError):
+        with sftp_delivery.session() as channel:
+            channel.get("/remote/missing.txt", "missing.txt")
+
+    assert channel.closed is False
+    assert len(sftp_delivery.connection.channels) == 2
+
+
+def test_sftp_delivery_checkout_opens_channel_outside_pool_lock(multi_channel):
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password", pool_size=2
+    )
+    sftp_delivery.connect()
+    first = sftp_delivery.checkout()
+
+    opening = threading.Event()
+    proceed = threading.Event()
+    open_sftp = sftp_delivery.connection.open_sftp
+
+    def slow_open_sftp():
+        opening.set()
+        proceed.wait(5)
+        return open_sftp()
+
+    sftp_delivery.connection.open_sftp = slow_open_sftp
+    opened = []
+    thread = threading.Thread(target=lambda: opened.append(sftp_delivery.checkout()))
+    thread.start()
+    assert opening.wait(5)
+
+    # The pool stays usable while the other thread waits for its channel
+    releaser = threading.Thread(target=sftp_delivery.release, args=(first,))
+    releaser.start()
+    releaser.join(1)
+    try:
+        assert not releaser.is_alive()
+        assert sftp_delivery.checkout(timeout=0.05) is first
+        with pytest.raises(TimeoutError):
+            sftp_delivery.checkout(timeout=0.05)
+    finally:
+        proceed.set()
+        thread.join()
+    assert opened[0] is not first
+    assert len(sftp_delivery.connection.channels) == 2
+
+
+def test_sftp_delivery_checkout_frees_slot_if_channel_fails(multi_channel):
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password", pool_size=2
+    )
+    sftp_delivery.connect()
+    sftp_delivery.checkout()
+
+    connection = sftp_delivery.connection
+    open_sftp = connection.open_sftp
+
+    def failing_open_sftp():
+        raise paramiko.SSHException("Channel closed.")
+
+    connection.open_sftp = failing_open_sftp
+    with pytest.raises(paramiko.SSHException):
+        sftp_delivery.checkout()
+
+    connection.open_sftp = open_sftp
+    assert sftp_delivery.checkout(timeout=0.05) in connection.channels
+
+
+def test_sftp_delivery_connect_twice_closes_previous_connection(multi_channel):
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password"
+    )
+    sftp_delivery.connect()
+    connection = sftp_delivery.connection
+    channel = sftp_delivery.sftp_client
+
+    sftp_delivery.connect()
+
+    assert connection.closed is True
+    assert channel.closed is True
+    assert sftp_delivery.connection is not connection
+    assert sftp_delivery.checkout(timeout=0.05) is sftp_delivery.sftp_client
+
+
+def test_sftp_delivery_release_foreign_channel(multi_channel, sftp_delivery):
+    sftp_delivery.connect()
+
+    with pytest.raises(ValueError):
+        sftp_delivery.release(MockSFTPClient())
+
+
+def test_sftp_delivery_parallel_uploads(multi_channel, tmp_path):
+    local_file = tmp_path / "test.txt"
+    local_file.write_text("Test content.")
+
+    with SFTPDelivery(
+        host="sftp.example.com", username="user", password="password", pool_size=3
+    ) as sftp_delivery:
+        threads = [
+            threading.Thread(
+                target=sftp_delivery.upload_file,
+                args=(str(local_file), f"/remote/test_{i}.txt"),
+            )
+            for i in range(12)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        channels = sftp_delivery.connection.channels
+        uploaded = {name for channel in channels for name in channel.files}
+
+    assert len(channels) <= 3
+    assert uploaded == {f"/remote/test_{i}.txt" for i in range(12)}
+    assert all(channel.closed for channel in channels)
+    assert sftp_delivery.connection.closed is True
+
+    with pytest.raises(ValueError, match="SFTP connection not established"):
+        sftp_delivery.checkout()
+
+
+# ============== Tests for batch uploads ==============
+
+
+class FileSystemSFTPClient(MockSFTPClient):
+    def __init__(self, file_system):
+        super().__init__()
+        self.file_system = file_system
+        self.files = file_system["files"]
+
+    def stat(self, path):
+        if path in self.files:
+            return super().stat(path)
+
+        self.file_system["stats"] += 1
+        if path not in self.file_system["dirs"]:
+            raise FileNotFoundError(f"No such file: {path}")
+        return paramiko.SFTPAttributes()
+
+    def mkdir(self, path):
+        with self.file_system["lock"]:
+            parent = path.rsplit("/", 1)[0] or "/"
+            if parent not in self.file_system["dirs"]:
+                raise FileNotFoundError(f"No such directory: {parent}")
+            if path in self.file_system["dirs"]:
+                raise OSError("Failure")
+            self.file_system["dirs"].add(path)
+
+    def open(self, remote_file, mode="r"):
+        parent = remote_file.rsplit("/", 1)[0] or "/"
+        if "w" in mode and parent not in self.file_system["dirs"]:
+            raise FileNotFoundError(f"No such directory: {parent}")
+        return super().open(remote_file, mode)
+
+
+class FileSystemSSHClient(MultiChannelSSHClient):
+    file_system = None
+
+    def open_sftp(self):
+        channel = FileSystemSFTPClient(self.file_system)
+        self.channels.append(channel)
+        return channel
+
+
+@pytest.fixture
+def file_system(monkeypatch):
+    from quipus.services import sftp_delivery as sftp_module
+
+    FileSystemSSHClient.file_system = {
+        "files": {},
+        "dirs": {"/"},
+        "stats": 0,
+        "lock": threading.Lock(),
+    }
+    monkeypatch.setattr("paramiko.SSHClient", FileSystemSSHClient)
+    monkeypatch.setattr(sftp_module, "SFTPClient", MockSFTPClient)
+    return FileSystemSSHClient.file_system
+
+
+def test_sftp_delivery_upload_many(file_system, tmp_path):
+    pairs = []
+    for i in range(20):
+        local_file = tmp_path / f"certificate_{i}.pdf"
+        local_file.write_bytes(f"Certificate {i}".encode())
+        pairs.append((str(local_file), f"/out/batch_{i % 2}/certificate_{i}.pdf"))
+
+    with SFTPDelivery(
+        host="sftp.example.com", username="user", password="password", pool_size=4
+    ) as sftp_delivery:
+        results = sftp_delivery.upload_many(pairs)
+        channels = sftp_delivery.connection.channels
+
+    assert results == [
+        SFTPUploadResult(local_file=local_file, remote_file=remote_file)
+        for local_file, remote_file in pairs
+    ]
+    assert all(result.uploaded for result in results)
+    assert len(channels) <= 4
+    assert file_system["dirs"] == {"/", "/out", "/out/batch_0", "/out/batch_1"}
+    assert file_system["files"]["/out/batch_1/certificate_7.pdf"] == b"Certificate 7"
+    assert file_system["stats"] < len(pairs)
+
+
+def test_sftp_delivery_upload_many_reports_failed_files(file_system, tmp_path):
+    local_file = tmp_path / "certificate.pdf"
+    local_file.write_bytes(b"Certificate")
+    pairs = [
+        (str(local_file), "/out/first.pdf"),
+        (str(tmp_path / "missing.pdf"), "/out/missing.pdf"),
+        (str(local_file), "/elsewhere/last.pdf"),
+    ]
+
+    with SFTPDelivery(
+        host="sftp.example.com", username="user", password="password", pool_size=2
+    ) as sftp_delivery:
+        results = sftp_delivery.upload_many(pairs, concurrency=2, create_dirs=False)
+
+    assert [result.uploaded for result in results] == [False, False, False]
+    assert "FileNotFoundError" in results[1].error
+
+    file_system["dirs"].add("/out")
+    with SFTPDelivery(
+        host="sftp.example.com", username="user", password="password"
+    ) as sftp_delivery:
+        results = sftp_delivery.upload_many(pairs, create_dirs=False)
+
+    assert [result.uploaded for result in results] == [True, False, False]
+    assert [result.remote_file for result in results] == [
+        remote_file for _, remote_file in pairs
+    ]
+
+
+def test_sftp_delivery_upload_many_invalid_arguments(multi_channel, sftp_delivery):
+    with pytest.raises(ValueError, match="SFTP connection not established"):
+        sftp_delivery.upload_many([])
+
+    sftp_delivery.connect()
+
+    with pytest.raises(TypeError):
+        sftp_delivery.upload_many(("local.txt", "/remote/local.txt"))
+    with pytest.raises(TypeError):
+        sftp_delivery.upload_many([], concurrency="4")
+    with pytest.raises(ValueError):
+        sftp_delivery.upload_many([], concurrency=0)
+
+
+# ============== Tests for upload verification ==============
+
+
+class CorruptedRemoteFile(MockRemoteFile):
+    def close(self):
+        if not self.closed:
+            data = self.getvalue()
+            self.client.files[self.remote_file] = bytes([data[0] ^ 1]) + data[1:]
+        BytesIO.close(self)
+
+
+class CorruptingSFTPClient(MockSFTPClient):
+    def open(self, remote_file, mode="r"):
+        if "w" in mode:
+            return CorruptedRemoteFile(self, remote_file)
+        return super().open(remote_file, mode)
+
+
+class TruncatedRemoteFile(MockRemoteFile):
+    def close(self):
+        if not self.closed:
+            self.client.files[self.remote_file] = self.getvalue()[:-1]
+        BytesIO.close(self)
+
+
+class TruncatingSFTPClient(MockSFTPClient):
+    def open(self, remote_file, mode="r"):
+        if "w" in mode:
+            return TruncatedRemoteFile(self, remote_file)
+        return super().open(remote_file, mode)
+
+
+class CheckFileRemoteFile(MockRemoteFile):
+    def check(self, hash_algorithm, offset=0, length=0, block_size=0):
+        self.client.checks.append((hash_algorithm, offset, length))
+        data = self.getvalue()[offset : offset + length if length else None]
+        return hashlib.new(hash_algorithm, data).digest()
+
+
+class CheckFileSFTPClient(MockSFTPClient):
+    def __init__(self):
+        super().__init__()
+        self.checks = []
+        self.corrupt = False
+
+    def open(self, remote_file, mode="r"):
+        if "r" in mode:
+            data = self.files[remote_file]
+            return CheckFileRemoteFile(self, remote_file, data)
+        if self.corrupt:
+            return CorruptedRemoteFile(self, remote_file)
+        return MockRemoteFile(self, remote_file)
+
+
+class MockChannelFile(BytesIO):
+    def __init__(self, data, exit_status):
+        super().__init__(data)
+        self.channel = type(
+            "MockChannel", (), {"recv_exit_status": lambda self: exit_status}
+        )()
+
+
+class ShellSSHClient(MockSSHClient):
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def exec_command(self, command, *args, **kwargs):
+        self.commands.append(command)
+        arguments = shlex.split(command)
+        if arguments[0] == "head":
+            _, _, length, _, path, _, program = arguments
+        else:
+            program, _, path = arguments
+            length = None
+
+        if path not in self.sftp_client.files:
+            return None, MockChannelFile(b"", 1), MockChannelFile(b"", 0)
+
+        algorithm = program.removesuffix("sum")
+        data = self.sftp_client.files[path]
+        if length is not None:
+            data = data[: int(length)]
+        checksum = hashlib.new(algorithm, data).hexdigest()
+        output = f"{checksum}  {path}\n".encode()
+        return None, MockChannelFile(output, 0), MockChannelFile(b"", 0)
+
+
+def connect_with(monkeypatch, ssh_client_class, sftp_client=None):
+    from quipus.services import sftp_delivery as sftp_module
+
+    class SSHClient(ssh_client_class):
+        def __init__(self):
+            super().__init__()
+            if sftp_client is not None:
+                self.sftp_client = sftp_client
+
+    monkeypatch.setattr("paramiko.SSHClient", SSHClient)
+    monkeypatch.setattr(sftp_module, "SFTPClient", MockSFTPClient)
+
+    sftp_delivery = SFTPDelivery(
+        host="sftp.example.com", username="user", password="password"
+    )
+    sftp_delivery.connect()
+    return sftp_delivery
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    local_file = tmp_path / "report.pdf"
+    local_file.write_bytes(bytes(range(256)) * 400)
+    return local_file
+
+
+def test_sftp_delivery_upload_verifies_with_check_file(monkeypatch, local_file):
+    sftp_client = CheckFileSFTPClient()
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient, sftp_client)
+
+    assert sftp_delivery.upload(str(local_file), "/remote/report.pdf", "sha256")
+    assert sftp_client.files["/remote/report.pdf"] == local_file.read_bytes()
+    assert sftp_client.checks == [("sha256", 0, 0)]
+    assert sftp_client.bytes_read == 0
+
+    sftp_client.corrupt = True
+    assert not sftp_delivery.upload(str(local_file), "/remote/report.pdf", "sha256")
+
+
+def test_sftp_delivery_upload_verifies_with_remote_command(monkeypatch, local_file):
+    sftp_delivery = connect_with(monkeypatch, ShellSSHClient)
+    remote_file = "/remote/quarterly report.pdf"
+
+    assert sftp_delivery.upload(str(local_file), remote_file, algorithm="sha256")
+    assert sftp_delivery.connection.commands == [
+        "sha256sum -- '/remote/quarterly report.pdf'"
+    ]
+    assert sftp_delivery.sftp_client.bytes_read == 0
+
+
+def test_sftp_delivery_upload_remote_command_detects_corruption(
+    monkeypatch, local_file
+):
+    sftp_delivery = connect_with(monkeypatch, ShellSSHClient, CorruptingSFTPClient())
+
+    assert not sftp_delivery.upload(str(local_file), "/remote/report.pdf")
+
+
+def test_sftp_delivery_upload_verifies_size(monkeypatch, local_file):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+
+    assert sftp_delivery.upload(str(local_file), "/remote/report.pdf")
+    assert sftp_delivery.sftp_client.mtimes == {}
+    assert sftp_delivery.sftp_client.bytes_read == 0
+
+
+def test_sftp_delivery_upload_size_detects_truncation(monkeypatch, local_file):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient, TruncatingSFTPClient())
+
+    assert not sftp_delivery.upload(str(local_file), "/remote/report.pdf")
+
+
+def test_sftp_delivery_upload_downloads_only_when_allowed(monkeypatch, local_file):
+    sftp_client = CorruptingSFTPClient()
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient, sftp_client)
+
+    assert sftp_delivery.upload(str(local_file), "/remote/report.pdf")
+    assert sftp_client.bytes_read == 0
+
+    assert not sftp_delivery.upload(
+        str(local_file), "/remote/report.pdf", allow_download=True
+    )
+    assert sftp_client.bytes_read > 0
+
+
+# ============== Tests for transfer settings ==============
+
+
+class TransportSSHClient(MockSSHClient):
+    def __init__(self):
+        super().__init__()
+        self.transport = paramiko.Transport.__new__(paramiko.Transport)
+        self.transport.default_window_size = paramiko.common.DEFAULT_WINDOW_SIZE
+        self.transport.default_max_packet_size = paramiko.common.DEFAULT_MAX_PACKET_SIZE
+
+    def get_transport(self):
+        return self.transport
+
+
+def test_sftp_transfer_config_defaults():
+    config = SFTPTransferConfig()
+
+    assert config.chunk_size == 32768
+    assert config.window_size is None
+    assert config.max_packet_size is None
+    assert config.pipelined is True
+    assert config.prefetch is True
+    assert config.max_concurrent_requests is None
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"chunk_size": 0}, ValueError),
+        ({"chunk_size": "1024"}, TypeError),
+        ({"window_size": 1024}, ValueError),
+        ({"window_size": 2**32}, ValueError),
+        ({"window_size": 1.5}, TypeError),
+        ({"max_packet_size": 1024}, ValueError),
+        ({"max_packet_size": "32768"}, TypeError),
+        ({"pipelined": 1}, TypeError),
+        ({"prefetch": None}, TypeError),
+        ({"max_concurrent_requests": 0}, ValueError),
+        ({"max_concurrent_requests": True}, TypeError),
+    ],
+)
+def test_sftp_transfer_config_invalid_values(kwargs, error):
+    with pytest.raises(error):
+        SFTPTransferConfig(**kwargs)
+
+
+def test_sftp_delivery_invalid_transfer_config():
+    with pytest.raises(TypeError):
+        SFTPDelivery(
+            host="sftp.example.com",
+            username="user",
+            password="password",
+            transfer_config={"chunk_size": 1024},
+        )
+
+
+def test_sftp_delivery_applies_window_and_packet_size(monkeypatch):
+    config = SFTPTransferConfig(window_size=2**27, max_packet_size=2**18)
+    sftp_delivery = connect_with(monkeypatch, TransportSSHClient)
+    sftp_delivery.transfer_config = config
+    sftp_delivery.connect()
+
+    transport = sftp_delivery.connection.get_transport()
+    assert transport.default_window_size == 2**27
+    assert transport.default_max_packet_size == 2**18
+
+
+def test_sftp_delivery_keeps_default_window_and_packet_size(monkeypatch):
+    sftp_delivery = connect_with(monkeypatch, TransportSSHClient)
+
+    transport = sftp_delivery.connection.get_transport()
+    assert transport.default_window_size == paramiko.common.DEFAULT_WINDOW_SIZE
+    assert transport.default_max_packet_size == paramiko.common.DEFAULT_MAX_PACKET_SIZE
+
+
+@pytest.mark.parametrize("pipelined", [True, False])
+def test_sftp_delivery_upload_file_uses_transfer_config(
+    monkeypatch, local_file, pipelined
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_delivery.transfer_config = SFTPTransferConfig(
+        chunk_size=10000, pipelined=pipelined
+    )
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf")
+
+    sftp_client = sftp_delivery.sftp_client
+    assert sftp_client.files["/remote/report.pdf"] == local_file.read_bytes()
+    assert sftp_client.write_sizes == [10000] * 10 + [2400]
+    assert sftp_client.pipelined is pipelined
+
+
+def test_sftp_delivery_upload_file_checks_remote_size(monkeypatch, local_file):
+    class TruncatingRemoteFile(MockRemoteFile):
+        def close(self):
+            if not self.closed:
+                self.client.files[self.remote_file] = self.getvalue()[:-1]
+            BytesIO.close(self)
+
+    class TruncatingSFTPClient(MockSFTPClient):
+        def open(self, remote_file, mode="r"):
+            return TruncatingRemoteFile(self, remote_file)
+
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient, TruncatingSFTPClient())
+
+    with pytest.raises(IOError, match="size mismatch"):
+        sftp_delivery.upload_file(str(local_file), "/remote/report.pdf")
+
+
+@pytest.mark.parametrize(
+    "prefetch, max_concurrent_requests, prefetches",
+    [(True, None, [None]), (True, 8, [8]), (False, 8, [])],
+)
+def test_sftp_delivery_download_file_uses_transfer_config(
+    monkeypatch, tmp_path, prefetch, max_concurrent_requests, prefetches
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_delivery.transfer_config = SFTPTransferConfig(
+        chunk_size=4096,
+        prefetch=prefetch,
+        max_concurrent_requests=max_concurrent_requests,
+    )
+    sftp_client = sftp_delivery.sftp_client
+    sftp_client.files["/remote/report.pdf"] = bytes(range(256)) * 100
+
+    local_file = tmp_path / "downloaded.pdf"
+    sftp_delivery.download_file("/remote/report.pdf", str(local_file))
+
+    assert local_file.read_bytes() == sftp_client.files["/remote/report.pdf"]
+    assert sftp_client.prefetches == prefetches
+    assert sftp_client.bytes_read == 4096 * 8
+
+
+# ============== Tests for resumable transfers ==============
+
+
+def test_sftp_delivery_upload_file_resume_without_checksum_restarts(
+    monkeypatch, local_file
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_client = sftp_delivery.sftp_client
+    content = local_file.read_bytes()
+    sftp_client.files["/remote/report.pdf"] = content[:45000]
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf", resume=True)
+
+    assert sftp_client.files["/remote/report.pdf"] == content
+    assert sum(sftp_client.write_sizes) == len(content)
+    assert sftp_client.bytes_read == 0
+
+
+def test_sftp_delivery_upload_file_resumes_partial_upload_read_back(
+    monkeypatch, local_file
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_delivery.transfer_config = SFTPTransferConfig(chunk_size=10000)
+    sftp_client = sftp_delivery.sftp_client
+    content = local_file.read_bytes()
+    sftp_client.files["/remote/report.pdf"] = content[:45000]
+
+    sftp_delivery.upload_file(
+        str(local_file), "/remote/report.pdf", resume=True, allow_download=True
+    )
+
+    assert sftp_client.files["/remote/report.pdf"] == content
+    assert sum(sftp_client.write_sizes) == len(content) - 45000
+    assert sftp_client.bytes_read == 45000
+
+
+@pytest.mark.parametrize("allow_download", [False, True])
+def test_sftp_delivery_upload_file_restarts_prefix_with_different_head(
+    monkeypatch, local_file, allow_download
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_delivery.transfer_config = SFTPTransferConfig(chunk_size=10000)
+    sftp_client = sftp_delivery.sftp_client
+    content = local_file.read_bytes()
+    # The last chunk of the partial upload matches, its first byte does not
+    sftp_client.files["/remote/report.pdf"] = b"X" + content[1:45000]
+
+    sftp_delivery.upload_file(
+        str(local_file),
+        "/remote/report.pdf",
+        resume=True,
+        allow_download=allow_download,
+    )
+
+    assert sftp_client.files["/remote/report.pdf"] == content
+    assert sum(sftp_client.write_sizes) == len(content)
+
+
+@pytest.mark.parametrize(
+    "partial",
+    [
+        b"Another file entirely",
+        bytes(range(256)) * 400 + b"trailing bytes",
+        b"",
+    ],
+)
+def test_sftp_delivery_upload_file_restarts_unusable_partial_upload(
+    monkeypatch, local_file, partial
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_client = sftp_delivery.sftp_client
+    sftp_client.files["/remote/report.pdf"] = partial
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf", resume=True)
+
+    assert sftp_client.files["/remote/report.pdf"] == local_file.read_bytes()
+    assert sum(sftp_client.write_sizes) == len(local_file.read_bytes())
+
+
+def test_sftp_delivery_upload_file_resume_without_remote_file(monkeypatch, local_file):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf", resume=True)
+
+    assert (
+        sftp_delivery.sftp_client.files["/remote/report.pdf"] == local_file.read_bytes()
+    )
+
+
+def test_sftp_delivery_upload_file_without_resume_overwrites(monkeypatch, local_file):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_client = sftp_delivery.sftp_client
+    sftp_client.files["/remote/report.pdf"] = local_file.read_bytes()[:45000]
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf")
+
+    assert sum(sftp_client.write_sizes) == len(local_file.read_bytes())
+    assert sftp_client.bytes_read == 0
+
+
+def test_sftp_delivery_resume_verifies_prefix_with_check_file(monkeypatch, local_file):
+    sftp_client = CheckFileSFTPClient()
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient, sftp_client)
+    content = local_file.read_bytes()
+    sftp_client.files["/remote/report.pdf"] = content[:45000]
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf", resume=True)
+
+    assert sftp_client.checks == [("md5", 0, 45000)]
+    assert sftp_client.files["/remote/report.pdf"] == content
+    assert sum(sftp_client.write_sizes) == len(content) - 45000
+    assert sftp_client.bytes_read == 0
+
+    # A prefix that differs anywhere, even in its first byte, is caught as well
+    sftp_client.files["/remote/report.pdf"] = b"X" + content[1:45000]
+    sftp_client.write_sizes = []
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf", resume=True)
+
+    assert sftp_client.files["/remote/report.pdf"] == content
+    assert sum(sftp_client.write_sizes) == len(content)
+
+
+def test_sftp_delivery_resume_verifies_prefix_with_remote_command(
+    monkeypatch, local_file
+):
+    sftp_delivery = connect_with(monkeypatch, ShellSSHClient)
+    sftp_client = sftp_delivery.sftp_client
+    content = local_file.read_bytes()
+    sftp_client.files["/remote/report.pdf"] = b"X" + content[1:45000]
+
+    sftp_delivery.upload_file(str(local_file), "/remote/report.pdf", resume=True)
+
+    assert sftp_delivery.connection.commands == [
+        "head -c 45000 -- /remote/report.pdf | md5sum"
+    ]
+    assert sftp_client.files["/remote/report.pdf"] == content
+    assert sum(sftp_client.write_sizes) == len(content)
+
+
+@pytest.mark.parametrize("allow_download", [False, True])
+def test_sftp_delivery_download_file_resumes_partial_download(
+    monkeypatch, tmp_path, allow_download
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_delivery.transfer_config = SFTPTransferConfig(chunk_size=10000)
+    sftp_client = sftp_delivery.sftp_client
+    content = bytes(range(256)) * 400
+    sftp_client.files["/remote/report.pdf"] = content
+
+    local_file = tmp_path / "report.pdf"
+    local_file.write_bytes(content[:95000])
+
+    sftp_delivery.download_file(
+        "/remote/report.pdf",
+        str(local_file),
+        resume=True,
+        allow_download=allow_download,
+    )
+
+    assert local_file.read_bytes() == content
+    if allow_download:
+        # The whole prefix, then the rest of the file up to its end
+        assert sftp_client.bytes_read == 95000 + 10000 + 10000
+    else:
+        # Without a checksum the whole file is downloaded again, up to its end
+        assert sftp_client.bytes_read == 12 * 10000
+
+
+@pytest.mark.parametrize("resume", [True, False])
+def test_sftp_delivery_download_file_restarts_unusable_partial_download(
+    monkeypatch, tmp_path, resume
+):
+    sftp_delivery = connect_with(monkeypatch, MockSSHClient)
+    sftp_client = sftp_delivery.sftp_client
+    content = bytes(range(256)) * 400
+    sftp_client.files["/remote/report.pdf"] = content
+
+    local_file = tmp_path / "report.pdf"
+    local_file.write_bytes(content[:1000] + b"stale")
+
+    sftp_delivery.download_file("/remote/report.pdf", str(local_file), resume=resume)
+
+    assert local_file.read_bytes() == content
@@ -1,12 +1,23 @@
 import pytest
 import smtplib
 import os
+import threading
+import time
+import email
 
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 
-from quipus import SMTPConfig, EmailMessageBuilder, EmailSender
+from quipus.utils import FileCache
+
+from quipus import (
+    SMTPConfig,
+    EmailMessageBuilder,
+    EmailSender,
+    LazyFileAttachment,
+    SendResult,
+)
 
 
 @pytest.fixture
@@ -660,3 +671,366 @@ def test_add_custom_header_invalid(email_builder):
 
     with pytest.raises(TypeError):
         email_builder.add_custom_header("X-Header", 456)
+
+
+# ============== Connection reuse ==============
+
+
+class RecordingSMTP:
+    instances = []
+
+    def __init__(self, server, port, timeout=None):
+        self.logins = 0
+        self.sent = []
+        self.quit_called = False
+        self.drop_next = False
+        RecordingSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        self.logins += 1
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        if self.drop_next:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(to_addrs)
+        return {}
+
+    def quit(self):
+        self.quit_called = True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def recording_smtp(monkeypatch, smtp_config):
+    RecordingSMTP.instances = []
+    smtp_config.use_tls = True
+    smtp_config.use_ssl = False
+    monkeypatch.setattr(smtplib, "SMTP", RecordingSMTP)
+    return RecordingSMTP
+
+
+def build_messages(count):
+    messages = []
+    for i in range(count):
+        message = MIMEMultipart()
+        message["From"] = "sender@example.com"
+        message["To"] = f"recipient{i}@example.com"
+        messages.append(message)
+    return messages
+
+
+def test_email_sender_context_reuses_connection(recording_smtp, smtp_config):
+    with EmailSender(smtp_config) as sender:
+        for message in build_messages(5):
+            assert sender.send(message) == {}
+
+    assert len(recording_smtp.instances) == 1
+    connection = recording_smtp.instances[0]
+    assert connection.logins == 1
+    assert len(connection.sent) == 5
+    assert connection.quit_called is True
+
+
+def test_email_sender_without_context_uses_one_connection_per_message(
+    recording_smtp, smtp_config
+):
+    sender = EmailSender(smtp_config)
+    for message in build_messages(3):
+        sender.send(message)
+
+    assert len(recording_smtp.instances) == 3
+    assert all(connection.quit_called for connection in recording_smtp.instances)
+
+
+def test_email_sender_rotates_connection(recording_smtp, smtp_config):
+    with EmailSender(smtp_config, max_messages_per_connection=2) as sender:
+        for message in build_messages(5):
+            sender.send(message)
+
+    assert [len(c.sent) for c in recording_smtp.instances] == [2, 2, 1]
+    assert all(connection.quit_called for connection in recording_smtp.instances)
+
+
+def test_email_sender_reconnects_when_dropped(recording_smtp, smtp_config):
+    messages = build_messages(3)
+
+    with EmailSender(smtp_config) as sender:
+        sender.send(messages[0])
+        recording_smtp.instances[0].drop_next = True
+        sender.send(messages[1])
+        sender.send(messages[2])
+
+    assert len(recording_smtp.instances) == 2
+    assert recording_smtp.instances[0].sent == [["recipient0@example.com"]]
+    assert recording_smtp.instances[1].sent == [
+        ["recipient1@example.com"],
+        ["recipient2@example.com"],
+    ]
+
+
+@pytest.mark.parametrize("value, error", [("10", TypeError), (0, ValueError)])
+def test_email_sender_max_messages_invalid(smtp_config, value, error):
+    with pytest.raises(error):
+        EmailSender(smtp_config, max_messages_per_connection=value)
+
+
+# ============== Bulk sending ==============
+
+
+class ThreadedSMTP(RecordingSMTP):
+    lock = threading.Lock()
+
+    def __init__(self, server, port, timeout=None):
+        with ThreadedSMTP.lock:
+            super().__init__(server, port, timeout)
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        if "invalid" in to_addrs[0]:
+            raise smtplib.SMTPRecipientsRefused({to_addrs[0]: (550, b"No such user")})
+        time.sleep(0.01)
+        return super().sendmail(from_addr, to_addrs, msg)
+
+
+@pytest.fixture
+def threaded_smtp(monkeypatch, smtp_config):
+    RecordingSMTP.instances = []
+    smtp_config.use_tls = True
+    smtp_config.use_ssl = False
+    monkeypatch.setattr(smtplib, "SMTP", ThreadedSMTP)
+    return ThreadedSMTP
+
+
+def test_send_many_spreads_messages_over_connections(threaded_smtp, smtp_config):
+    results = EmailSender(smtp_config).send_many(build_messages(12), concurrency=3)
+
+    assert [result.index for result in results] == list(range(12))
+    assert all(result.accepted for result in results)
+    assert len(threaded_smtp.instances) == 3
+    assert sum(len(c.sent) for c in threaded_smtp.instances) == 12
+    assert all(c.logins == 1 and c.quit_called for c in threaded_smtp.instances)
+
+
+def test_send_many_reports_refused_recipients(threaded_smtp, smtp_config):
+    messages = build_messages(4)
+    messages[1].replace_header("To", "invalid@example.com")
+
+    results = EmailSender(smtp_config).send_many(messages, concurrency=2)
+
+    assert [result.accepted for result in results] == [True, False, True, True]
+    assert results[1].refused == {"invalid@example.com": (550, b"No such user")}
+    assert "SMTPRecipientsRefused" in results[1].error
+    assert results[0] == SendResult(index=0)
+
+
+def test_send_many_reports_connection_errors(monkeypatch, smtp_config):
+    class FailingSMTP(RecordingSMTP):
+        def login(self, username, password):
+            raise smtplib.SMTPAuthenticationError(535, b"Authentication failed")
+
+    monkeypatch.setattr(smtplib, "SMTP", FailingSMTP)
+
+    results = EmailSender(smtp_config).send_many(build_messages(3))
+
+    assert len(results) == 3
+    assert all("SMTPAuthenticationError" in result.error for result in results)
+
+
+def test_send_many_global_rate_limit(threaded_smtp, smtp_config):
+    start = time.monotonic()
+    EmailSender(smtp_config).send_many(build_messages(5), concurrency=5, rate_limit=50)
+
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"concurrency": 0}, ValueError),
+        ({"concurrency": "2"}, TypeError),
+        ({"rate_per_connection": 0}, ValueError),
+        ({"rate_limit": "10"}, TypeError),
+    ],
+)
+def test_send_many_invalid_parameters(smtp_config, kwargs, error):
+    with pytest.raises(error):
+        EmailSender(smtp_config).send_many([], **kwargs)
+
+
+# ============== Lazy attachments ==============
+
+
+class StreamingSMTP(RecordingSMTP):
+    def ehlo_or_helo_if_needed(self):
+        pass
+
+    def mail(self, from_addr):
+        self.envelope = {"from": from_addr, "to": [], "chunks": []}
+        return 250, b"OK"
+
+    def rcpt(self, to_addr):
+        self.envelope["to"].append(to_addr)
+        return 250, b"OK"
+
+    def putcmd(self, cmd):
+        assert cmd == "data"
+
+    def getreply(self):
+        return (250, b"OK") if self.envelope["chunks"] else (354, b"Go ahead")
+
+    def send(self, data):
+        self.envelope["chunks"].append(data)
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        raise AssertionError("Messages with lazy attachments must be streamed")
+
+
+def parse_streamed(chunks):
+    data = b"".join(chunks)
+    assert data.endswith(b"\r\n.\r\n")
+    lines = data[: -len(b".\r\n")].split(b"\r\n")
+    lines = [line[1:] if line.startswith(b".") else line for line in lines]
+    return email.message_from_bytes(b"\n".join(lines))
+
+
+@pytest.fixture
+def attachment_file(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(os.urandom(LazyFileAttachment.CHUNK_SIZE * 2 + 1000))
+    return path
+
+
+def test_lazy_attachment_is_not_read_until_serialized(monkeypatch, attachment_file):
+    opened = []
+    original_open = open
+
+    def recording_open(path, *args, **kwargs):
+        opened.append(path)
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", recording_open)
+
+    message = (
+        EmailMessageBuilder("sender@example.com", ["recipient@example.com"])
+        .add_attachment_from_path(str(attachment_file), lazy=True)
+        .build()
+    )
+    assert opened == []
+
+    attachment = message.get_payload()[1]
+    assert isinstance(attachment, LazyFileAttachment)
+    assert attachment.get_payload(decode=True) == attachment_file.read_bytes()
+    assert opened == [str(attachment_file)]
+
+
+def test_lazy_attachment_streams_message(monkeypatch, smtp_config, attachment_file):
+    RecordingSMTP.instances = []
+    smtp_config.use_tls = True
+    monkeypatch.setattr(smtplib, "SMTP", StreamingSMTP)
+
+    message = (
+        EmailMessageBuilder("sender@example.com", ["recipient@example.com"])
+        .with_subject("Report")
+        .with_body("Hello\n.\nBye")
+        .add_attachment_from_path(str(attachment_file), lazy=True)
+        .build()
+    )
+
+    assert EmailSender(smtp_config).send(message) == {}
+
+    envelope = RecordingSMTP.instances[0].envelope
+    assert envelope["to"] == ["recipient@example.com"]
+    assert max(len(chunk) for chunk in envelope["chunks"]) < 100 * 1024
+
+    received = parse_streamed(envelope["chunks"])
+    body, attachment = received.get_payload()
+    assert received["Subject"] == "Report"
+    assert body.get_payload() == "Hello\n.\nBye"
+    assert attachment.get_filename() == "report.pdf"
+    assert attachment.get_payload(decode=True) == attachment_file.read_bytes()
+
+
+def test_lazy_attachment_missing_file():
+    with pytest.raises(FileNotFoundError):
+        LazyFileAttachment("missing/report.pdf")
+
+
+def test_add_attachment_from_path_invalid_lazy(email_builder, attachment_file):
+    with pytest.raises(TypeError):
+        email_builder.add_attachment_from_path(str(attachment_file), lazy="yes")
+
+
+# ============== Attachment cache ==============
+
+
+def build_with_cache(path, cache):
+    return (
+        EmailMessageBuilder("sender@example.com", ["recipient@example.com"])
+        .with_attachment_cache(cache)
+        .add_attachment_from_path(str(path))
+        .build()
+    )
+
+
+def test_attachment_cache_encodes_file_once(monkeypatch, attachment_file):
+    opened = []
+    original_open = open
+
+    def recording_open(path, *args, **kwargs):
+        opened.append(path)
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", recording_open)
+    cache = FileCache()
+
+    messages = [build_with_cache(attachment_file, cache) for _ in range(3)]
+
+    assert opened == [str(attachment_file)]
+    assert len(cache) == 1
+    payloads = [message.get_payload()[1].get_payload() for message in messages]
+    assert payloads[0] is payloads[1] is payloads[2]
+    for message in messages:
+        attachment = message.get_payload()[1]
+        assert attachment["Content-Transfer-Encoding"] == "base64"
+        assert attachment.get_payload(decode=True) == attachment_file.read_bytes()
+
+
+def test_attachment_cache_matches_uncached_encoding(attachment_file):
+    cached = build_with_cache(attachment_file, FileCache())
+    uncached = (
+        EmailMessageBuilder("sender@example.com", ["recipient@example.com"])
+        .add_attachment_from_path(str(attachment_file))
+        .build()
+    )
+
+    assert cached.get_payload()[1].as_string() == uncached.get_payload()[1].as_string()
+
+
+def test_attachment_cache_reloads_modified_file(attachment_file):
+    cache = FileCache()
+    build_with_cache(attachment_file, cache)
+
+    attachment_file.write_bytes(b"new content")
+    message = build_with_cache(attachment_file, cache)
+
+    assert message.get_payload()[1].get_payload(decode=True) == b"new content"
+
+
+def test_attachment_cache_evicts_over_limit(tmp_path):
+    cache = FileCache(max_size=3000)
+    for i in range(3):
+        path = tmp_path / f"file_{i}.bin"
+        path.write_bytes(os.urandom(1000))
+        build_with_cache(path, cache)
+
+    assert len(cache) == 2
+    assert cache.size <= 3000
+
+
+def test_attachment_cache_invalid(email_builder):
+    with pytest.raises(TypeError):
+        email_builder.with_attachment_cache({})
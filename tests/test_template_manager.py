@@ -0,0 +1,498 @@
+import boto3
+import pytest
+
+from quipus import AWSConfig, RenderResult, S3Delivery, Template, TemplateManager
+
+
+@pytest.fixture
+def sample_template(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+    return Template(html_path=str(html_file))
+
+
+@pytest.fixture
+def sample_data():
+    return [{"name": f"Person {i}"} for i in range(7)]
+
+
+def build_manager(template, data):
+    manager = (
+        TemplateManager()
+        .with_template(template)
+        .decide_filename_with(lambda item: item["name"].replace(" ", "_"))
+    )
+    manager.data = data
+    return manager
+
+
+def test_to_pdf_serial(tmp_path, sample_template, sample_data):
+    output = tmp_path / "serial"
+    results = []
+
+    build_manager(sample_template, sample_data).to_pdf(
+        str(output), create_dir=True, on_progress=results.append
+    )
+
+    assert sorted(p.name for p in output.iterdir()) == sorted(
+        f"Person_{i}.pdf" for i in range(7)
+    )
+    assert [result.index for result in results] == list(range(7))
+    assert all(result.error is None for result in results)
+
+
+def test_to_pdf_parallel_matches_serial(tmp_path, sample_template, sample_data):
+    serial_output = tmp_path / "serial"
+    parallel_output = tmp_path / "parallel"
+    results = []
+
+    manager = build_manager(sample_template, sample_data)
+    manager.to_pdf(str(serial_output), create_dir=True)
+    manager.to_pdf(
+        str(parallel_output),
+        create_dir=True,
+        workers=2,
+        chunk_size=2,
+        on_progress=results.append,
+    )
+
+    assert sorted(result.index for result in results) == list(range(7))
+    for serial_file in serial_output.iterdir():
+        parallel_file = parallel_output / serial_file.name
+        assert parallel_file.read_bytes() == serial_file.read_bytes()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_to_pdf_reports_failed_records(tmp_path, sample_template, workers):
+    data = [{"name": "Ana"}, {"surname": "Missing"}, {"name": "Luis"}]
+    results = []
+
+    manager = (
+        TemplateManager()
+        .with_template(sample_template)
+        .decide_filename_with(lambda item: item.get("name", "unknown"))
+    )
+    manager.data = data
+
+    with pytest.raises(RuntimeError, match="1 record\\(s\\) could not be rendered."):
+        manager.to_pdf(
+            str(tmp_path), workers=workers, chunk_size=1, on_progress=results.append
+        )
+
+    failed = [result for result in results if result.error is not None]
+    assert len(results) == 3
+    assert failed == [RenderResult(index=1, filename="unknown", error=failed[0].error)]
+    assert "KeyError" in failed[0].error
+    assert (tmp_path / "Ana.pdf").exists()
+    assert (tmp_path / "Luis.pdf").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_to_pdf_reports_records_with_unresolved_filename_or_template(tmp_path, workers):
+    templates = []
+    for name in ["a", "b"]:
+        html_file = tmp_path / f"{name}.html"
+        html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+        templates.append(Template(html_path=str(html_file)))
+
+    data = [{"name": f"n{i}", "template": "a.html"} for i in range(8)]
+    data[3]["template"] = "zzz.html"
+    del data[6]["name"]
+    data[7]["template"] = "b.html"
+    results = []
+
+    manager = (
+        TemplateManager()
+        .with_multiple_templates(templates)
+        .decide_template_with(lambda item: str(tmp_path / item["template"]))
+        .decide_filename_with(lambda item: item["name"])
+    )
+    manager.data = data
+    output = tmp_path / "output"
+
+    with pytest.raises(RuntimeError, match="2 record\\(s\\) could not be rendered."):
+        manager.to_pdf(
+            str(output),
+            create_dir=True,
+            workers=workers,
+            chunk_size=2,
+            on_progress=results.append,
+        )
+
+    results.sort(key=lambda result: result.index)
+    failed = [result for result in results if result.error is not None]
+    assert len(results) == 8
+    assert [(result.index, result.filename) for result in failed] == [
+        (3, "n3"),
+        (6, ""),
+    ]
+    assert "ValueError" in failed[0].error
+    assert "KeyError" in failed[1].error
+    assert sorted(path.stem for path in output.iterdir()) == [
+        "n0",
+        "n1",
+        "n2",
+        "n4",
+        "n5",
+        "n7",
+    ]
+
+
+def test_iter_render_results_reports_unresolved_filename(sample_template):
+    manager = (
+        TemplateManager()
+        .with_template(sample_template)
+        .decide_filename_with(lambda item: item["name"])
+    )
+    manager.data = [{"surname": "Missing"}, {"name": "Ana"}]
+
+    (failed, _, failed_pdf), (ok, _, ok_pdf) = list(manager.iter_render_results())
+
+    assert failed.index == 0 and failed.filename == ""
+    assert "KeyError" in failed.error and failed_pdf is None
+    assert ok == RenderResult(index=1, filename="Ana") and ok_pdf is not None
+
+
+def test_to_pdf_reports_failed_records_regardless_of_workers(tmp_path, sample_template):
+    data = [{"name": "Ana"}, {"surname": "Missing"}, {"name": "Luis"}, {}]
+    reports = {}
+
+    for workers in [1, 2]:
+        manager = (
+            TemplateManager()
+            .with_template(sample_template)
+            .decide_filename_with(lambda item: item.get("name", "unknown"))
+        )
+        manager.data = data
+        results = []
+
+        with pytest.raises(RuntimeError) as error:
+            manager.to_pdf(
+                str(tmp_path / str(workers)),
+                create_dir=True,
+                workers=workers,
+                chunk_size=1,
+                on_progress=results.append,
+            )
+
+        reports[workers] = (
+            sorted(results, key=lambda result: result.index),
+            error.value.args,
+        )
+
+    assert reports[1] == reports[2]
+    assert [result.error is None for result in reports[1][0]] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"workers": 0}, {"workers": "2"}, {"chunk_size": 0}],
+)
+def test_to_pdf_invalid_pool_parameters(tmp_path, sample_template, kwargs):
+    manager = build_manager(sample_template, [{"name": "Ana"}])
+
+    with pytest.raises(ValueError):
+        manager.to_pdf(str(tmp_path), **kwargs)
+
+
+def test_to_pdf_without_templates(tmp_path):
+    manager = TemplateManager().decide_filename_with(lambda item: "file")
+    manager.data = [{"name": "Ana"}]
+
+    with pytest.raises(ValueError, match="at least one template"):
+        manager.to_pdf(str(tmp_path))
+
+
+def test_to_pdf_compiles_stylesheet_once(monkeypatch, tmp_path):
+    from quipus.services import template_manager as template_manager_module
+
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+    css_file = tmp_path / "template.css"
+    css_file.write_text("h1 { color: red; }")
+    template = Template(html_path=str(html_file), css_path=str(css_file))
+
+    compiled = []
+    original_css = template_manager_module.CSS
+
+    def counting_css(*args, **kwargs):
+        compiled.append(kwargs.get("filename"))
+        return original_css(*args, **kwargs)
+
+    monkeypatch.setattr(template_manager_module, "CSS", counting_css)
+
+    output = tmp_path / "output"
+    build_manager(template, [{"name": f"Person {i}"} for i in range(5)]).to_pdf(
+        str(output), create_dir=True
+    )
+
+    assert compiled == [str(css_file)]
+    assert len(list(output.iterdir())) == 5
+
+
+def test_from_csv_stream(tmp_path, sample_template):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("name\n" + "\n".join(f"Person {i}" for i in range(5)))
+
+    manager = (
+        TemplateManager()
+        .from_csv(str(csv_file), stream=True, chunk_size=2)
+        .with_template(sample_template)
+        .decide_filename_with(lambda item: item["name"].replace(" ", "_"))
+    )
+
+    assert not isinstance(manager.data, list)
+
+    output = tmp_path / "output"
+    manager.to_pdf(str(output), create_dir=True)
+
+    assert sorted(p.name for p in output.iterdir()) == sorted(
+        f"Person_{i}.pdf" for i in range(5)
+    )
+
+
+def test_to_pdf_consumes_streamed_data_lazily(tmp_path, sample_template):
+    consumed = []
+
+    def records():
+        for i in range(4):
+            consumed.append(i)
+            yield {"name": f"Person {i}"}
+
+    rendered = []
+    manager = build_manager(sample_template, [])
+    manager.data = records()
+    manager.to_pdf(
+        str(tmp_path),
+        on_progress=lambda result: rendered.append((result.index, list(consumed))),
+    )
+
+    assert rendered == [
+        (0, [0]),
+        (1, [0, 1]),
+        (2, [0, 1, 2]),
+        (3, [0, 1, 2, 3]),
+    ]
+
+
+def test_streamed_data_invalid_keys(tmp_path, sample_template):
+    manager = build_manager(sample_template, [])
+    manager.data = iter([{"name": "Ana"}, {1: "invalid"}])
+
+    with pytest.raises(TypeError, match="All keys in the dictionary must be a string."):
+        manager.to_pdf(str(tmp_path))
+
+
+def test_from_csv_stream_invalid_chunk_size(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("name\nAna")
+
+    with pytest.raises(ValueError):
+        TemplateManager().from_csv(str(csv_file), stream=True, chunk_size=0)
+
+
+def test_from_csv_stream_selected_columns(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("name,email,notes\nAna,ana@example.com,long text")
+
+    manager = TemplateManager().from_csv(
+        str(csv_file), stream=True, columns=["name", "email"]
+    )
+
+    assert list(manager.data) == [{"name": "Ana", "email": "ana@example.com"}]
+
+
+def test_render_pdf_bytes_matches_to_pdf(tmp_path, sample_template):
+    manager = build_manager(sample_template, [{"name": "Ana"}])
+    manager.to_pdf(str(tmp_path))
+
+    assert (
+        manager.render_pdf_bytes({"name": "Ana"}) == (tmp_path / "Ana.pdf").read_bytes()
+    )
+
+
+def test_iter_pdfs_does_not_touch_filesystem(tmp_path, sample_template, sample_data):
+    manager = build_manager(sample_template, sample_data)
+    output = tmp_path / "output"
+    manager.to_pdf(str(output), create_dir=True)
+    written = {p.stem: p.read_bytes() for p in output.iterdir()}
+    before = sorted(tmp_path.rglob("*"))
+
+    pdfs = dict(manager.iter_pdfs())
+
+    assert pdfs == written
+    assert sorted(tmp_path.rglob("*")) == before
+
+
+def test_iter_render_results_reports_failed_records(sample_template):
+    data = [{"name": "Ana"}, {"surname": "Missing"}]
+    manager = (
+        TemplateManager()
+        .with_template(sample_template)
+        .decide_filename_with(lambda item: item.get("name", "unknown"))
+    )
+    manager.data = data
+
+    (ok, ok_item, ok_pdf), (failed, failed_item, failed_pdf) = list(
+        manager.iter_render_results()
+    )
+
+    assert ok == RenderResult(index=0, filename="Ana")
+    assert ok_item == data[0]
+    assert ok_pdf == manager.render_pdf_bytes(data[0])
+    assert failed.index == 1 and "KeyError" in failed.error
+    assert failed_item == data[1]
+    assert failed_pdf is None
+
+
+def test_iter_render_results_requires_filename_function(sample_template):
+    manager = TemplateManager().with_template(sample_template)
+    manager.data = [{"name": "Ana"}]
+
+    with pytest.raises(ValueError, match="decide_filename_with"):
+        manager.iter_render_results()
+
+
+def test_render_pdf_bytes_compiles_stylesheet_once(monkeypatch, tmp_path):
+    from quipus.services import template_manager as template_manager_module
+
+    html_file = tmp_path / "template.html"
+    html_file.write_text("<html><body><h1>{name}</h1></body></html>")
+    css_file = tmp_path / "template.css"
+    css_file.write_text("h1 { color: red; }")
+
+    compiled = []
+    original_css = template_manager_module.CSS
+
+    def counting_css(*args, **kwargs):
+        compiled.append(kwargs.get("filename"))
+        return original_css(*args, **kwargs)
+
+    monkeypatch.setattr(template_manager_module, "CSS", counting_css)
+
+    manager = TemplateManager().with_template(
+        Template(html_path=str(html_file), css_path=str(css_file))
+    )
+    for i in range(3):
+        manager.render_pdf_bytes({"name": f"Person {i}"})
+    assert compiled == [str(css_file)]
+
+    manager.with_template(Template(html_path=str(html_file), css_path=str(css_file)))
+    manager.decide_template_with(lambda item: str(html_file))
+    manager.render_pdf_bytes({"name": "Person 3"})
+    assert compiled == [str(css_file)] * 2
+
+
+def test_batches_build_their_own_renderer(
+    monkeypatch, tmp_path, sample_template, sample_data
+):
+    from quipus.services import template_manager as template_manager_module
+
+    renderers = []
+    original_renderer = template_manager_module._PDFRenderer
+
+    def counting_renderer(*args, **kwargs):
+        renderers.append(original_renderer(*args, **kwargs))
+        return renderers[-1]
+
+    monkeypatch.setattr(template_manager_module, "_PDFRenderer", counting_renderer)
+
+    manager = build_manager(sample_template, sample_data)
+    manager.to_pdf(str(tmp_path))
+    manager.to_pdf(str(tmp_path))
+    list(manager.iter_pdfs())
+    assert len(renderers) == 3
+
+    manager.render_pdf_bytes(sample_data[0])
+    manager.render_pdf_bytes(sample_data[1])
+    assert len(renderers) == 4
+
+
+def test_render_pdf_bytes_invalid_item(sample_template):
+    manager = TemplateManager().with_template(sample_template)
+
+    with pytest.raises(TypeError):
+        manager.render_pdf_bytes([("name", "Ana")])
+
+
+def test_render_pdf_bytes_without_templates():
+    with pytest.raises(ValueError, match="at least one template"):
+        TemplateManager().render_pdf_bytes({"name": "Ana"})
+
+
+def test_to_s3_uploads_from_memory(monkeypatch, tmp_path, sample_template):
+    uploads = {}
+
+    class MockS3Client:
+        def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None):
+            uploads[Key] = (Bucket, Fileobj.read(), ExtraArgs)
+
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: MockS3Client())
+    s3_delivery = S3Delivery(AWSConfig("access", "secret", "us-east-1"))
+    manager = build_manager(sample_template, [{"name": "Ana"}, {"name": "Luis"}])
+    keys = []
+
+    manager.to_s3(
+        s3_delivery, "my-bucket", prefix="certificates/", on_progress=keys.append
+    )
+
+    assert keys == ["certificates/Ana.pdf", "certificates/Luis.pdf"]
+    bucket, body, extra_args = uploads["certificates/Ana.pdf"]
+    assert bucket == "my-bucket"
+    assert body == manager.render_pdf_bytes({"name": "Ana"})
+    assert extra_args == {"ContentType": "application/pdf"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["template.html"]
+
+
+def test_to_s3_invalid_parameters(sample_template):
+    manager = build_manager(sample_template, [{"name": "Ana"}])
+    s3_delivery = S3Delivery(AWSConfig("access", "secret", "us-east-1"))
+
+    with pytest.raises(TypeError):
+        manager.to_s3("s3", "my-bucket")
+    with pytest.raises(ValueError):
+        manager.to_s3(s3_delivery, " ")
+    with pytest.raises(TypeError):
+        manager.to_s3(s3_delivery, "my-bucket", prefix=None)
+
+
+def test_renderer_bounds_image_cache(monkeypatch, sample_template):
+    from quipus.services import template_manager as template_manager_module
+
+    caches = []
+
+    class CachingHTML:
+        def __init__(self, string=None, **kwargs):
+            self.string = string
+
+        def write_pdf(self, target=None, cache=None, **kwargs):
+            # Every record brings an image of its own, like a QR code
+            cache[f"data:image/png;{self.string}"] = object()
+            cache[f"{self.string}-data"] = b"x" * 100
+            caches.append(dict(cache))
+            return b"%PDF"
+
+    monkeypatch.setattr(template_manager_module, "HTML", CachingHTML)
+
+    renderer = template_manager_module._PDFRenderer(
+        [sample_template], max_cached_images=6
+    )
+    for i in range(10):
+        renderer.render(0, {"name": f"Person {i}"}, target=None)
+
+    assert max(len(cache) for cache in caches) <= 8
+    assert [len(cache) for cache in caches[:4]] == [2, 4, 6, 8]
+
+    renderer = template_manager_module._PDFRenderer(
+        [sample_template], max_cached_image_bytes=250
+    )
+    caches.clear()
+    for i in range(10):
+        renderer.render(0, {"name": f"Person {i}"}, target=None)
+
+    assert max(len(cache) for cache in caches) <= 6
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 from quipus import Template
 
@@ -140,3 +142,103 @@ def test_template_str(sample_html_file, sample_css_file, sample_assets_dir):
         }
     )
     assert str(template) == expected_str
+
+
+def test_template_render_html_reads_file_once(monkeypatch, sample_html_file):
+    template = Template(html_path=str(sample_html_file))
+    opened = []
+    original_open = open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return original_open(*args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+
+    for name in ["Ana", "Luis", "Marta"]:
+        assert template.render_html_with_values({"name": name}) == (
+            f"<html><body>{name}</body></html>"
+        )
+
+    assert opened == [str(sample_html_file)]
+
+
+def test_template_render_html_picks_up_changes(sample_html_file):
+    template = Template(html_path=str(sample_html_file))
+    assert template.render_html_with_values({"name": "Juan"}) == (
+        "<html><body>Juan</body></html>"
+    )
+
+    stat = os.stat(sample_html_file)
+    sample_html_file.write_text("<html><body><p>{name}</p></body></html>")
+    os.utime(sample_html_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert template.render_html_with_values({"name": "Juan"}) == (
+        "<html><body><p>Juan</p></body></html>"
+    )
+
+
+def test_template_placeholders(tmp_path):
+    html_file = tmp_path / "template.html"
+    html_file.write_text(
+        "<p>{name} {surname}</p><p>{course[title]}</p><p>{name}</p><p>{{literal}}</p>"
+    )
+    template = Template(html_path=str(html_file))
+
+    assert template.placeholders == ["name", "surname", "course"]
+
+
+def test_template_url_fetcher_serves_assets_from_cache(
+    monkeypatch, sample_html_file, sample_assets_dir
+):
+    logo = sample_assets_dir / "logo.png"
+    logo.write_bytes(b"\x89PNG fake image")
+    template = Template(
+        html_path=str(sample_html_file), assets_path=str(sample_assets_dir)
+    )
+
+    opened = []
+    original_open = open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return original_open(*args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+
+    for _ in range(3):
+        resource = template.url_fetcher(logo.as_uri())
+        assert resource["string"] == b"\x89PNG fake image"
+        assert resource["mime_type"] == "image/png"
+
+    assert [path for path in opened if path.startswith(str(sample_assets_dir))] == [
+        os.path.realpath(logo)
+    ]
+    assert len(template.assets_cache) == 1
+
+
+def test_template_url_fetcher_delegates_other_urls(
+    monkeypatch, tmp_path, sample_html_file, sample_assets_dir
+):
+    from quipus.models import template as template_module
+
+    outside = tmp_path / "outside.png"
+    outside.write_bytes(b"outside")
+    fetched = []
+
+    def mock_default_url_fetcher(url, timeout=10, ssl_context=None):
+        fetched.append(url)
+        return {"string": b"", "mime_type": "image/png"}
+
+    monkeypatch.setattr(
+        template_module, "default_url_fetcher", mock_default_url_fetcher
+    )
+
+    template = Template(
+        html_path=str(sample_html_file), assets_path=str(sample_assets_dir)
+    )
+    template.url_fetcher(outside.as_uri())
+    template.url_fetcher("https://example.com/logo.png")
+
+    assert fetched == [outside.as_uri(), "https://example.com/logo.png"]
+    assert len(template.assets_cache) == 0